@@ -0,0 +1,136 @@
+"""Compare conversion in-process and on processes, threads and subinterpreters.
+
+Builds a synthetic site of many small pages and a few large ones, then
+times build_llms_output sequentially and with each executor, including
+pool start-up. Run it on a regular and a free-threaded interpreter to
+compare, e.g.:
+
+    uv run --python 3.14 benchmarks/executors.py
+    uv run --python 3.14t benchmarks/executors.py --jobs 8
+
+Thread workers only convert in parallel when the GIL is disabled; with the
+GIL they mostly measure the cost of contention. Subinterpreter workers are
+included on Python 3.14+.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import platform
+import tempfile
+import time
+from pathlib import Path
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import BuildResult, build_llms_output
+from llmstxt_standalone.parallel import (
+    Executor,
+    WorkerPool,
+    free_threaded,
+    interpreters_supported,
+)
+
+
+def _page_html(number: int, paragraphs: int) -> str:
+    body = "".join(
+        f"<h2>Part {i}</h2><p>Page {number} explains <strong>step {i}</strong> "
+        f'with <a href="/p{i}/">a link</a> and <code>inline code</code>.</p>'
+        f"<ul><li>First</li><li>Second</li></ul>"
+        f'<pre><code class="language-python">print({i})</code></pre>'
+        for i in range(paragraphs)
+    )
+    return (
+        f"<html><head><title>Page {number}</title></head><body>"
+        f"<article><h1>Page {number}</h1>{body}</article></body></html>"
+    )
+
+
+def _make_site(root: Path, pages: int, large_every: int) -> Path:
+    site_dir = root / "site"
+    listing = []
+    for number in range(pages):
+        paragraphs = 200 if large_every and number % large_every == 0 else 5
+        page_dir = site_dir / f"p{number}"
+        page_dir.mkdir(parents=True)
+        (page_dir / "index.html").write_text(
+            _page_html(number, paragraphs), encoding="utf-8"
+        )
+        listing.append(f"          - p{number}.md\n")
+    config_path = root / "mkdocs.yml"
+    config_path.write_text(
+        "site_name: Benchmark\n"
+        "site_url: https://example.com/\n"
+        "plugins:\n"
+        "  - llmstxt:\n"
+        "      sections:\n"
+        "        Pages:\n" + "".join(listing),
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def _time_build(
+    config_path: Path, site_dir: Path, jobs: int, executor: Executor | None
+) -> tuple[float, BuildResult]:
+    config = load_config(config_path)
+    start = time.perf_counter()
+    if executor is None:
+        result = build_llms_output(config, site_dir)
+    else:
+        with WorkerPool(jobs, executor=executor) as pool:
+            result = build_llms_output(config, site_dir, pool=pool)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Run the benchmark and print a table of build times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400, help="Pages to build")
+    parser.add_argument(
+        "--large-every",
+        type=int,
+        default=50,
+        help="Make every Nth page large (0 for none)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1, help="Workers per pool"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode")
+    args = parser.parse_args()
+
+    print(
+        f"Python {platform.python_version()} ({platform.python_implementation()}), "
+        f"GIL {'disabled' if free_threaded() else 'enabled'}, "
+        f"{args.pages} pages, {args.jobs} workers"
+    )
+    modes: list[tuple[str, Executor | None]] = [
+        ("sequential", None),
+        ("processes", Executor.process),
+        ("threads", Executor.thread),
+    ]
+    if interpreters_supported():
+        modes.append(("interpreters", Executor.interpreter))
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = _make_site(Path(tmp), args.pages, args.large_every)
+        site_dir = Path(tmp) / "site"
+        baseline: float | None = None
+        expected: BuildResult | None = None
+        for label, executor in modes:
+            runs = []
+            for _ in range(args.repeat):
+                elapsed, result = _time_build(
+                    config_path, site_dir, args.jobs, executor
+                )
+                if expected is None:
+                    expected = result
+                elif result != expected:
+                    raise SystemExit(f"{label} output differs from sequential")
+                runs.append(elapsed)
+            best = min(runs)
+            baseline = baseline or best
+            print(f"{label:<12} {best:8.3f}s  {baseline / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
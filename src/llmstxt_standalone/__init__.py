@@ -1,5 +1,13 @@
 """llmstxt-standalone: Generate llms.txt from built HTML documentation."""
 
-from importlib.metadata import version
+from __future__ import annotations
 
-__version__ = version("llmstxt-standalone")
+
+def __getattr__(name: str) -> str:
+    # Resolved lazily: importlib.metadata is slow to import and only
+    # `--version` needs it.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version("llmstxt-standalone")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
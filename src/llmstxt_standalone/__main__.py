@@ -1,6 +1,6 @@
 """Allow running as python -m llmstxt_standalone."""
 
-from llmstxt_standalone.cli import app
+from llmstxt_standalone.client import main
 
 if __name__ == "__main__":
-    app()
+    main()
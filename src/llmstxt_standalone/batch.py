@@ -0,0 +1,79 @@
+"""Multi-project batch definitions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+__all__ = ["Project", "load_projects"]
+
+
+@dataclass
+class Project:
+    """One MkDocs project in a batch build."""
+
+    config: Path
+    site_dir: Path
+    output_dir: Path
+
+
+def _project_from_entry(entry: Any, base_dir: Path, index: int) -> Project:
+    if isinstance(entry, str):
+        entry = {"config": entry}
+    if not isinstance(entry, dict) or not isinstance(entry.get("config"), str):
+        raise ValueError(f"projects[{index}] must have a 'config' path")
+    for key in ("site_dir", "output_dir"):
+        if entry.get(key) is not None and not isinstance(entry[key], str):
+            raise ValueError(f"projects[{index}].{key} must be a path string")
+
+    config = base_dir / entry["config"]
+    site_dir = (
+        base_dir / entry["site_dir"]
+        if entry.get("site_dir")
+        else config.parent / "site"
+    )
+    output_dir = base_dir / entry["output_dir"] if entry.get("output_dir") else site_dir
+    return Project(config=config, site_dir=site_dir, output_dir=output_dir)
+
+
+def load_projects(path: Path) -> list[Project]:
+    """Load project definitions from a batch file.
+
+    The file lists projects under a top-level ``projects`` key (or as a bare
+    list). Each entry is a config path or a mapping with ``config`` and
+    optional ``site_dir`` and ``output_dir``. Relative paths resolve against
+    the batch file's directory; ``site_dir`` defaults to ``site`` next to the
+    config and ``output_dir`` defaults to ``site_dir``::
+
+        projects:
+          - docs/api/mkdocs.yml
+          - config: docs/guide/mkdocs.yml
+            site_dir: build/guide
+            output_dir: dist/guide
+
+    Args:
+        path: Path to the batch YAML file.
+
+    Returns:
+        Projects in file order.
+
+    Raises:
+        FileNotFoundError: If the batch file doesn't exist.
+        ValueError: If the batch file is malformed.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = yaml.safe_load(f)
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Invalid batch file {path}: {exc}") from None
+
+    entries = raw.get("projects") if isinstance(raw, dict) else raw
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Batch file must list at least one project: {path}")
+    return [
+        _project_from_entry(entry, path.parent, index)
+        for index, entry in enumerate(entries)
+    ]
@@ -0,0 +1,46 @@
+"""Block structure of converted markdown."""
+
+from __future__ import annotations
+
+import re
+
+__all__ = ["fence_toggle", "split_blocks"]
+
+_FENCE_RE = re.compile(r"^[ \t]{0,3}(`{3,}|~{3,})")
+
+
+def fence_toggle(line: str, fence: str | None) -> str | None:
+    """Track fenced code blocks: return the open fence after this line.
+
+    Args:
+        line: Next markdown line.
+        fence: Fence open before this line, or None outside code blocks.
+
+    Returns:
+        The fence still open after this line, or None.
+    """
+    match = _FENCE_RE.match(line)
+    if fence is None:
+        return match.group(1) if match else None
+    stripped = line.strip()
+    if stripped.startswith(fence) and not stripped.strip(fence[0]):
+        return None
+    return fence
+
+
+def split_blocks(text: str) -> list[str]:
+    """Split text into blank-line separated blocks, keeping code fences whole."""
+    blocks: list[str] = []
+    current: list[str] = []
+    fence: str | None = None
+    for line in text.splitlines():
+        if fence is None and not line.strip():
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        fence = fence_toggle(line, fence)
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
@@ -0,0 +1,197 @@
+"""Build checkpoints, so an interrupted build can resume where it stopped."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import IO, Any
+
+from llmstxt_standalone.config import Config
+from llmstxt_standalone.generate import PageResult
+from llmstxt_standalone.spill import SpillHandle, read_spilled
+
+__all__ = ["CHECKPOINT_FORMAT", "Checkpoint"]
+
+# Bump when the journal or data file layout changes
+CHECKPOINT_FORMAT = 1
+
+_JOURNAL = "journal.jsonl"
+_DATA = "pages.bin"
+
+# Seconds between fsyncs; pages finished since the last one may be lost if
+# the machine (not just the process) goes down
+_SYNC_INTERVAL_S = 10.0
+
+
+class Checkpoint:
+    """Journal of a build's finished pages, kept in a directory.
+
+    Each page's markdown is appended to a data file, then a journal line
+    records the page's result, the hash of its HTML and where its markdown
+    is. Both files are flushed after every page, so a killed process loses
+    at most the page in progress, and synced to disk every few seconds.
+
+    A resumed build reads the journal back and reuses a page's result when
+    its HTML still hashes the same, converting only the rest. The journal is
+    only trusted if it was written for the same config (by fingerprint) and
+    site directory; otherwise, or without resume, the build starts over.
+    Checkpoints cover single-project builds: pages are keyed by md_path.
+    """
+
+    def __init__(
+        self, directory: Path, config: Config, site_dir: Path, resume: bool = False
+    ) -> None:
+        """Open the checkpoint in directory, loading it if resuming.
+
+        Args:
+            directory: Checkpoint directory, created if missing.
+            config: Resolved configuration of the build.
+            site_dir: Built site directory of the build.
+            resume: Reuse pages journaled by an earlier run of this build.
+
+        Raises:
+            OSError: If the checkpoint files can't be created.
+        """
+        self.directory = directory
+        self._header = {
+            "format": CHECKPOINT_FORMAT,
+            "config_fingerprint": config.fingerprint(),
+            "site_dir": str(site_dir.resolve()),
+        }
+        # Journaled pages by md_path: HTML digest, result and markdown location
+        self._pages: dict[str, tuple[bytes, dict[str, Any], SpillHandle]] = {}
+        # Whether an earlier checkpoint was found but didn't match this build
+        self.stale = False
+        self.restored = 0
+        directory.mkdir(parents=True, exist_ok=True)
+        journal_path = directory / _JOURNAL
+        valid_bytes = self._load(journal_path) if resume else 0
+        if not valid_bytes:
+            self._pages.clear()
+            with open(journal_path, "wb") as journal:
+                journal.write(_json_line(self._header))
+            with open(directory / _DATA, "wb"):
+                pass
+        else:
+            # Drop a line torn by the interruption before appending after it
+            os.truncate(journal_path, valid_bytes)
+        self._journal: IO[bytes] = open(journal_path, "ab")  # noqa: SIM115
+        self._data: IO[bytes] = open(directory / _DATA, "ab")  # noqa: SIM115
+        self._synced_at = time.monotonic()
+
+    def _load(self, journal_path: Path) -> int:
+        """Read an earlier journal; return its valid length, 0 if unusable."""
+        try:
+            lines = journal_path.read_bytes().splitlines(keepends=True)
+        except OSError:
+            return 0
+        if not lines:
+            return 0
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = None
+        if header != self._header:
+            self.stale = True
+            return 0
+        valid_bytes = len(lines[0])
+        data_path = str(self.directory / _DATA)
+        for line in lines[1:]:
+            if not line.endswith(b"\n"):
+                # Torn by the interruption
+                break
+            try:
+                record = json.loads(line)
+                content = record["content"]
+                self._pages[record["page"]["md_path"]] = (
+                    bytes.fromhex(record["digest"]),
+                    record["page"],
+                    SpillHandle(
+                        data_path,
+                        content["offset"],
+                        content["length"],
+                        bytes.fromhex(content["digest"]),
+                    ),
+                )
+            except (KeyError, TypeError, ValueError):
+                break
+            valid_bytes += len(line)
+        return valid_bytes
+
+    def restore(self, md_path: str, digest: bytes) -> PageResult | None:
+        """Journaled result of md_path, if its HTML still has this digest."""
+        entry = self._pages.get(md_path)
+        if entry is None or entry[0] != digest:
+            return None
+        _, page, handle = entry
+        try:
+            content = read_spilled(handle)
+        except (OSError, ValueError):
+            return None
+        self.restored += 1
+        return PageResult.from_json({**page, "content": content})
+
+    def record(self, digest: bytes, result: PageResult) -> None:
+        """Journal a finished page whose HTML has this digest.
+
+        Raises:
+            OSError: If the checkpoint files can't be written.
+        """
+        data = result.text.encode("utf-8")
+        offset = self._data.tell()
+        self._data.write(data)
+        self._data.flush()
+        page = replace(result, content="").to_json()
+        del page["content"]
+        record = {
+            "digest": digest.hex(),
+            "page": page,
+            "content": {
+                "offset": offset,
+                "length": len(data),
+                "digest": hashlib.blake2b(data, digest_size=16).hexdigest(),
+            },
+        }
+        self._journal.write(_json_line(record))
+        self._journal.flush()
+        if time.monotonic() - self._synced_at >= _SYNC_INTERVAL_S:
+            self._sync()
+
+    def _sync(self) -> None:
+        # Data first, so a synced journal line never points past synced data
+        os.fsync(self._data.fileno())
+        os.fsync(self._journal.fileno())
+        self._synced_at = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the checkpoint files, keeping them for a resume."""
+        if not self._journal.closed:
+            self._sync()
+            self._data.close()
+            self._journal.close()
+
+    def remove(self) -> None:
+        """Close and delete the checkpoint, once the build has succeeded."""
+        self.close()
+        for name in (_JOURNAL, _DATA):
+            (self.directory / name).unlink(missing_ok=True)
+        # Only remove the directory if nothing else lives there
+        with contextlib.suppress(OSError):
+            self.directory.rmdir()
+
+    def __enter__(self) -> Checkpoint:
+        """Return the checkpoint for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the checkpoint, keeping it for a resume."""
+        self.close()
+
+
+def _json_line(data: dict[str, Any]) -> bytes:
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
@@ -0,0 +1,265 @@
+"""Heading-aware chunking of page markdown for retrieval systems."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from llmstxt_standalone.blocks import fence_toggle, split_blocks
+from llmstxt_standalone.config import Config
+from llmstxt_standalone.export import JsonlPageWriter
+from llmstxt_standalone.generate import (
+    PageResult,
+    md_path_to_html_url,
+    md_path_to_page_url,
+)
+from llmstxt_standalone.tokens import DEFAULT_TOKENIZER, SizeUnit, get_tokenizer
+
+__all__ = [
+    "CHUNKS_FILENAME",
+    "Chunk",
+    "ChunkWriter",
+    "chunk_markdown",
+    "chunk_page",
+    "slugify",
+]
+
+# Default chunk export filename, next to llms.txt
+CHUNKS_FILENAME = "llms-chunks.jsonl"
+
+_HEADING_RE = re.compile(r"^(#{2,3})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+
+
+@dataclass
+class Chunk:
+    """One retrievable piece of a page."""
+
+    id: str
+    md_path: str
+    url: str
+    markdown_url: str
+    title: str
+    section: str
+    headings: list[str]
+    index: int
+    text: str
+    tokens: int
+
+    def to_json(self) -> dict[str, Any]:
+        """Record for the chunk JSONL file."""
+        return {
+            "id": self.id,
+            "md_path": self.md_path,
+            "url": self.url,
+            "markdown_url": self.markdown_url,
+            "title": self.title,
+            "section": self.section,
+            "headings": self.headings,
+            "index": self.index,
+            "text": self.text,
+            "chars": len(self.text),
+            "tokens": self.tokens,
+        }
+
+
+def slugify(text: str) -> str:
+    """Heading anchor as generated by MkDocs' default toc slugify."""
+    # Drop inline markdown (links, emphasis, code) before slugifying
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    text = re.sub(r"[*_`]", "", text)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    text = re.sub(r"[^\w\s-]", "", text).strip().lower()
+    return re.sub(r"[-\s]+", "-", text)
+
+
+def _split_sections(markdown: str) -> list[tuple[list[str], str | None, str]]:
+    """Split markdown at H2/H3 headings outside code blocks.
+
+    Returns:
+        (heading breadcrumb, anchor, text) per section; the text before the
+        first heading has an empty breadcrumb and no anchor.
+    """
+    sections: list[tuple[list[str], str | None, list[str]]] = [([], None, [])]
+    h2: str | None = None
+    seen_slugs: dict[str, int] = {}
+    fence: str | None = None
+    for line in markdown.splitlines():
+        heading = _HEADING_RE.match(line) if fence is None else None
+        fence = fence_toggle(line, fence)
+        if heading is None:
+            sections[-1][2].append(line)
+            continue
+        text = heading.group(2)
+        if len(heading.group(1)) == 2:
+            h2 = text
+            breadcrumb = [text]
+        else:
+            breadcrumb = [h2, text] if h2 is not None else [text]
+        # MkDocs de-duplicates repeated anchors as slug_1, slug_2, ...
+        slug = slugify(text)
+        count = seen_slugs.get(slug, 0)
+        seen_slugs[slug] = count + 1
+        anchor = f"{slug}_{count}" if count else slug
+        sections.append((breadcrumb, anchor, [line]))
+    return [
+        (breadcrumb, anchor, "\n".join(lines).strip())
+        for breadcrumb, anchor, lines in sections
+    ]
+
+
+def _hard_split(text: str, max_size: int, measure: Callable[[str], int]) -> list[str]:
+    """Split an oversized block at line breaks, then inside overlong lines."""
+    parts: list[str] = []
+    for line in text.splitlines():
+        size = measure(line)
+        if size <= max_size:
+            parts.append(line)
+            continue
+        step = max(1, len(line) * max_size // size)
+        parts.extend(line[i : i + step] for i in range(0, len(line), step))
+    return _pack(parts, "\n", max_size, measure)
+
+
+def _pack(
+    parts: list[str], sep: str, max_size: int, measure: Callable[[str], int]
+) -> list[str]:
+    """Greedily join consecutive parts while they stay within max_size."""
+    pieces: list[str] = []
+    current: list[str] = []
+    current_size = 0
+    sep_size = measure(sep)
+    for part in parts:
+        size = measure(part)
+        if current and current_size + sep_size + size > max_size:
+            pieces.append(sep.join(current))
+            current, current_size = [], 0
+        current_size += (sep_size if current else 0) + size
+        current.append(part)
+    if current:
+        pieces.append(sep.join(current))
+    return pieces
+
+
+def chunk_markdown(
+    markdown: str,
+    max_size: int,
+    unit: SizeUnit = SizeUnit.chars,
+    tokenizer: str = DEFAULT_TOKENIZER,
+) -> list[tuple[list[str], str | None, str]]:
+    """Split markdown into chunks at H2/H3 boundaries, capped at max_size.
+
+    Sections longer than max_size are split between paragraphs (code fences
+    stay whole where possible); a paragraph longer than max_size on its own
+    is split between lines, then within lines. Sections with no text beyond
+    their heading produce no chunk.
+
+    Args:
+        markdown: Page markdown.
+        max_size: Maximum chunk size, in unit.
+        unit: Whether max_size counts bytes, characters or tokens.
+        tokenizer: Tokenizer counting the tokens unit (see get_tokenizer).
+
+    Returns:
+        (heading breadcrumb, anchor, text) for each chunk, in page order.
+    """
+    measure = unit.measure(tokenizer)
+    chunks: list[tuple[list[str], str | None, str]] = []
+    for breadcrumb, anchor, text in _split_sections(markdown):
+        if not text or (text.startswith("#") and "\n" not in text):
+            # Nothing but a heading
+            continue
+        if measure(text) <= max_size:
+            chunks.append((breadcrumb, anchor, text))
+            continue
+        parts: list[str] = []
+        for block in split_blocks(text):
+            if measure(block) <= max_size:
+                parts.append(block)
+            else:
+                parts.extend(_hard_split(block, max_size, measure))
+        chunks.extend(
+            (breadcrumb, anchor, piece)
+            for piece in _pack(parts, "\n\n", max_size, measure)
+        )
+    return chunks
+
+
+def _chunk_id(md_path: str, breadcrumb: list[str], text: str) -> str:
+    """Stable ID that changes only when the chunk's page, headings or text do."""
+    key = "\0".join([md_path, *breadcrumb, text])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def chunk_page(
+    config: Config,
+    result: PageResult,
+    section: str,
+    max_size: int,
+    unit: SizeUnit = SizeUnit.chars,
+) -> list[Chunk]:
+    """Chunk one converted page.
+
+    Args:
+        config: Resolved configuration.
+        result: Converted page result.
+        section: Section the page is listed under.
+        max_size: Maximum chunk size, in unit.
+        unit: Whether max_size counts bytes, characters or tokens (counted,
+            like each chunk's tokens, with config.tokenizer).
+
+    Returns:
+        The page's chunks; headings start with the page title.
+    """
+    count_tokens = get_tokenizer(config.tokenizer)
+    page_url = md_path_to_html_url(
+        config.site_url, result.md_path, config.use_directory_urls
+    )
+    markdown_url = md_path_to_page_url(
+        config.site_url, result.md_path, config.use_directory_urls
+    )
+    return [
+        Chunk(
+            id=_chunk_id(result.md_path, breadcrumb, text),
+            md_path=result.md_path,
+            url=f"{page_url}#{anchor}" if anchor else page_url,
+            markdown_url=markdown_url,
+            title=result.title,
+            section=section,
+            headings=[result.title, *breadcrumb],
+            index=index,
+            text=text,
+            tokens=count_tokens(text),
+        )
+        for index, (breadcrumb, anchor, text) in enumerate(
+            chunk_markdown(result.text, max_size, unit, config.tokenizer)
+        )
+    ]
+
+
+class ChunkWriter(JsonlPageWriter):
+    """Stream chunk records for each converted page to a JSONL file."""
+
+    noun = "chunks"
+
+    def __init__(
+        self,
+        config: Config,
+        path: Path,
+        max_size: int,
+        unit: SizeUnit = SizeUnit.chars,
+        dry_run: bool = False,
+    ) -> None:
+        """Open path for writing (see JsonlPageWriter)."""
+        super().__init__(config, path, dry_run=dry_run)
+        self.max_size = max_size
+        self.unit = unit
+
+    def records(self, result: PageResult, section: str) -> Iterator[dict[str, Any]]:
+        """Chunk records for one converted page."""
+        for chunk in chunk_page(self.config, result, section, self.max_size, self.unit):
+            yield chunk.to_json()
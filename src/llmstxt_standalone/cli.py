@@ -1,23 +1,32 @@
-"""Command-line interface."""
+"""Command-line interface.
+
+Heavy dependencies (pydantic, PyYAML, ruamel.yaml and the HTML conversion
+stack) are imported inside the commands that use them, so `--version`,
+`init` and `validate` don't pay for the whole conversion pipeline at startup.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager, ExitStack, nullcontext
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-import yaml
-from ruamel.yaml import YAML
-from ruamel.yaml import YAMLError as RuamelYAMLError
-
-from llmstxt_standalone import __version__
-from llmstxt_standalone.config import load_config
-from llmstxt_standalone.generate import (
-    build_llms_output,
-    ensure_safe_md_path,
-    write_markdown_files,
-)
+
+from llmstxt_standalone.parallel import Executor
+from llmstxt_standalone.tokens import SizeUnit
+
+if TYPE_CHECKING:
+    from llmstxt_standalone.batch import Project
+    from llmstxt_standalone.checkpoint import Checkpoint
+    from llmstxt_standalone.config import Config
+    from llmstxt_standalone.export import PageWriter
+    from llmstxt_standalone.generate import BuildResult, FullTextWriter, PageResult
+    from llmstxt_standalone.parallel import WorkerPool
+    from llmstxt_standalone.trace import Tracer
 
 
 def _make_logger(
@@ -48,10 +57,63 @@ def _make_logger(
 def version_callback(value: bool) -> None:
     """Print version and exit if --version flag is set."""
     if value:
+        from llmstxt_standalone import __version__
+
         typer.echo(f"llmstxt-standalone {__version__}")
         raise typer.Exit()
 
 
+class Emit(str, Enum):
+    """Optional build outputs selectable with --emit."""
+
+    full = "full"
+    jsonl = "jsonl"
+    chunks = "chunks"
+    sections = "sections"
+    parts = "parts"
+
+
+_DEFAULT_EMIT = frozenset({Emit.full})
+
+# Largest pages listed in the verbose token report
+_TOKEN_REPORT_PAGES = 5
+
+_EMIT_HELP = (
+    "Outputs to write besides llms.txt and per-page files: 'full' "
+    "(llms-full.txt), 'sections' (one full file per section), 'parts' "
+    "(size-bounded llms-full parts), 'jsonl' (one record per page) and/or "
+    "'chunks' (heading-aware chunks) [default: full]"
+)
+
+
+@dataclass(frozen=True)
+class _Exports:
+    """Optional outputs requested with --emit, and their settings."""
+
+    emit: frozenset[Emit] = _DEFAULT_EMIT
+    chunk_size: int = 2000
+    chunk_unit: SizeUnit = SizeUnit.chars
+    part_size: int = 1_000_000
+    part_unit: SizeUnit = SizeUnit.bytes
+
+    @classmethod
+    def from_options(
+        cls,
+        emit: list[Emit] | None,
+        chunk_size: int,
+        chunk_unit: SizeUnit,
+        part_size: int,
+        part_unit: SizeUnit,
+    ) -> _Exports:
+        return cls(
+            frozenset(emit) if emit else _DEFAULT_EMIT,
+            chunk_size,
+            chunk_unit,
+            part_size,
+            part_unit,
+        )
+
+
 app = typer.Typer(
     help="Generate llms.txt from built HTML documentation.",
     no_args_is_help=True,
@@ -78,15 +140,26 @@ def main(
 @app.command()
 def build(
     config: Annotated[
-        Path,
-        typer.Option("--config", "-c", help="Path to mkdocs.yml config file"),
-    ] = Path("mkdocs.yml"),
+        list[Path] | None,
+        typer.Option(
+            "--config",
+            "-c",
+            help="Path to mkdocs.yml config file [default: mkdocs.yml]; "
+            "repeat with --site-dir to build several projects",
+            show_default=False,
+        ),
+    ] = None,
     site_dir: Annotated[
-        Path,
-        typer.Option("--site-dir", "-s", help="Path to built HTML site directory"),
-    ] = Path("site"),
+        list[Path] | None,
+        typer.Option(
+            "--site-dir",
+            "-s",
+            help="Path to built HTML site directory [default: site]",
+            show_default=False,
+        ),
+    ] = None,
     output_dir: Annotated[
-        Path | None,
+        list[Path] | None,
         typer.Option(
             "--output-dir", "-o", help="Output directory (defaults to site-dir)"
         ),
@@ -107,13 +180,388 @@ def build(
         bool,
         typer.Option("--verbose", "-v", help="Show detailed progress"),
     ] = False,
+    trace: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Write build spans in Chrome Trace Event Format to this file",
+        ),
+    ] = None,
+    metrics_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-file",
+            help="Write build metrics in OpenMetrics text format to this file",
+        ),
+    ] = None,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            envvar="LLMSTXT_CACHE_DIR",
+            help="Reuse resolved config from this cache directory when unchanged",
+        ),
+    ] = None,
+    shard: Annotated[
+        str | None,
+        typer.Option(
+            "--shard",
+            help="Convert only shard K of N (e.g. 2/4) and write a bundle for 'merge'",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Workers for page conversion (0 = one per CPU)",
+        ),
+    ] = 1,
+    executor: Annotated[
+        Executor,
+        typer.Option(
+            "--executor",
+            help="Run --jobs workers as processes, threads or subinterpreters "
+            "(interpreter: experimental; auto: threads on free-threaded Python)",
+        ),
+    ] = Executor.auto,
+    page_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--page-timeout",
+            min=0.001,
+            help="Skip pages whose conversion takes longer than this many seconds",
+        ),
+    ] = None,
+    page_memory: Annotated[
+        int | None,
+        typer.Option(
+            "--page-memory",
+            min=1,
+            help="Let each worker process use at most this many MiB of memory "
+            "beyond its starting footprint",
+        ),
+    ] = None,
+    page_store_limit: Annotated[
+        int,
+        typer.Option(
+            "--page-store-limit",
+            min=0,
+            help="Keep up to this many MiB of page markdown in memory, then "
+            "spill pages to a temporary file",
+        ),
+    ] = 512,
+    batch: Annotated[
+        Path | None,
+        typer.Option(
+            "--batch",
+            help="Build every project listed in this YAML file on one worker pool",
+        ),
+    ] = None,
+    checkpoint_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--checkpoint",
+            help="Journal finished pages to this directory so an interrupted "
+            "build can be resumed",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume", help="Continue from the --checkpoint of an interrupted build"
+        ),
+    ] = False,
+    emit: Annotated[
+        list[Emit] | None,
+        typer.Option("--emit", help=_EMIT_HELP, show_default=False),
+    ] = None,
+    chunk_size: Annotated[
+        int,
+        typer.Option(
+            "--chunk-size", min=1, help="Maximum chunk size for --emit chunks"
+        ),
+    ] = 2000,
+    chunk_unit: Annotated[
+        SizeUnit,
+        typer.Option(
+            "--chunk-unit", help="Measure --chunk-size in bytes, characters or tokens"
+        ),
+    ] = SizeUnit.chars,
+    part_size: Annotated[
+        int,
+        typer.Option("--part-size", min=1, help="Maximum part size for --emit parts"),
+    ] = 1_000_000,
+    part_unit: Annotated[
+        SizeUnit,
+        typer.Option(
+            "--part-unit", help="Measure --part-size in bytes, characters or tokens"
+        ),
+    ] = SizeUnit.bytes,
 ) -> None:
     """Generate llms.txt and llms-full.txt from built MkDocs site."""
-    # Resolve output directory
-    out_dir = output_dir or site_dir
+    from llmstxt_standalone.generate import build_llms_output
+    from llmstxt_standalone.pagestore import PageStore
+    from llmstxt_standalone.parallel import resolve_jobs
+    from llmstxt_standalone.trace import Tracer
+
     log, log_verbose = _make_logger(quiet, verbose)
+    tracer = Tracer() if trace or metrics_file else None
+    num_jobs = resolve_jobs(jobs)
+    exports = _Exports.from_options(emit, chunk_size, chunk_unit, part_size, part_unit)
+    if executor in (Executor.thread, Executor.interpreter) and (
+        page_timeout is not None or page_memory is not None
+    ):
+        log(
+            "Error: --page-timeout and --page-memory need worker processes, "
+            f"not --executor {executor.value}",
+            color="red",
+            err=True,
+        )
+        raise typer.Exit(1)
+    _check_executor(executor, log_verbose)
+    if resume and checkpoint_dir is None:
+        log("Error: --resume needs --checkpoint", color="red", err=True)
+        raise typer.Exit(1)
 
-    # Validate inputs
+    if batch is not None or len(config or ()) > 1:
+        projects = _resolve_projects(batch, config, site_dir, output_dir, log)
+        if shard is not None or metrics_file is not None or checkpoint_dir:
+            log(
+                "Error: --shard, --metrics-file and --checkpoint apply to a "
+                "single project",
+                color="red",
+                err=True,
+            )
+            raise typer.Exit(1)
+        with _open_pool(num_jobs, executor, page_timeout, page_memory) as pool:
+            ok = _build_batch(
+                projects,
+                pool,
+                dry_run,
+                cache_dir,
+                exports,
+                log,
+                log_verbose,
+                tracer,
+                page_store_limit,
+            )
+            _log_pool_report(pool, log_verbose)
+        if tracer is not None and trace is not None:
+            _write_trace(tracer, trace, log, log_verbose)
+        if not ok:
+            raise typer.Exit(1)
+        return
+
+    if len(site_dir or ()) > 1 or len(output_dir or ()) > 1:
+        log(
+            "Error: Pass one --config per --site-dir/--output-dir",
+            color="red",
+            err=True,
+        )
+        raise typer.Exit(1)
+    config_path = config[0] if config else Path("mkdocs.yml")
+    site_path = site_dir[0] if site_dir else Path("site")
+    # Resolve output directory
+    out_dir = output_dir[0] if output_dir else site_path
+
+    shard_spec: tuple[int, int] | None = None
+    if shard is not None:
+        from llmstxt_standalone.shard import parse_shard
+
+        try:
+            shard_spec = parse_shard(shard)
+        except ValueError as exc:
+            log(f"Error: {exc}", color="red", err=True)
+            raise typer.Exit(1) from None
+        if exports.emit != _DEFAULT_EMIT:
+            log(
+                "Error: Pass --emit to merge, not to shard builds",
+                color="red",
+                err=True,
+            )
+            raise typer.Exit(1)
+        if checkpoint_dir is not None:
+            log(
+                "Error: --checkpoint doesn't apply to shard builds",
+                color="red",
+                err=True,
+            )
+            raise typer.Exit(1)
+
+    _check_inputs(config_path, site_path, log)
+    cfg = _load_build_config(config_path, cache_dir, log, tracer)
+
+    log_verbose(f"Site: {cfg.site_name}")
+    log_verbose(f"Sections: {list(cfg.sections.keys())}")
+    if dry_run:
+        log_verbose("Dry run - no files will be written")
+
+    # Pages past the limit are kept on disk until the outputs are written
+    with (
+        PageStore(page_store_limit * 1024 * 1024) as page_store,
+        ExitStack() as staged,
+    ):
+        # Full-content outputs stay staged until _write_build_outputs
+        full_writers: list[FullTextWriter] = []
+        if shard_spec is None:
+            full_writers = _open_full_writers(cfg, out_dir, exports, dry_run, log)
+            for full_writer in full_writers:
+                staged.enter_context(full_writer)
+        page_writers = _open_page_writers(cfg, out_dir, exports, dry_run, log, tracer)
+        with ExitStack() as stack:
+            for writer in page_writers:
+                stack.enter_context(writer)
+            pool = stack.enter_context(
+                _open_pool(num_jobs, executor, page_timeout, page_memory)
+            )
+            build_checkpoint = None
+            if checkpoint_dir is not None and not dry_run:
+                build_checkpoint = stack.enter_context(
+                    _open_checkpoint(checkpoint_dir, cfg, site_path, resume, log)
+                )
+            if shard_spec is not None:
+                llms_build = _build_shard_bundle(
+                    cfg, site_path, out_dir, shard_spec, dry_run, log, tracer, pool
+                )
+            else:
+                # Generate content, streaming page records as pages finish
+                try:
+                    llms_build = build_llms_output(
+                        config=cfg,
+                        site_dir=site_path,
+                        tracer=tracer,
+                        pool=pool,
+                        on_page=_write_pages_to(page_writers),
+                        section_files=Emit.sections in exports.emit,
+                        checkpoint=build_checkpoint,
+                        page_store=page_store,
+                        full_writers=full_writers,
+                    )
+                except (OSError, ValueError) as exc:
+                    log(f"Error writing page output: {exc}", color="red", err=True)
+                    raise typer.Exit(1) from None
+                _log_pool_report(pool, log_verbose)
+                if build_checkpoint is not None and resume:
+                    restored = build_checkpoint.restored
+                    log_verbose(f"Resumed {restored} pages from {checkpoint_dir}")
+                if page_store.spilled:
+                    log_verbose(
+                        f"Kept {page_store.spilled} pages on disk "
+                        "past --page-store-limit"
+                    )
+        if shard_spec is None:
+            _write_build_outputs(
+                llms_build,
+                cfg,
+                out_dir,
+                dry_run,
+                log,
+                log_verbose,
+                tracer,
+                page_writers,
+                full_writers,
+            )
+            if build_checkpoint is not None:
+                # Every output is written; nothing is left to resume
+                build_checkpoint.remove()
+
+        if tracer is not None and trace is not None:
+            _write_trace(tracer, trace, log, log_verbose)
+
+        if tracer is not None and metrics_file is not None:
+            from llmstxt_standalone.fulltext import FullFileWriter, SectionFilesWriter
+            from llmstxt_standalone.metrics import render_build_metrics, write_textfile
+
+            bytes_out = sum(
+                full_writer.bytes
+                for full_writer in full_writers
+                if isinstance(full_writer, (FullFileWriter, SectionFilesWriter))
+            )
+            bytes_out += len(llms_build.llms_txt.encode("utf-8"))
+            bytes_out += sum(page.size for page in llms_build.pages)
+            metrics_text = render_build_metrics(
+                llms_build,
+                site_name=cfg.site_name,
+                bytes_out=bytes_out,
+                spans=tracer.spans,
+            )
+            try:
+                write_textfile(metrics_file, metrics_text)
+            except OSError as exc:
+                log(f"Error writing metrics file: {exc}", color="red", err=True)
+                raise typer.Exit(1) from None
+            log_verbose(f"Wrote metrics to {metrics_file}")
+
+
+def _open_pool(
+    num_jobs: int,
+    executor: Executor,
+    page_timeout: float | None,
+    page_memory: int | None,
+) -> AbstractContextManager[WorkerPool | None]:
+    """Worker pool for a build, or None to convert in this process.
+
+    Resource limits need workers that can be killed, so they get a pool of
+    processes even with a single job.
+    """
+    from llmstxt_standalone.parallel import WorkerPool
+
+    limited = page_timeout is not None or page_memory is not None
+    if num_jobs == 1 and not limited:
+        return nullcontext()
+    return WorkerPool(
+        num_jobs,
+        page_timeout=page_timeout,
+        memory_limit=page_memory * 1024 * 1024 if page_memory else None,
+        executor=Executor.process if limited else executor,
+    )
+
+
+def _open_checkpoint(
+    directory: Path,
+    config: Config,
+    site_dir: Path,
+    resume: bool,
+    log: Callable[..., None],
+) -> Checkpoint:
+    """Open the build checkpoint, exiting with an error if it can't be."""
+    from llmstxt_standalone.checkpoint import Checkpoint
+
+    try:
+        checkpoint = Checkpoint(directory, config, site_dir, resume=resume)
+    except OSError as exc:
+        log(f"Error opening checkpoint: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    if checkpoint.stale:
+        log(
+            f"Checkpoint in {directory} is for a different config or site; "
+            "starting over",
+            color="yellow",
+            err=True,
+        )
+    return checkpoint
+
+
+def _check_executor(executor: Executor, log_verbose: Callable[..., None]) -> None:
+    """Note when --executor interpreter falls back to worker processes."""
+    if executor is Executor.interpreter and executor.resolve() is Executor.process:
+        log_verbose("Subinterpreters need Python 3.14+; using worker processes")
+
+
+def _log_pool_report(pool: WorkerPool | None, log_verbose: Callable[..., None]) -> None:
+    """Report how busy the conversion workers were."""
+    if pool is None or pool.efficiency is None:
+        return
+    log_verbose(
+        f"Workers: {pool.jobs} converting {pool.efficiency:.0%} of "
+        f"{pool.wall_s:.2f}s ({pool.busy_s:.2f}s of conversion)"
+    )
+
+
+def _check_inputs(config: Path, site_dir: Path, log: Callable[..., None]) -> None:
+    """Exit with an error if the config file or site directory is missing."""
     if not config.exists():
         log(f"Error: Config file not found: {config}", color="red", err=True)
         raise typer.Exit(1)
@@ -127,9 +575,332 @@ def build(
         )
         raise typer.Exit(1)
 
+
+def _write_trace(
+    tracer: Tracer,
+    trace: Path,
+    log: Callable[..., None],
+    log_verbose: Callable[..., None],
+) -> None:
+    try:
+        tracer.write(trace)
+    except OSError as exc:
+        log(f"Error writing trace file: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    log_verbose(f"Wrote trace with {len(tracer.spans)} spans to {trace}")
+
+
+def _resolve_projects(
+    batch: Path | None,
+    configs: list[Path] | None,
+    site_dirs: list[Path] | None,
+    output_dirs: list[Path] | None,
+    log: Callable[..., None],
+) -> list[Project]:
+    """Collect batch projects from --batch or repeated --config/--site-dir."""
+    from llmstxt_standalone.batch import Project, load_projects
+
+    if batch is not None:
+        if configs or site_dirs or output_dirs:
+            log(
+                "Error: --batch cannot be combined with --config, --site-dir "
+                "or --output-dir",
+                color="red",
+                err=True,
+            )
+            raise typer.Exit(1)
+        try:
+            return load_projects(batch)
+        except (OSError, ValueError) as exc:
+            log(f"Error loading batch file: {exc}", color="red", err=True)
+            raise typer.Exit(1) from None
+
+    configs = configs or []
+    site_dirs = site_dirs or []
+    output_dirs = output_dirs or []
+    if len(site_dirs) != len(configs) or len(output_dirs) not in (0, len(configs)):
+        log(
+            "Error: Pass one --site-dir (and optionally one --output-dir) per --config",
+            color="red",
+            err=True,
+        )
+        raise typer.Exit(1)
+    return [
+        Project(
+            config=config,
+            site_dir=site_dir,
+            output_dir=output_dirs[i] if output_dirs else site_dir,
+        )
+        for i, (config, site_dir) in enumerate(zip(configs, site_dirs, strict=True))
+    ]
+
+
+def _build_batch(
+    projects: list[Project],
+    pool: WorkerPool | None,
+    dry_run: bool,
+    cache_dir: Path | None,
+    exports: _Exports,
+    log: Callable[..., None],
+    log_verbose: Callable[..., None],
+    tracer: Tracer | None,
+    page_store_limit: int,
+) -> bool:
+    """Build several projects on one pool, reporting each one.
+
+    A project that fails to load or write is reported and skipped without
+    stopping the others. Pages of every project share one page store, with
+    page_store_limit MiB kept in memory.
+
+    Returns:
+        True if every project was built.
+    """
+    from llmstxt_standalone.generate import iter_build_results
+    from llmstxt_standalone.pagestore import PageStore
+
+    stack = ExitStack()
+
+    def load(
+        project: Project,
+    ) -> tuple[Config, list[PageWriter], list[FullTextWriter]] | None:
+        try:
+            _check_inputs(project.config, project.site_dir, log)
+            cfg = _load_build_config(project.config, cache_dir, log, tracer)
+            full_writers = _open_full_writers(
+                cfg, project.output_dir, exports, dry_run, log
+            )
+            for full_writer in full_writers:
+                stack.enter_context(full_writer)
+            writers = _open_page_writers(
+                cfg, project.output_dir, exports, dry_run, log, tracer
+            )
+        except typer.Exit:
+            log(f"Skipped project {project.config}", color="red", err=True)
+            return None
+        for writer in writers:
+            stack.enter_context(writer)
+        return cfg, writers, full_writers
+
+    def write(
+        project: Project,
+        cfg: Config,
+        writers: list[PageWriter],
+        full_writers: list[FullTextWriter],
+        llms_build: BuildResult,
+    ) -> bool:
+        log(f"{cfg.site_name} ({project.config}):", color="blue")
+        try:
+            _write_build_outputs(
+                llms_build,
+                cfg,
+                project.output_dir,
+                dry_run,
+                log,
+                log_verbose,
+                tracer,
+                writers,
+                full_writers,
+            )
+        except typer.Exit:
+            return False
+        return True
+
+    def on_page(index: int, result: PageResult) -> None:
+        for writer in ready[index][2]:
+            writer.write(result)
+
+    with stack:
+        page_store = stack.enter_context(PageStore(page_store_limit * 1024 * 1024))
+        loaded = [(project, load(project)) for project in projects]
+        ready = [(project, *state) for project, state in loaded if state is not None]
+        results = iter_build_results(
+            [(cfg, project.site_dir) for project, cfg, _, _ in ready],
+            pool=pool,
+            tracer=tracer,
+            on_page=on_page,
+            section_files=Emit.sections in exports.emit,
+            full_writers=[full_writers for _, _, _, full_writers in ready],
+            page_store=page_store,
+        )
+        try:
+            built = sum(
+                write(project, cfg, writers, full_writers, llms_build)
+                for (project, cfg, writers, full_writers), llms_build in zip(
+                    ready, results, strict=True
+                )
+            )
+        except (OSError, ValueError) as exc:
+            log(f"Error writing page output: {exc}", color="red", err=True)
+            return False
+
+    color = "green" if built == len(projects) else "yellow"
+    log(f"Built {built} of {len(projects)} projects", color)
+    return built == len(projects)
+
+
+def _open_page_writers(
+    cfg: Config,
+    out_dir: Path,
+    exports: _Exports,
+    dry_run: bool,
+    log: Callable[..., None],
+    tracer: Tracer | None = None,
+) -> list[PageWriter]:
+    """Open the per-page markdown writer and the exports requested with --emit.
+
+    Per-page markdown files and exports are streamed as pages finish unless
+    a token budget may fail the build, which must leave the output
+    untouched; the pages are then held back and written by
+    _write_build_outputs once the budget check passes. In dry-run mode the
+    writers only count records.
+    """
+    budgeted = cfg.max_page_tokens is not None or cfg.max_full_tokens is not None
+    if budgeted and cfg.token_budget_action == "fail":
+        from llmstxt_standalone.export import HeldPageWriter
+
+        return [
+            HeldPageWriter(
+                cfg,
+                out_dir,
+                lambda: _open_streamed_writers(
+                    cfg, out_dir, exports, dry_run, log, tracer
+                ),
+            )
+        ]
+    return _open_streamed_writers(cfg, out_dir, exports, dry_run, log, tracer)
+
+
+def _open_streamed_writers(
+    cfg: Config,
+    out_dir: Path,
+    exports: _Exports,
+    dry_run: bool,
+    log: Callable[..., None],
+    tracer: Tracer | None = None,
+) -> list[PageWriter]:
+    """Open the per-page markdown writer and every requested export."""
+    from llmstxt_standalone.export import MarkdownPageWriter
+
+    writers: list[PageWriter] = [
+        MarkdownPageWriter(cfg, out_dir, dry_run=dry_run, tracer=tracer)
+    ]
+    try:
+        if Emit.jsonl in exports.emit:
+            from llmstxt_standalone.export import JSONL_FILENAME, JsonlPageWriter
+
+            writers.append(
+                JsonlPageWriter(cfg, out_dir / JSONL_FILENAME, dry_run=dry_run)
+            )
+        if Emit.chunks in exports.emit:
+            from llmstxt_standalone.chunk import CHUNKS_FILENAME, ChunkWriter
+
+            writers.append(
+                ChunkWriter(
+                    cfg,
+                    out_dir / CHUNKS_FILENAME,
+                    exports.chunk_size,
+                    exports.chunk_unit,
+                    dry_run=dry_run,
+                )
+            )
+    except (OSError, ValueError) as exc:
+        for writer in writers:
+            writer.close()
+        log(f"Error writing page export: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    return writers
+
+
+def _open_full_writers(
+    cfg: Config,
+    out_dir: Path,
+    exports: _Exports,
+    dry_run: bool,
+    log: Callable[..., None],
+) -> list[FullTextWriter]:
+    """Open the full-content outputs requested with --emit.
+
+    llms-full.txt, section files and parts are written as pages finish but
+    stay staged until _write_build_outputs commits them, once the token
+    budget check passes.
+    """
+    from llmstxt_standalone.generate import ensure_safe_md_path
+
+    try:
+        ensure_safe_md_path(cfg.full_output)
+    except ValueError:
+        log(
+            "Error: Invalid full_output: must be a relative path without '..'",
+            color="red",
+            err=True,
+        )
+        raise typer.Exit(1) from None
+    writers: list[FullTextWriter] = []
+    try:
+        if Emit.full in exports.emit:
+            from llmstxt_standalone.fulltext import FullFileWriter
+
+            writers.append(FullFileWriter(cfg, out_dir, dry_run=dry_run))
+        if Emit.sections in exports.emit:
+            from llmstxt_standalone.fulltext import SectionFilesWriter
+
+            writers.append(SectionFilesWriter(cfg, out_dir, dry_run=dry_run))
+        if Emit.parts in exports.emit:
+            from llmstxt_standalone.parts import FullPartsWriter
+
+            writers.append(
+                FullPartsWriter(
+                    cfg,
+                    out_dir,
+                    exports.part_size,
+                    exports.part_unit,
+                    dry_run=dry_run,
+                )
+            )
+    except (OSError, ValueError) as exc:
+        for writer in writers:
+            writer.close()
+        log(f"Error writing output files: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    return writers
+
+
+def _write_pages_to(
+    writers: Sequence[PageWriter],
+) -> Callable[[PageResult], None] | None:
+    """on_page callback feeding every streamed export, if there are any."""
+    if not writers:
+        return None
+
+    def on_page(result: PageResult) -> None:
+        for writer in writers:
+            writer.write(result)
+
+    return on_page
+
+
+def _load_build_config(
+    config: Path,
+    cache_dir: Path | None,
+    log: Callable[..., None],
+    tracer: Tracer | None = None,
+) -> Config:
+    """Load config for output generation, exiting on errors or empty sections."""
+    import yaml
+
+    from llmstxt_standalone.config import load_config_cached
+    from llmstxt_standalone.config.cache import ConfigCacheStats
+    from llmstxt_standalone.tokens import get_tokenizer
+    from llmstxt_standalone.trace import maybe_span
+
     # Load config
     try:
-        cfg = load_config(config)
+        with maybe_span(tracer, "load_config") as span_args:
+            cache_stats = ConfigCacheStats()
+            cfg = load_config_cached(config, cache_dir, cache_stats)
+            # Read back by render_build_metrics
+            span_args["config_cache_hits"] = cache_stats.hits
+            span_args["config_cache_misses"] = cache_stats.misses
     except (FileNotFoundError, ValueError, yaml.YAMLError) as e:
         log(f"Error loading config: {e}", color="red", err=True)
         raise typer.Exit(1) from None
@@ -145,39 +916,100 @@ def build(
         )
         raise typer.Exit(1)
 
-    log_verbose(f"Site: {cfg.site_name}")
-    log_verbose(f"Sections: {list(cfg.sections.keys())}")
+    try:
+        get_tokenizer(cfg.tokenizer)
+    except ValueError as exc:
+        log(f"Error: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    return cfg
+
+
+def _build_shard_bundle(
+    cfg: Config,
+    site_dir: Path,
+    out_dir: Path,
+    shard_spec: tuple[int, int],
+    dry_run: bool,
+    log: Callable[..., None],
+    tracer: Tracer | None,
+    pool: WorkerPool | None,
+) -> BuildResult:
+    """Convert one shard's pages and write its bundle; return a summary."""
+    from llmstxt_standalone.shard import build_shard, bundle_filename, write_bundle
+
+    shard, num_shards = shard_spec
+    bundle = build_shard(cfg, site_dir, shard, num_shards, tracer=tracer, pool=pool)
+    bundle_path = out_dir / bundle_filename(shard, num_shards)
+
     if dry_run:
-        log_verbose("Dry run - no files will be written")
+        action = "Would generate"
+        color = "yellow"
+    else:
+        action = "Generated"
+        color = "green"
+        try:
+            write_bundle(bundle, bundle_path)
+        except OSError as exc:
+            log(f"Error writing shard bundle: {exc}", color="red", err=True)
+            raise typer.Exit(1) from None
 
-    # Generate content
-    llms_build = build_llms_output(
-        config=cfg,
-        site_dir=site_dir,
+    log(
+        f"{action} {bundle_path} (shard {shard}/{num_shards}, "
+        f"{len(bundle.pages)} pages)",
+        color,
     )
-    try:
-        markdown_files = write_markdown_files(
-            llms_build.pages,
-            output_dir=out_dir,
-            use_directory_urls=cfg.use_directory_urls,
-            dry_run=dry_run,
-        )
-    except (OSError, ValueError) as exc:
-        log(f"Error writing markdown files: {exc}", color="red", err=True)
-        raise typer.Exit(1) from None
+    return bundle.summary()
+
+
+def _write_build_outputs(
+    llms_build: BuildResult,
+    cfg: Config,
+    out_dir: Path,
+    dry_run: bool,
+    log: Callable[..., None],
+    log_verbose: Callable[..., None],
+    tracer: Tracer | None = None,
+    page_writers: Sequence[PageWriter] = (),
+    full_writers: Sequence[FullTextWriter] = (),
+) -> None:
+    """Write llms.txt and any held-back pages, commit full content, then report.
+
+    Per-page markdown files and exports are streamed during the build by
+    page_writers, so they are only reported here, unless page_writers held
+    the pages back until the token budget check passed. full_writers
+    (llms-full.txt, section files and parts) have staged their output
+    during the build and are committed here.
+    """
+    from llmstxt_standalone.export import HeldPageWriter, MarkdownPageWriter
+    from llmstxt_standalone.fulltext import FullFileWriter, SectionFilesWriter
+    from llmstxt_standalone.parts import FullPartsWriter
+    from llmstxt_standalone.trace import maybe_span
+
+    if llms_build.budget_errors:
+        log("Error: Token budget exceeded:", color="red", err=True)
+        for error in llms_build.budget_errors:
+            log(f"- {error}", color="red", err=True)
+        raise typer.Exit(1)
+
+    written: list[PageWriter] = []
+    for writer in page_writers:
+        if not isinstance(writer, HeldPageWriter):
+            written.append(writer)
+            continue
+        try:
+            written.extend(writer.release())
+        except (OSError, ValueError) as exc:
+            log(f"Error writing page output: {exc}", color="red", err=True)
+            raise typer.Exit(1) from None
+    markdown_files = [
+        path
+        for writer in written
+        if isinstance(writer, MarkdownPageWriter)
+        for path in writer.paths
+    ]
+    page_writers = [w for w in written if not isinstance(w, MarkdownPageWriter)]
 
-    # Define output paths
     llms_path = out_dir / "llms.txt"
-    try:
-        full_output_path = ensure_safe_md_path(cfg.full_output)
-    except ValueError:
-        log(
-            "Error: Invalid full_output: must be a relative path without '..'",
-            color="red",
-            err=True,
-        )
-        raise typer.Exit(1) from None
-    full_path = out_dir / full_output_path
 
     # Write output files (skip in dry-run mode)
     if dry_run:
@@ -187,16 +1019,41 @@ def build(
         action = "Generated"
         color = "green"
         try:
-            out_dir.mkdir(parents=True, exist_ok=True)
-            llms_path.write_text(llms_build.llms_txt, encoding="utf-8")
-            full_path.write_text(llms_build.llms_full_txt, encoding="utf-8")
+            with maybe_span(tracer, "write_outputs"):
+                out_dir.mkdir(parents=True, exist_ok=True)
+                llms_path.write_text(llms_build.llms_txt, encoding="utf-8")
+                for full_writer in full_writers:
+                    full_writer.commit()
         except OSError as exc:
             log(f"Error writing output files: {exc}", color="red", err=True)
             raise typer.Exit(1) from None
 
     log(f"{action} {llms_path} ({len(llms_build.llms_txt):,} bytes)", color)
-    log(f"{action} {full_path} ({len(llms_build.llms_full_txt):,} bytes)", color)
+    for full_writer in full_writers:
+        if isinstance(full_writer, FullFileWriter):
+            log(f"{action} {full_writer.path} ({full_writer.bytes:,} bytes)", color)
+        elif isinstance(full_writer, SectionFilesWriter):
+            log(
+                f"{action} {len(full_writer.paths)} section files "
+                f"({full_writer.bytes:,} bytes)",
+                color,
+            )
+            for path in full_writer.paths:
+                log_verbose(f"- {path}")
+        elif isinstance(full_writer, FullPartsWriter):
+            log(
+                f"{action} {full_writer.path} "
+                f"({full_writer.count:,} {full_writer.noun})",
+                color,
+            )
+    for writer in page_writers:
+        log(f"{action} {writer.path} ({writer.count:,} {writer.noun})", color)
     log(f"{action} {len(markdown_files)} markdown files", color)
+    if llms_build.reused_pages:
+        log_verbose(
+            f"Reused {llms_build.reused_pages:,} conversions of identical pages"
+        )
+    _log_full_report(llms_build, cfg, log_verbose)
 
     if llms_build.skipped:
         log_verbose("Skipped files:", color="yellow", err=True)
@@ -209,6 +1066,273 @@ def build(
             log(f"- {warning}", color="yellow", err=True)
 
 
+def _log_full_report(
+    llms_build: BuildResult, cfg: Config, log_verbose: Callable[..., None]
+) -> None:
+    """Report deduplication, llms-full.txt's token count and largest pages."""
+    if llms_build.deduplicated_blocks:
+        log_verbose(
+            f"Deduplicated {llms_build.deduplicated_blocks:,} repeated blocks "
+            f"({llms_build.deduplicated_chars:,} chars) in {cfg.full_output}"
+        )
+    log_verbose(
+        f"Tokens ({cfg.tokenizer}): {cfg.full_output} {llms_build.full_tokens:,}"
+    )
+    largest = sorted(llms_build.page_tokens.items(), key=lambda item: -item[1])
+    total = llms_build.full_tokens or 1
+    for md_path, tokens in largest[:_TOKEN_REPORT_PAGES]:
+        log_verbose(f"- {md_path}: {tokens:,} ({tokens / total:.0%})")
+
+
+@app.command()
+def merge(
+    bundles: Annotated[
+        list[Path],
+        typer.Argument(help="Shard bundles written by 'build --shard'"),
+    ],
+    config: Annotated[
+        Path,
+        typer.Option("--config", "-c", help="Path to mkdocs.yml config file"),
+    ] = Path("mkdocs.yml"),
+    output_dir: Annotated[
+        Path,
+        typer.Option("--output-dir", "-o", help="Output directory"),
+    ] = Path("site"),
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            "-n",
+            help="Preview what would be generated without writing files",
+        ),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option("--quiet", "-q", help="Suppress output (exit code only)"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show detailed progress"),
+    ] = False,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            envvar="LLMSTXT_CACHE_DIR",
+            help="Reuse resolved config from this cache directory when unchanged",
+        ),
+    ] = None,
+    emit: Annotated[
+        list[Emit] | None,
+        typer.Option("--emit", help=_EMIT_HELP, show_default=False),
+    ] = None,
+    chunk_size: Annotated[
+        int,
+        typer.Option(
+            "--chunk-size", min=1, help="Maximum chunk size for --emit chunks"
+        ),
+    ] = 2000,
+    chunk_unit: Annotated[
+        SizeUnit,
+        typer.Option(
+            "--chunk-unit", help="Measure --chunk-size in bytes, characters or tokens"
+        ),
+    ] = SizeUnit.chars,
+    part_size: Annotated[
+        int,
+        typer.Option("--part-size", min=1, help="Maximum part size for --emit parts"),
+    ] = 1_000_000,
+    part_unit: Annotated[
+        SizeUnit,
+        typer.Option(
+            "--part-unit", help="Measure --part-size in bytes, characters or tokens"
+        ),
+    ] = SizeUnit.bytes,
+) -> None:
+    """Combine shard bundles into llms.txt, llms-full.txt and markdown files."""
+    from llmstxt_standalone.shard import merge_bundles, read_bundle
+
+    log, log_verbose = _make_logger(quiet, verbose)
+    exports = _Exports.from_options(emit, chunk_size, chunk_unit, part_size, part_unit)
+
+    if not config.exists():
+        log(f"Error: Config file not found: {config}", color="red", err=True)
+        raise typer.Exit(1)
+
+    cfg = _load_build_config(config, cache_dir, log)
+
+    try:
+        shard_bundles = [read_bundle(path) for path in bundles]
+    except OSError as exc:
+        log(f"Error reading shard bundle: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    except ValueError as exc:
+        log(f"Error: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+
+    with ExitStack() as staged:
+        # Full-content outputs stay staged until _write_build_outputs
+        full_writers = _open_full_writers(cfg, output_dir, exports, dry_run, log)
+        for full_writer in full_writers:
+            staged.enter_context(full_writer)
+        page_writers = _open_page_writers(cfg, output_dir, exports, dry_run, log)
+        with ExitStack() as stack:
+            for writer in page_writers:
+                stack.enter_context(writer)
+            try:
+                llms_build = merge_bundles(
+                    cfg,
+                    shard_bundles,
+                    on_page=_write_pages_to(page_writers),
+                    section_files=Emit.sections in exports.emit,
+                    full_writers=full_writers,
+                )
+            except OSError as exc:
+                log(f"Error writing page export: {exc}", color="red", err=True)
+                raise typer.Exit(1) from None
+            except ValueError as exc:
+                log(f"Error: {exc}", color="red", err=True)
+                raise typer.Exit(1) from None
+
+        log_verbose(f"Merged {len(shard_bundles)} shard bundles")
+        _write_build_outputs(
+            llms_build,
+            cfg,
+            output_dir,
+            dry_run,
+            log,
+            log_verbose,
+            page_writers=page_writers,
+            full_writers=full_writers,
+        )
+
+
+@app.command()
+def convert(
+    inputs: Annotated[
+        list[str],
+        typer.Argument(
+            help="HTML files, directories or glob patterns; '-' reads paths from stdin",
+            show_default=False,
+        ),
+    ],
+    output_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--output-dir",
+            "-o",
+            help="Write .md files to a tree mirroring the inputs (default: NDJSON to stdout)",
+        ),
+    ] = None,
+    base_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--base-dir",
+            help="Root of the mirrored tree [default: deepest common directory]",
+            show_default=False,
+        ),
+    ] = None,
+    content_selector: Annotated[
+        str | None,
+        typer.Option("--content-selector", help="CSS selector for main content"),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Workers for conversion (0 = one per CPU)",
+        ),
+    ] = 1,
+    executor: Annotated[
+        Executor,
+        typer.Option(
+            "--executor",
+            help="Run --jobs workers as processes, threads or subinterpreters "
+            "(interpreter: experimental; auto: threads on free-threaded Python)",
+        ),
+    ] = Executor.auto,
+    quiet: Annotated[
+        bool,
+        typer.Option("--quiet", "-q", help="Suppress output"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show detailed progress"),
+    ] = False,
+) -> None:
+    """Convert arbitrary HTML files to markdown."""
+    import json
+    import sys
+
+    from llmstxt_standalone.files import (
+        common_base_dir,
+        expand_inputs,
+        iter_file_results,
+        mirror_path,
+    )
+    from llmstxt_standalone.parallel import WorkerPool, resolve_jobs
+
+    log, log_verbose = _make_logger(quiet, verbose)
+    _check_executor(executor, log_verbose)
+
+    patterns = [
+        line.strip()
+        for pattern in inputs
+        for line in (sys.stdin if pattern == "-" else [pattern])
+        if line.strip()
+    ]
+    try:
+        paths = expand_inputs(patterns)
+    except ValueError as exc:
+        log(f"Error: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    if not paths:
+        log("Error: No input files given", color="red", err=True)
+        raise typer.Exit(1)
+
+    if output_dir is not None:
+        base_dir = base_dir or common_base_dir(paths)
+        try:
+            targets = [mirror_path(path, base_dir, output_dir) for path in paths]
+        except ValueError as exc:
+            log(f"Error: {exc}", color="red", err=True)
+            raise typer.Exit(1) from None
+    else:
+        targets = [None] * len(paths)
+
+    num_jobs = resolve_jobs(jobs)
+    failed = 0
+    with (
+        WorkerPool(num_jobs, executor=executor) if num_jobs > 1 else nullcontext()
+    ) as pool:
+        results = iter_file_results(
+            paths, content_selector, titles=output_dir is None, pool=pool
+        )
+        for result, target in zip(results, targets, strict=True):
+            if result.error is not None:
+                failed += 1
+                log(f"Error: {result.path}: {result.error}", color="red", err=True)
+            if target is None:
+                typer.echo(json.dumps(result.to_json(), ensure_ascii=False))
+            elif result.error is None:
+                try:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_text(result.content, encoding="utf-8")
+                except OSError as exc:
+                    failed += 1
+                    log(f"Error writing {target}: {exc}", color="red", err=True)
+                    continue
+                log_verbose(f"  {result.path} -> {target}")
+
+    if output_dir is not None:
+        converted = len(paths) - failed
+        log(f"Converted {converted} of {len(paths)} files to {output_dir}")
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def init(
     config: Annotated[
@@ -229,6 +1353,9 @@ def init(
     ] = False,
 ) -> None:
     """Add llmstxt plugin config to mkdocs.yml."""
+    from ruamel.yaml import YAML
+    from ruamel.yaml import YAMLError as RuamelYAMLError
+
     log, log_verbose = _make_logger(quiet, verbose)
 
     if not config.exists():
@@ -389,12 +1516,24 @@ def validate(
         bool,
         typer.Option("--verbose", "-v", help="Show detailed config information"),
     ] = False,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            envvar="LLMSTXT_CACHE_DIR",
+            help="Reuse resolved config from this cache directory when unchanged",
+        ),
+    ] = None,
 ) -> None:
     """Check config file validity."""
+    import yaml
+
+    from llmstxt_standalone.config import load_config_cached
+
     log, log_verbose = _make_logger(quiet, verbose)
 
     try:
-        cfg = load_config(config)
+        cfg = load_config_cached(config, cache_dir)
     except FileNotFoundError:
         log(f"Config invalid: {config}", color="red", err=True)
         log(f"  Error: File not found: {config}", color="red", err=True)
@@ -418,5 +1557,61 @@ def validate(
             log_verbose(f"    - {page}")
 
 
+@app.command()
+def daemon(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            envvar="LLMSTXT_SOCKET",
+            help="Unix socket to listen on [default: per-user runtime path]",
+            show_default=False,
+        ),
+    ] = None,
+    stop: Annotated[
+        bool,
+        typer.Option("--stop", help="Stop the running daemon and exit"),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option("--quiet", "-q", help="Suppress output"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Log each served request"),
+    ] = False,
+) -> None:
+    """Serve build, convert and validate from a warm process on a Unix socket."""
+    import signal
+    import sys
+
+    from llmstxt_standalone.client import default_socket_path
+    from llmstxt_standalone.daemon import serve, stop_daemon
+
+    log, log_verbose = _make_logger(quiet, verbose)
+    socket_path = socket_path or default_socket_path()
+
+    if stop:
+        try:
+            stop_daemon(socket_path)
+        except (OSError, ValueError):
+            log(f"Error: No daemon running on {socket_path}", color="red", err=True)
+            raise typer.Exit(1) from None
+        log(f"Stopped daemon on {socket_path}")
+        return
+
+    # Exit through the normal path on SIGTERM so the socket is removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    log(f"Listening on {socket_path}")
+    try:
+        serve(socket_path, log=log_verbose)
+    except (OSError, RuntimeError) as exc:
+        log(f"Error: {exc}", color="red", err=True)
+        raise typer.Exit(1) from None
+    except KeyboardInterrupt:
+        pass
+    log("Daemon stopped")
+
+
 if __name__ == "__main__":
     app()
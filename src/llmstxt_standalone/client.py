@@ -0,0 +1,154 @@
+"""Thin client that forwards CLI invocations to a running daemon.
+
+This module is the console entry point. It only uses the standard library, so
+a forwarded command never imports typer or the conversion stack. When no
+daemon is listening, the command runs in-process as usual.
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "DAEMON_COMMANDS",
+    "PROTOCOL_VERSION",
+    "default_socket_path",
+    "forward",
+    "main",
+    "package_version",
+    "send_request",
+]
+
+# Bump when the request or response layout changes
+PROTOCOL_VERSION = 2
+
+# Subcommands the daemon will run on behalf of a client
+DAEMON_COMMANDS = frozenset({"build", "convert", "validate"})
+
+# How long to wait for a daemon to accept before running locally
+_CONNECT_TIMEOUT = 1.0
+
+
+def default_socket_path() -> Path:
+    """Socket path from $LLMSTXT_SOCKET, else a per-user runtime path."""
+    if env_path := os.environ.get("LLMSTXT_SOCKET"):
+        return Path(env_path)
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "llmstxt-standalone.sock"
+    return Path(tempfile.gettempdir()) / f"llmstxt-standalone-{os.getuid()}.sock"
+
+
+@functools.cache
+def package_version() -> str:
+    """Installed version of llmstxt-standalone, or "" if not installed.
+
+    Client and daemon compare versions, so a daemon left running across an
+    upgrade never serves a newer client.
+    """
+    # Imported here: importlib.metadata is slow, and only needed to forward
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("llmstxt-standalone")
+    except PackageNotFoundError:
+        return ""
+
+
+def _is_own_socket(path: Path) -> bool:
+    """Whether path is a socket owned by the current user.
+
+    The fallback socket path lives in a world-writable directory, where
+    another user could create it first to read or fake forwarded commands.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def send_request(socket_path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    """Send one JSON request to the daemon and return its JSON response.
+
+    Raises:
+        OSError: If the daemon can't be reached or drops the connection.
+        ValueError: If the response is not a JSON object.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        sock.connect(str(socket_path))
+        # The command itself may run for as long as the build takes
+        sock.settimeout(None)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as f:
+            response = json.loads(f.read())
+    if not isinstance(response, dict):
+        raise ValueError("Daemon response is not a JSON object")
+    return response
+
+
+def forward(argv: list[str], socket_path: Path | None = None) -> int | None:
+    """Run a CLI command on the daemon, if one is listening.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+        socket_path: Daemon socket (defaults to default_socket_path()).
+
+    Returns:
+        The command's exit code, or None if it must run locally because it
+        isn't served by the daemon, LLMSTXT_NO_DAEMON is set, the socket
+        isn't one the current user owns, or no daemon answered (including
+        a daemon of another llmstxt-standalone version, which rejects it).
+    """
+    if not argv or argv[0] not in DAEMON_COMMANDS:
+        return None
+    if os.environ.get("LLMSTXT_NO_DAEMON"):
+        return None
+    socket_path = socket_path or default_socket_path()
+    if not _is_own_socket(socket_path):
+        return None
+
+    request: dict[str, Any] = {
+        "version": PROTOCOL_VERSION,
+        "package_version": package_version(),
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {k: v for k, v in os.environ.items() if k.startswith("LLMSTXT_")},
+        "color": sys.stdout.isatty(),
+    }
+    if "-" in argv[1:]:
+        # Arguments to read from stdin (convert -)
+        request["stdin"] = sys.stdin.read()
+    try:
+        response = send_request(socket_path, request)
+        exit_code = response["exit_code"]
+        stdout, stderr = response["stdout"], response["stderr"]
+    except (OSError, ValueError, KeyError):
+        if "stdin" in request:
+            # Hand the consumed input to the local run instead
+            sys.stdin = io.StringIO(request["stdin"])
+        return None
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return exit_code
+
+
+def main() -> None:
+    """Console entry point: forward to the daemon or run the CLI locally."""
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from llmstxt_standalone.cli import app
+
+    app()
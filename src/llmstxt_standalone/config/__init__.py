@@ -1,6 +1,7 @@
 """Configuration loading and resolution."""
 
+from llmstxt_standalone.config.cache import load_config_cached
 from llmstxt_standalone.config.load import load_config
 from llmstxt_standalone.config.model import Config
 
-__all__ = ["Config", "load_config"]
+__all__ = ["Config", "load_config", "load_config_cached"]
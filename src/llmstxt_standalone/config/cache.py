@@ -0,0 +1,177 @@
+"""On-disk cache of resolved configuration."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from llmstxt_standalone.config.load import load_config
+from llmstxt_standalone.config.model import Config
+
+__all__ = [
+    "ConfigCacheStats",
+    "config_cache_key",
+    "enable_memory_cache",
+    "load_config_cached",
+]
+
+# Bump when the cache file layout changes
+_CACHE_FORMAT = 2
+
+# Latest resolved config per config file, kept by long-running processes
+_memory_cache: dict[Path, tuple[str, Config]] | None = None
+
+
+@dataclass
+class ConfigCacheStats:
+    """Cache lookups counted by load_config_cached."""
+
+    # Configs served from memory or cache_dir
+    hits: int = 0
+    # Configs resolved from mkdocs.yml with a cache enabled
+    misses: int = 0
+
+
+def enable_memory_cache() -> None:
+    """Keep resolved configs in memory for the rest of the process.
+
+    Meant for long-running processes such as the daemon: repeated loads of an
+    unchanged config return a copy of the cached Config without touching YAML
+    or pydantic. Only the latest state of each config file is kept.
+    """
+    global _memory_cache
+    if _memory_cache is None:
+        _memory_cache = {}
+
+
+@functools.cache
+def _package_version() -> str:
+    """Installed version of llmstxt-standalone, or "" if not installed."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("llmstxt-standalone")
+    except PackageNotFoundError:
+        return ""
+
+
+def config_cache_key(config_path: Path, data: bytes) -> str:
+    """Compute the cache key for a config file.
+
+    The key covers the resolved path, size, mtime and content hash of the file,
+    plus the Config field names and the package version, so entries from an
+    older schema, or resolved by another release, never match.
+
+    Args:
+        config_path: Path to mkdocs.yml.
+        data: Current contents of the file.
+
+    Returns:
+        Hex digest identifying this exact config file state.
+    """
+    stat = config_path.stat()
+    parts = [
+        str(_CACHE_FORMAT),
+        ",".join(Config.model_fields),
+        _package_version(),
+        str(config_path.resolve()),
+        str(stat.st_size),
+        str(stat.st_mtime_ns),
+        hashlib.sha256(data).hexdigest(),
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_config_cached(
+    config_path: Path,
+    cache_dir: Path | None,
+    stats: ConfigCacheStats | None = None,
+) -> Config:
+    """Load config, reusing a previously resolved Config when unchanged.
+
+    On a hit, YAML parsing, pydantic validation and section derivation are
+    skipped entirely. Unreadable or corrupt cache entries are ignored. The
+    in-memory layer (see enable_memory_cache) is checked before cache_dir,
+    which holds one entry per config file: writing a new one removes the
+    entries for the file's earlier states.
+
+    Args:
+        config_path: Path to mkdocs.yml file.
+        cache_dir: Cache directory, or None to disable caching.
+        stats: Counts the lookup as a hit or miss, if caching is enabled.
+
+    Returns:
+        Resolved Config object.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist.
+        ValueError: If config is invalid.
+    """
+    if cache_dir is None and _memory_cache is None:
+        return load_config(config_path)
+    try:
+        data = config_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    except OSError:
+        return load_config(config_path)
+
+    key = config_cache_key(config_path, data)
+    resolved_path = config_path.resolve()
+    if _memory_cache is not None:
+        cached = _memory_cache.get(resolved_path)
+        if cached is not None and cached[0] == key:
+            if stats is not None:
+                stats.hits += 1
+            # Callers may mutate the Config, so never hand out the cached one
+            return cached[1].model_copy(deep=True)
+
+    # Entries are named by config file, then state, so old states can be pruned
+    prefix = _cache_entry_prefix(resolved_path)
+    entry = cache_dir / f"{prefix}{key}.json" if cache_dir is not None else None
+    config = _read_cache_entry(entry) if entry is not None else None
+    if stats is not None:
+        if config is None:
+            stats.misses += 1
+        else:
+            stats.hits += 1
+    if config is None:
+        config = load_config(config_path)
+        if entry is not None:
+            _write_cache_entry(entry, prefix, config)
+    if _memory_cache is not None:
+        _memory_cache[resolved_path] = (key, config.model_copy(deep=True))
+    return config
+
+
+def _cache_entry_prefix(resolved_path: Path) -> str:
+    path_hash = hashlib.sha256(str(resolved_path).encode("utf-8")).hexdigest()
+    return f"config-{path_hash[:16]}-"
+
+
+def _read_cache_entry(entry: Path) -> Config | None:
+    try:
+        cached = json.loads(entry.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if isinstance(cached, dict) and set(cached) == set(Config.model_fields):
+        return Config.model_construct(**cached)
+    return None
+
+
+def _write_cache_entry(entry: Path, prefix: str, config: Config) -> None:
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(config.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, entry)
+    except OSError:
+        return
+    # Entries for earlier states of the same config file can't match again
+    for stale in entry.parent.glob(f"{prefix}*.json"):
+        if stale != entry:
+            stale.unlink(missing_ok=True)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError, field_validator
@@ -11,12 +11,18 @@ from pydantic import BaseModel, Field, ValidationError, field_validator
 from llmstxt_standalone.config.derive import nav_to_sections
 from llmstxt_standalone.config.model import Config
 from llmstxt_standalone.config.plugin import get_llmstxt_config
+from llmstxt_standalone.tokens import DEFAULT_TOKENIZER
 
 DEFAULT_SITE_NAME = "Documentation"
 DEFAULT_FULL_OUTPUT = "llms-full.txt"
 
+# Maximum nesting of mappings/sequences in a config file. The pure-Python
+# parser recurses per level and hits RecursionError somewhere past this;
+# libyaml does not, so the limit is enforced explicitly for both.
+_MAX_NESTING_DEPTH = 256
 
-class _PermissiveLoader(yaml.SafeLoader):
+
+class _PurePermissiveLoader(yaml.SafeLoader):
     """SafeLoader that ignores unknown Python tags.
 
     MkDocs extensions like pymdownx.slugs use Python-specific YAML tags
@@ -30,9 +36,49 @@ def _ignore_unknown(loader: yaml.Loader, tag_suffix: str, node: yaml.Node) -> st
     return f"<{node.tag}>"
 
 
-# Register handler for all Python tags (both full and shorthand forms)
-_PermissiveLoader.add_multi_constructor("tag:yaml.org,2002:python/", _ignore_unknown)
-_PermissiveLoader.add_multi_constructor("!python/", _ignore_unknown)
+def _register_python_tags(
+    loader: type[yaml.SafeLoader] | type[yaml.CSafeLoader],
+) -> None:
+    """Register handlers for all Python tags (both full and shorthand forms)."""
+    loader.add_multi_constructor("tag:yaml.org,2002:python/", _ignore_unknown)
+    loader.add_multi_constructor("!python/", _ignore_unknown)
+
+
+_register_python_tags(_PurePermissiveLoader)
+
+if getattr(yaml, "__with_libyaml__", False):
+
+    class _CPermissiveLoader(yaml.CSafeLoader):
+        """libyaml-backed equivalent of _PurePermissiveLoader."""
+
+    _register_python_tags(_CPermissiveLoader)
+    _PermissiveLoader: type[yaml.SafeLoader] | type[yaml.CSafeLoader] = (
+        _CPermissiveLoader
+    )
+else:
+    _PermissiveLoader = _PurePermissiveLoader
+
+
+def _exceeds_nesting_depth(data: Any, limit: int = _MAX_NESTING_DEPTH) -> bool:
+    """Check whether containers in data nest deeper than limit.
+
+    Iterative, and revisits a shared (aliased) node only when reached at a
+    greater depth, so YAML alias bombs and self-referencing anchors stay cheap.
+    """
+    seen: dict[int, int] = {}
+    stack: list[tuple[Any, int]] = [(data, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if depth > limit:
+            return True
+        if seen.get(id(node), 0) >= depth:
+            continue
+        seen[id(node)] = depth
+        children = node.values() if isinstance(node, dict) else node
+        stack.extend(
+            (child, depth + 1) for child in children if isinstance(child, (dict, list))
+        )
+    return False
 
 
 class LlmstxtPluginConfig(BaseModel):
@@ -42,6 +88,13 @@ class LlmstxtPluginConfig(BaseModel):
     full_output: str = DEFAULT_FULL_OUTPUT
     content_selector: str | None = None
     sections: dict[str, list[str]] = Field(default_factory=dict)
+    max_full_tokens: int | None = Field(default=None, gt=0)
+    max_page_tokens: int | None = Field(default=None, gt=0)
+    token_budget_action: Literal["warn", "fail", "truncate"] = "warn"
+    tokenizer: str = DEFAULT_TOKENIZER
+    dedup: bool = False
+    dedup_min_chars: int = Field(default=200, gt=0)
+    dedup_similarity: float = Field(default=0.8, gt=0, le=1)
 
     @field_validator("sections", mode="before")
     @classmethod
@@ -120,13 +173,15 @@ def load_config(config_path: Path) -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    too_deep = f"Config file has nav structure too deeply nested: {config_path}"
     try:
         with open(config_path, encoding="utf-8") as f:
             raw = yaml.load(f, Loader=_PermissiveLoader)
     except RecursionError:
-        raise ValueError(
-            f"Config file has nav structure too deeply nested: {config_path}"
-        ) from None
+        raise ValueError(too_deep) from None
+
+    if isinstance(raw, (dict, list)) and _exceeds_nesting_depth(raw):
+        raise ValueError(too_deep)
 
     if not isinstance(raw, dict):
         raise ValueError(f"Config file must be a mapping: {config_path}")
@@ -153,11 +208,23 @@ def _config_from_mkdocs(raw: dict[str, Any]) -> Config:
         markdown_description = plugin.markdown_description
         full_output = plugin.full_output
         content_selector = plugin.content_selector
+        options = plugin.model_dump(
+            include={
+                "max_full_tokens",
+                "max_page_tokens",
+                "token_budget_action",
+                "tokenizer",
+                "dedup",
+                "dedup_min_chars",
+                "dedup_similarity",
+            }
+        )
     else:
         sections = nav_to_sections(mkdocs.nav)
         markdown_description = ""
         full_output = DEFAULT_FULL_OUTPUT
         content_selector = None
+        options = {}
 
     return Config(
         site_name=mkdocs.site_name,
@@ -169,4 +236,5 @@ def _config_from_mkdocs(raw: dict[str, Any]) -> Config:
         sections=sections,
         nav=mkdocs.nav,
         use_directory_urls=mkdocs.use_directory_urls,
+        **options,
     )
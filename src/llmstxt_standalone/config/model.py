@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -19,6 +20,17 @@ class Config(BaseModel):
     sections: dict[str, list[str]]
     nav: list[Any]
     use_directory_urls: bool = True
+    max_full_tokens: int | None = None
+    max_page_tokens: int | None = None
+    token_budget_action: Literal["warn", "fail", "truncate"] = "warn"
+    tokenizer: str = "estimate"
+    dedup: bool = False
+    dedup_min_chars: int = 200
+    dedup_similarity: float = 0.8
+
+    def fingerprint(self) -> str:
+        """Hash of the resolved settings, stable across machines and paths."""
+        return hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()
 
     def get_nav_title(self, md_path: str) -> str | None:
         """Find the title for a page from the nav structure only.
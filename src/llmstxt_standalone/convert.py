@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import threading
+
 import mdformat
 from bs4 import BeautifulSoup, NavigableString, Tag
 from markdownify import ATX, MarkdownConverter
 
+from llmstxt_standalone.trace import Tracer, maybe_span
+
 __all__ = [
     "extract_title_from_html",
     "html_to_markdown",
 ]
 
+# Per-thread conversion state (see _converter)
+_local = threading.local()
+
 
 def _should_remove(tag: Tag) -> bool:
     """Check if a tag should be removed during autoclean."""
@@ -85,6 +92,18 @@ def _make_converter() -> MarkdownConverter:
     )
 
 
+def _converter() -> MarkdownConverter:
+    """This thread's MarkdownConverter, created on first use.
+
+    A converter fills a cache of tag handlers as it converts, so each
+    thread gets its own instead of sharing one with other conversion threads.
+    """
+    converter = getattr(_local, "converter", None)
+    if converter is None:
+        converter = _local.converter = _make_converter()
+    return converter
+
+
 def extract_title_from_html(html: str, site_name: str | None = None) -> str | None:
     """Extract page title from HTML.
 
@@ -122,18 +141,25 @@ def extract_title_from_html(html: str, site_name: str | None = None) -> str | No
     return None
 
 
-def html_to_markdown(html: str, content_selector: str | None = None) -> str:
+def html_to_markdown(
+    html: str,
+    content_selector: str | None = None,
+    *,
+    tracer: Tracer | None = None,
+) -> str:
     """Convert HTML to clean Markdown.
 
     Args:
         html: Raw HTML content.
         content_selector: Optional CSS selector for main content.
             Defaults to Material for MkDocs selectors.
+        tracer: Optional tracer receiving parse/convert/format spans.
 
     Returns:
         Cleaned Markdown text.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    with maybe_span(tracer, "parse"):
+        soup = BeautifulSoup(html, "html.parser")
 
     # Find main content
     if content_selector:
@@ -159,7 +185,8 @@ def html_to_markdown(html: str, content_selector: str | None = None) -> str:
     if content is None:
         return ""
 
-    _autoclean(content)
-    converter = _make_converter()
-    md = converter.convert_soup(content)
-    return mdformat.text(md, options={"wrap": "no"}, extensions=("tables",))
+    with maybe_span(tracer, "convert"):
+        _autoclean(content)
+        md = _converter().convert_soup(content)
+    with maybe_span(tracer, "format"):
+        return mdformat.text(md, options={"wrap": "no"}, extensions=("tables",))
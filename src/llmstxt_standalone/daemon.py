@@ -0,0 +1,212 @@
+"""Long-running daemon that serves CLI commands over a Unix socket.
+
+The daemon keeps imports, resolved configs (see enable_memory_cache) and
+soupsieve's compiled-selector cache warm across requests, so a forwarded
+`build`, `convert` or `validate` skips interpreter and import start-up.
+
+Protocol: a client connects, sends one JSON object and half-closes the
+connection; the daemon replies with one JSON object and closes. A request is
+either ``{"version", "package_version", "argv", "cwd", "env", "color"}``
+(plus ``stdin`` when an argument is ``-``) to run a CLI command or
+``{"version", "shutdown": true}`` to stop the daemon. Command responses carry
+``exit_code``, ``stdout`` and ``stderr``; rejected requests carry ``error``.
+Commands from a client of another llmstxt-standalone version are rejected,
+so the client runs them itself rather than on the daemon's stale code.
+Requests are served one at a time because each runs in the client's working
+directory and environment.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout, suppress
+from pathlib import Path
+from typing import Any
+
+from llmstxt_standalone.client import (
+    DAEMON_COMMANDS,
+    PROTOCOL_VERSION,
+    package_version,
+    send_request,
+)
+from llmstxt_standalone.config.cache import enable_memory_cache
+
+__all__ = ["daemon_is_running", "handle_request", "serve", "stop_daemon"]
+
+
+def daemon_is_running(socket_path: Path) -> bool:
+    """Whether a daemon accepts connections on socket_path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(str(socket_path))
+    except OSError:
+        return False
+    return True
+
+
+def stop_daemon(socket_path: Path) -> None:
+    """Ask the daemon on socket_path to shut down.
+
+    Raises:
+        OSError: If no daemon is listening.
+    """
+    send_request(socket_path, {"version": PROTOCOL_VERSION, "shutdown": True})
+
+
+@contextmanager
+def _client_context(
+    cwd: str, env: dict[str, str], stdin: str
+) -> Generator[None, None, None]:
+    """Run in the client's working directory, environment and stdin."""
+    saved_cwd, saved_stdin = os.getcwd(), sys.stdin
+    saved_env = {k: v for k, v in os.environ.items() if k.startswith("LLMSTXT_")}
+    for key in saved_env:
+        del os.environ[key]
+    os.environ.update(env)
+    sys.stdin = io.StringIO(stdin)
+    try:
+        os.chdir(cwd)
+        yield
+    finally:
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+        for key in [k for k in os.environ if k.startswith("LLMSTXT_")]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Run one forwarded CLI command and capture its result.
+
+    Args:
+        request: Decoded request object (see the module docstring).
+
+    Returns:
+        Response object with exit_code, stdout and stderr, or error.
+    """
+    from llmstxt_standalone.cli import app
+
+    if request.get("version") != PROTOCOL_VERSION:
+        return {"error": f"Unsupported protocol version {request.get('version')!r}"}
+    if request.get("package_version") != package_version():
+        return {
+            "error": f"Daemon runs llmstxt-standalone {package_version()}, "
+            f"client {request.get('package_version')!r}"
+        }
+    argv, cwd, env = request.get("argv"), request.get("cwd"), request.get("env", {})
+    if (
+        not isinstance(argv, list)
+        or not argv
+        or not all(isinstance(arg, str) for arg in argv)
+        or argv[0] not in DAEMON_COMMANDS
+    ):
+        return {"error": f"Daemon only runs: {', '.join(sorted(DAEMON_COMMANDS))}"}
+    stdin = request.get("stdin", "")
+    if not isinstance(cwd, str) or not isinstance(env, dict):
+        return {"error": "Request needs a cwd string and an env object"}
+    if not isinstance(stdin, str):
+        return {"error": "Request stdin must be a string"}
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    try:
+        with (
+            _client_context(cwd, env, stdin),
+            redirect_stdout(stdout),
+            redirect_stderr(stderr),
+        ):
+            try:
+                app(
+                    args=argv,
+                    prog_name="llmstxt-standalone",
+                    color=bool(request.get("color")),
+                )
+            except SystemExit as exc:
+                code = exc.code
+                exit_code = code if isinstance(code, int) else int(code is not None)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    except OSError as exc:
+        # The client's working directory is gone or unreadable
+        return {"error": str(exc)}
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _serve_connection(conn: socket.socket, log: Callable[[str], None] | None) -> bool:
+    """Answer one client connection; return True if asked to shut down."""
+    request: dict[str, Any] = {}
+    try:
+        with conn.makefile("rb") as f:
+            request = json.loads(f.read())
+        if not isinstance(request, dict):
+            raise ValueError("request is not a JSON object")
+    except (OSError, ValueError) as exc:
+        response: dict[str, Any] = {"error": f"Bad request: {exc}"}
+    else:
+        if request.get("shutdown"):
+            response = {"exit_code": 0, "stdout": "", "stderr": ""}
+        else:
+            start = time.perf_counter()
+            response = handle_request(request)
+            if log is not None:
+                elapsed = time.perf_counter() - start
+                status = response.get("exit_code", "rejected")
+                log(f"{request.get('argv')} -> {status} ({elapsed:.2f}s)")
+    with suppress(OSError):
+        conn.sendall(json.dumps(response).encode("utf-8"))
+    return bool(request.get("shutdown"))
+
+
+def serve(socket_path: Path, log: Callable[[str], None] | None = None) -> None:
+    """Listen on socket_path and serve requests until asked to shut down.
+
+    The socket is created readable and writable by the current user only and
+    removed on exit.
+
+    Args:
+        socket_path: Unix socket to listen on.
+        log: Optional callback receiving one line per served request.
+
+    Raises:
+        RuntimeError: If another daemon is already listening on socket_path.
+        OSError: If the socket can't be created.
+    """
+    if daemon_is_running(socket_path):
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    enable_memory_cache()
+    # Pay for the CLI and conversion stack once, before the first request
+    import llmstxt_standalone.cli
+    import llmstxt_standalone.generate  # noqa: F401
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    try:
+        server.listen()
+        shutdown = False
+        while not shutdown:
+            conn, _ = server.accept()
+            with conn:
+                shutdown = _serve_connection(conn, log)
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
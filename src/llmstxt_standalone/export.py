@@ -0,0 +1,266 @@
+"""Structured per-page export for ingestion pipelines."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from llmstxt_standalone.config import Config
+from llmstxt_standalone.generate import (
+    PageMarkdown,
+    PageResult,
+    md_path_to_html_url,
+    md_path_to_page_url,
+    write_markdown_files,
+)
+
+if TYPE_CHECKING:
+    from llmstxt_standalone.trace import Tracer
+
+__all__ = [
+    "JSONL_FILENAME",
+    "HeldPageWriter",
+    "JsonlPageWriter",
+    "MarkdownPageWriter",
+    "PageWriter",
+    "page_record",
+]
+
+# Default JSONL export filename, next to llms.txt
+JSONL_FILENAME = "llms-pages.jsonl"
+
+
+def page_record(config: Config, result: PageResult, section: str) -> dict[str, Any]:
+    """Build the JSONL record for one converted page.
+
+    Args:
+        config: Resolved configuration.
+        result: Converted (not skipped) page result.
+        section: Section the page is listed under.
+
+    Returns:
+        Record with md_path, url (the rendered page), markdown_url, title,
+        section, markdown, bytes, chars and sha256 (of the UTF-8 markdown).
+    """
+    markdown = result.text
+    data = markdown.encode("utf-8")
+    return {
+        "md_path": result.md_path,
+        "url": md_path_to_html_url(
+            config.site_url, result.md_path, config.use_directory_urls
+        ),
+        "markdown_url": md_path_to_page_url(
+            config.site_url, result.md_path, config.use_directory_urls
+        ),
+        "title": result.title,
+        "section": section,
+        "markdown": markdown,
+        "bytes": len(data),
+        "chars": len(markdown),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+class PageWriter(ABC):
+    """Base for exports written incrementally as pages finish.
+
+    write() receives each distinct page's result in nav order, as passed to
+    build_llms_output's on_page callback. A page listed in several sections
+    belongs to the first section that lists it.
+    """
+
+    # What one counted item is, for progress output
+    noun = "records"
+
+    def __init__(self, config: Config, path: Path, dry_run: bool = False) -> None:
+        """Set up the writer.
+
+        Args:
+            config: Resolved configuration.
+            path: Main output file, reported in progress output.
+            dry_run: If True, count without writing anything.
+        """
+        self.config = config
+        self.path = path
+        self.dry_run = dry_run
+        self.count = 0
+        self._sections: dict[str, str] = {}
+        for section_name, pages in config.sections.items():
+            for md_path in pages:
+                self._sections.setdefault(md_path, section_name)
+
+    @abstractmethod
+    def write(self, result: PageResult) -> None:
+        """Export one finished page."""
+
+    def close(self) -> None:  # noqa: B027
+        """Finish the export; nothing to do unless the writer holds a file."""
+
+    def __enter__(self) -> PageWriter:
+        """Return the writer for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Finish the export."""
+        self.close()
+
+
+class JsonlPageWriter(PageWriter):
+    """Stream one JSON record per converted page to a file.
+
+    Records are written and flushed as pages finish, in nav order. Skipped
+    pages have no record. Subclasses override records() to export something
+    other than whole pages.
+    """
+
+    noun = "pages"
+
+    def __init__(self, config: Config, path: Path, dry_run: bool = False) -> None:
+        """Open path for writing, creating parent directories.
+
+        Args:
+            config: Resolved configuration.
+            path: JSONL file to write.
+            dry_run: If True, count records without writing anything.
+
+        Raises:
+            OSError: If the file can't be created.
+        """
+        super().__init__(config, path, dry_run=dry_run)
+        self._file: IO[str] | None = None
+        if not dry_run:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "w", encoding="utf-8")  # noqa: SIM115
+
+    def records(self, result: PageResult, section: str) -> Iterator[dict[str, Any]]:
+        """Records exported for one converted page."""
+        yield page_record(self.config, result, section)
+
+    def write(self, result: PageResult) -> None:
+        """Write the records for a finished page (no-op for skipped pages)."""
+        if result.skip_reason is not None:
+            return
+        section = self._sections[result.md_path]
+        lines = [
+            json.dumps(record, ensure_ascii=False) + "\n"
+            for record in self.records(result, section)
+        ]
+        if self._file is not None:
+            self._file.writelines(lines)
+            self._file.flush()
+        self.count += len(lines)
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+
+
+class MarkdownPageWriter(PageWriter):
+    """Write each converted page's markdown file as soon as the page finishes.
+
+    The streamed counterpart of write_markdown_files(), so disk writes
+    overlap with conversion of later pages instead of following the build.
+    """
+
+    noun = "markdown files"
+
+    def __init__(
+        self,
+        config: Config,
+        output_dir: Path,
+        dry_run: bool = False,
+        tracer: Tracer | None = None,
+    ) -> None:
+        """Set up the writer.
+
+        Args:
+            config: Resolved configuration.
+            output_dir: Directory the markdown files are written under.
+            dry_run: If True, collect paths without writing anything.
+            tracer: Optional tracer receiving a "write" span per page.
+        """
+        super().__init__(config, output_dir, dry_run=dry_run)
+        self.tracer = tracer
+        # Output markdown paths (written or would-be), in nav order
+        self.paths: list[Path] = []
+
+    def write(self, result: PageResult) -> None:
+        """Write a finished page's markdown file (no-op for skipped pages).
+
+        Raises:
+            OSError: If the file can't be written.
+            ValueError: If the output path resolves outside output_dir.
+        """
+        if result.skip_reason is not None:
+            return
+        self.paths.extend(
+            write_markdown_files(
+                [PageMarkdown(result.md_path, result.content)],
+                self.path,
+                self.config.use_directory_urls,
+                dry_run=self.dry_run,
+                tracer=self.tracer,
+            )
+        )
+        self.count += 1
+
+
+class HeldPageWriter(PageWriter):
+    """Hold finished pages back, to write them with other writers later.
+
+    For builds that can still fail once every page has converted, such as
+    one with a token budget that fails the build: the writers are only
+    opened, and their files only touched, when release() is called. Held
+    pages keep their content as the build stored it (see PageResult), so
+    with a PageStore they take no more memory than the store allows.
+    """
+
+    noun = "pages"
+
+    def __init__(
+        self,
+        config: Config,
+        path: Path,
+        open_writers: Callable[[], list[PageWriter]],
+    ) -> None:
+        """Set up the writer.
+
+        Args:
+            config: Resolved configuration.
+            path: Output directory, reported in progress output.
+            open_writers: Opens the writers the held pages are written to.
+        """
+        super().__init__(config, path)
+        self._open_writers = open_writers
+        self._results: list[PageResult] = []
+
+    def write(self, result: PageResult) -> None:
+        """Hold a finished page."""
+        self._results.append(result)
+        self.count += 1
+
+    def release(self) -> list[PageWriter]:
+        """Open the writers, write every held page to them and close them.
+
+        Returns:
+            The closed writers, for progress output.
+
+        Raises:
+            OSError: If a writer can't write its output.
+            ValueError: If a writer rejects a page, e.g. an unsafe path.
+        """
+        writers = self._open_writers()
+        with ExitStack() as stack:
+            for writer in writers:
+                stack.enter_context(writer)
+            for result in self._results:
+                for writer in writers:
+                    writer.write(result)
+        self._results.clear()
+        return writers
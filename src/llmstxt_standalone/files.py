@@ -0,0 +1,181 @@
+"""Converting standalone HTML files outside a MkDocs build."""
+
+from __future__ import annotations
+
+import glob
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from llmstxt_standalone.generate import (
+    ConvertOutcome,
+    ConvertRequest,
+    convert_html,
+)
+
+if TYPE_CHECKING:
+    from llmstxt_standalone.parallel import WorkerPool
+
+__all__ = [
+    "FileResult",
+    "common_base_dir",
+    "expand_inputs",
+    "iter_file_results",
+    "mirror_path",
+]
+
+
+@dataclass
+class FileResult:
+    """Outcome of converting one HTML file."""
+
+    path: Path
+    title: str | None = None
+    content: str = ""
+    error: str | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        """Record for NDJSON output."""
+        if self.error is not None:
+            return {"path": str(self.path), "error": self.error}
+        return {"path": str(self.path), "title": self.title, "markdown": self.content}
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[Path]:
+    """Expand input arguments into a de-duplicated list of HTML files.
+
+    Each pattern is a file, a directory (every ``*.html`` beneath it, sorted)
+    or a glob pattern (``**`` matches across directories).
+
+    Args:
+        patterns: Paths, directories or glob patterns.
+
+    Returns:
+        Files in argument order, each listed once.
+
+    Raises:
+        ValueError: If a pattern matches nothing.
+    """
+    files: dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*.html") if p.is_file())
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = [Path(p) for p in sorted(glob.glob(pattern, recursive=True))]
+            matches = [p for p in matches if p.is_file()]
+        if not matches:
+            raise ValueError(f"No files match {pattern}")
+        files.update(dict.fromkeys(matches))
+    return list(files)
+
+
+def common_base_dir(paths: Iterable[Path]) -> Path:
+    """Deepest directory containing every path (the default mirror root)."""
+    return Path(os.path.commonpath([path.absolute().parent for path in paths]))
+
+
+def mirror_path(path: Path, base_dir: Path, out_dir: Path) -> Path:
+    """Output path for a file in a tree mirroring base_dir under out_dir.
+
+    Raises:
+        ValueError: If path is not inside base_dir.
+    """
+    try:
+        relative = path.absolute().relative_to(base_dir.absolute())
+    except ValueError:
+        raise ValueError(f"{path} is outside base directory {base_dir}") from None
+    return out_dir / relative.with_suffix(".md")
+
+
+def _read_file(path: Path) -> str | FileResult:
+    try:
+        return path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return FileResult(path, error="HTML file has encoding errors")
+    except OSError as exc:
+        return FileResult(path, error=f"Failed to read HTML file: {exc}")
+
+
+def _request(
+    path: Path,
+    html: str,
+    content_selector: str | None,
+    titles: bool,
+    spill_dir: str | None = None,
+) -> ConvertRequest:
+    return ConvertRequest(
+        md_path=str(path),
+        html=html,
+        content_selector=content_selector,
+        site_name="",
+        extract_title=titles,
+        spill_dir=spill_dir,
+    )
+
+
+def _finish_file(path: Path, outcome: ConvertOutcome) -> FileResult:
+    if outcome.skip_reason is not None:
+        return FileResult(path, error=outcome.skip_reason)
+    if outcome.error is not None:
+        return FileResult(path, error=f"Failed to convert HTML: {outcome.error}")
+    return FileResult(path, title=outcome.html_title, content=outcome.load_content())
+
+
+def iter_file_results(
+    paths: Iterable[Path],
+    content_selector: str | None = None,
+    titles: bool = False,
+    pool: WorkerPool | None = None,
+) -> Iterator[FileResult]:
+    """Convert HTML files, yielding results in input order.
+
+    Files are read here; with a pool, conversion runs on the workers with
+    pool.window files in flight.
+
+    Args:
+        paths: HTML files to convert.
+        content_selector: Optional CSS selector for main content.
+        titles: Whether to extract each file's title.
+        pool: Optional worker pool for conversion.
+
+    Yields:
+        One FileResult per path, in input order.
+    """
+    if pool is None:
+        for path in paths:
+            html = _read_file(path)
+            if isinstance(html, FileResult):
+                yield html
+            else:
+                request = _request(path, html, content_selector, titles)
+                yield _finish_file(path, convert_html(request))
+        return
+
+    # Failed reads, or files awaiting their conversion future
+    pending: deque[FileResult | tuple[Path, Future[ConvertOutcome]]] = deque()
+
+    def finish() -> FileResult:
+        entry = pending.popleft()
+        if isinstance(entry, FileResult):
+            return entry
+        path, future = entry
+        return _finish_file(path, future.result())
+
+    for path in paths:
+        html = _read_file(path)
+        if isinstance(html, FileResult):
+            pending.append(html)
+        else:
+            request = _request(path, html, content_selector, titles, pool.spill_dir)
+            pending.append((path, pool.submit(convert_html, request)))
+        while len(pending) > pool.window:
+            yield finish()
+    while pending:
+        yield finish()
@@ -0,0 +1,209 @@
+"""llms-full.txt and section files, written as pages finish."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import IO
+
+from llmstxt_standalone.config import Config
+from llmstxt_standalone.generate import (
+    FullBlock,
+    FullTextWriter,
+    ensure_safe_md_path,
+    full_header_lines,
+    section_full_outputs,
+)
+
+__all__ = ["FullFileWriter", "SectionFilesWriter", "StagedFile"]
+
+
+class StagedFile:
+    """A file written under a temporary name next to its final path.
+
+    commit() renames it into place, so readers never see a partial file and
+    a build that fails leaves the previous file untouched; discard() removes
+    it, along with any directories created for it. In dry-run mode nothing
+    is written, but bytes are still counted.
+    """
+
+    def __init__(self, path: Path, dry_run: bool = False) -> None:
+        """Create the temporary file, and path's parent directories.
+
+        Raises:
+            OSError: If the file can't be created.
+        """
+        self.path = path
+        self.bytes = 0
+        self._tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        self._file: IO[bytes] | None = None
+        self._staged = not dry_run
+        # Directories created for the file, innermost first
+        self._created: list[Path] = []
+        if self._staged:
+            parent = path.parent
+            while not parent.exists():
+                self._created.append(parent)
+                parent = parent.parent
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._tmp_path, "wb")  # noqa: SIM115
+
+    def write(self, text: str) -> int:
+        """Append text as UTF-8, returning the number of bytes it took.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        data = text.encode("utf-8")
+        self.bytes += len(data)
+        if self._file is not None:
+            self._file.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        """Close the file, keeping it staged for commit() or discard()."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def commit(self) -> None:
+        """Close the file and rename it to path.
+
+        Raises:
+            OSError: If the file can't be renamed.
+        """
+        self.close()
+        if self._staged:
+            os.replace(self._tmp_path, self.path)
+            self._staged = False
+
+    def discard(self) -> None:
+        """Close and remove the file, unless it was committed."""
+        self.close()
+        if self._staged:
+            self._tmp_path.unlink(missing_ok=True)
+            self._staged = False
+            for directory in self._created:
+                if any(directory.iterdir()):
+                    # Still holds other files
+                    break
+                directory.rmdir()
+
+
+class FullFileWriter(FullTextWriter):
+    """Write llms-full.txt block by block as pages finish (see FullText).
+
+    The file is staged next to its path until commit(), so the whole text
+    is never held in memory and a failed build leaves the previous file in
+    place.
+    """
+
+    def __init__(self, config: Config, out_dir: Path, dry_run: bool = False) -> None:
+        """Stage the file and write its header.
+
+        Args:
+            config: Resolved configuration.
+            out_dir: Output directory; the path is config.full_output in it.
+            dry_run: If True, count bytes without writing anything.
+
+        Raises:
+            OSError: If the file can't be created.
+            ValueError: If config.full_output is not a safe relative path.
+        """
+        self.path = out_dir / ensure_safe_md_path(config.full_output)
+        self._file = StagedFile(self.path, dry_run)
+        self._file.write("\n".join(full_header_lines(config, config.site_name)))
+
+    @property
+    def bytes(self) -> int:
+        """Size of the file in bytes."""
+        return self._file.bytes
+
+    def write(self, block: FullBlock) -> None:
+        """Append a block.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        self._file.write(f"\n{block.text}")
+
+    def commit(self) -> None:
+        """Put the file in place.
+
+        Raises:
+            OSError: If the file can't be renamed.
+        """
+        self._file.commit()
+
+    def close(self) -> None:
+        """Discard the file unless it was committed."""
+        self._file.discard()
+
+
+class SectionFilesWriter(FullTextWriter):
+    """Write one full-content file per section as pages finish.
+
+    Each file (see section_full_outputs) holds its section's blocks of
+    llms-full.txt under a "# Site: Section" header. Only sections with a
+    converted page get a file. Files are staged until commit().
+    """
+
+    def __init__(self, config: Config, out_dir: Path, dry_run: bool = False) -> None:
+        """Set up the writer; files are created as sections are reached.
+
+        Args:
+            config: Resolved configuration.
+            out_dir: Output directory the section paths are relative to.
+            dry_run: If True, count bytes without writing anything.
+        """
+        self.config = config
+        self.out_dir = out_dir
+        self.dry_run = dry_run
+        self._outputs = section_full_outputs(config)
+        self._files: list[StagedFile] = []
+
+    @property
+    def paths(self) -> list[Path]:
+        """Paths of the section files, in section order."""
+        return [file.path for file in self._files]
+
+    @property
+    def bytes(self) -> int:
+        """Total size of the section files in bytes."""
+        return sum(file.bytes for file in self._files)
+
+    def begin_section(self, section: str) -> None:
+        """Stage the section's file and write its header.
+
+        Raises:
+            OSError: If the file can't be created.
+        """
+        if self._files:
+            self._files[-1].close()
+        path = self.out_dir / self._outputs[section]
+        self._files.append(StagedFile(path, self.dry_run))
+        title = f"{self.config.site_name}: {section}"
+        self._files[-1].write("\n".join(full_header_lines(self.config, title)))
+
+    def write(self, block: FullBlock) -> None:
+        """Append a block to its section's file.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        self._files[-1].write(f"\n{block.text}")
+
+    def commit(self) -> None:
+        """Put every section file in place.
+
+        Raises:
+            OSError: If a file can't be renamed.
+        """
+        for file in self._files:
+            file.commit()
+
+    def close(self) -> None:
+        """Discard section files that weren't committed."""
+        # Last first, so the first file can remove directories it created
+        for file in reversed(self._files):
+            file.discard()
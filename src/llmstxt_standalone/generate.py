@@ -2,22 +2,70 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
+import hashlib
+import heapq
+import re
+import signal
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any
 
-from llmstxt_standalone.config import Config
 from llmstxt_standalone.convert import extract_title_from_html, html_to_markdown
+from llmstxt_standalone.dedup import BlockDeduplicator
+from llmstxt_standalone.pagestore import PageStore, load_page_text, stored_size
+from llmstxt_standalone.siteindex import SiteIndex
+from llmstxt_standalone.spill import (
+    SPILL_MIN_BYTES,
+    SpillHandle,
+    read_spilled,
+    spill_text,
+)
+from llmstxt_standalone.tokens import get_tokenizer, truncate_to_tokens
+from llmstxt_standalone.trace import Span, Tracer, maybe_span
+
+if TYPE_CHECKING:
+    # Only for annotations: subinterpreter workers import this module, and
+    # pydantic's compiled core can't be loaded in a subinterpreter
+    from llmstxt_standalone.checkpoint import Checkpoint
+    from llmstxt_standalone.config import Config
+    from llmstxt_standalone.parallel import WorkerPool
 
 __all__ = [
     "BuildResult",
+    "ConvertOutcome",
+    "ConvertRequest",
+    "FullBlock",
+    "FullText",
+    "FullTextWriter",
     "GenerateResult",
     "PageMarkdown",
+    "PageResult",
+    "assemble_llms_output",
     "build_llms_output",
+    "convert_batch",
+    "convert_html",
     "ensure_safe_md_path",
+    "full_header_lines",
     "generate_llms_txt",
+    "iter_build_results",
+    "iter_page_paths",
+    "iter_page_results",
     "md_path_to_html_path",
+    "md_path_to_html_url",
     "md_path_to_output_md_path",
     "md_path_to_page_url",
+    "process_page",
+    "section_full_outputs",
     "write_markdown_files",
 ]
 
@@ -41,6 +89,14 @@ def _escape_markdown_link_text(text: str) -> str:
     )
 
 
+def _decode_html(raw: bytes) -> str:
+    """Decode UTF-8 HTML bytes with universal newlines, like Path.read_text."""
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def _is_index_md(md_path: str) -> bool:
     return md_path == "index.md" or md_path.endswith("/index.md")
 
@@ -73,6 +129,15 @@ def _ensure_within_dir(base_dir: Path, path: Path, label: str) -> Path:
     return path
 
 
+def _html_rel_path(md_path: str, use_directory_urls: bool) -> Path:
+    """HTML path relative to the site directory (not checked for symlinks)."""
+    # Handle index.md at any level (root or nested like foo/bar/index.md)
+    safe_md_path = ensure_safe_md_path(md_path)
+    if _is_index_md(md_path) or not use_directory_urls:
+        return safe_md_path.with_suffix(".html")
+    return safe_md_path.with_suffix("") / "index.html"
+
+
 def md_path_to_html_path(
     site_dir: Path, md_path: str, use_directory_urls: bool = True
 ) -> Path:
@@ -86,15 +151,7 @@ def md_path_to_html_path(
     Returns:
         Path to the corresponding HTML file.
     """
-    # Handle index.md at any level (root or nested like foo/bar/index.md)
-    safe_md_path = ensure_safe_md_path(md_path)
-    if _is_index_md(md_path):
-        html_path = site_dir / safe_md_path.with_suffix(".html")
-        return _ensure_within_dir(site_dir, html_path, "HTML path")
-    if use_directory_urls:
-        html_path = site_dir / safe_md_path.with_suffix("") / "index.html"
-        return _ensure_within_dir(site_dir, html_path, "HTML path")
-    html_path = site_dir / safe_md_path.with_suffix(".html")
+    html_path = site_dir / _html_rel_path(md_path, use_directory_urls)
     return _ensure_within_dir(site_dir, html_path, "HTML path")
 
 
@@ -127,6 +184,32 @@ def md_path_to_page_url(
     return f"{site_url}/{md_path}"
 
 
+def md_path_to_html_url(
+    site_url: str,
+    md_path: str,
+    use_directory_urls: bool = True,
+) -> str:
+    """Convert docs/foo.md path to the HTML page URL on the deployed site.
+
+    Args:
+        site_url: Base URL of the site.
+        md_path: Relative markdown file path (e.g., "install.md").
+        use_directory_urls: If True, directory-style URLs; if False, flat URLs.
+
+    Returns:
+        URL of the rendered page (relative if site_url is empty).
+    """
+    if _is_index_md(md_path):
+        path = md_path.removesuffix("index.md")
+    elif use_directory_urls:
+        path = md_path.removesuffix(".md") + "/"
+    else:
+        path = md_path.removesuffix(".md") + ".html"
+    if not site_url:
+        return path or "./"
+    return f"{site_url}/{path}"
+
+
 def md_path_to_output_md_path(
     site_dir: Path, md_path: str, use_directory_urls: bool = True
 ) -> Path:
@@ -154,10 +237,24 @@ def md_path_to_output_md_path(
 
 @dataclass
 class PageMarkdown:
-    """Per-page markdown output."""
+    """Per-page markdown output.
+
+    content is the markdown, or a handle to it in the PageStore of a build
+    too large to keep every page in memory; text reads it either way.
+    """
 
     md_path: str
-    content: str
+    content: str | SpillHandle
+
+    @property
+    def text(self) -> str:
+        """The page's markdown, read back from the page store if spilled."""
+        return load_page_text(self.content)
+
+    @property
+    def size(self) -> int:
+        """UTF-8 size of the page's markdown in bytes, without reading it back."""
+        return stored_size(self.content)
 
 
 @dataclass
@@ -165,10 +262,24 @@ class BuildResult:
     """Result of building llms.txt content (no files written)."""
 
     llms_txt: str
+    # Empty, as are section_full_txts, when FullText writers produced them
     llms_full_txt: str
     pages: list[PageMarkdown]
     skipped: list[tuple[Path, str]]
     warnings: list[str]
+    html_bytes: int = 0
+    # Pages whose conversion was shared with an identical earlier page
+    reused_pages: int = 0
+    # Per-section full content keyed by output path, when requested
+    section_full_txts: dict[str, str] = field(default_factory=dict)
+    # Token counts of each page in llms-full.txt and of the whole file
+    page_tokens: dict[str, int] = field(default_factory=dict)
+    full_tokens: int = 0
+    # Token budgets exceeded with token_budget_action "fail"
+    budget_errors: list[str] = field(default_factory=list)
+    # Repeated blocks replaced by references in llms-full.txt (config.dedup)
+    deduplicated_blocks: int = 0
+    deduplicated_chars: int = 0
 
 
 @dataclass
@@ -187,128 +298,1253 @@ class GenerateResult:
     warnings: list[str]
 
 
-def build_llms_output(
+@dataclass
+class PageResult:
+    """Outcome of processing a single page, before assembly.
+
+    Skipped pages carry a skip_reason and no content. Converted pages carry
+    the resolved title, markdown content, and any warnings raised for them.
+    In a build with a PageStore, content is the page as put in the store
+    (see iter_page_results); text reads it either way.
+    """
+
+    md_path: str
+    html_path: Path
+    title: str = ""
+    content: str | SpillHandle = ""
+    skip_reason: str | None = None
+    warnings: list[str] = field(default_factory=list)
+    html_bytes: int = 0
+    # Converted output shared with an earlier page whose HTML is identical
+    reused: bool = False
+
+    @property
+    def text(self) -> str:
+        """The page's markdown, read back from the page store if spilled."""
+        return load_page_text(self.content)
+
+    def to_json(self) -> dict[str, Any]:
+        """JSON-serializable record of the result (see from_json)."""
+        return {
+            "md_path": self.md_path,
+            "html_path": str(self.html_path),
+            "title": self.title,
+            "content": self.text,
+            "skip_reason": self.skip_reason,
+            "warnings": self.warnings,
+            "html_bytes": self.html_bytes,
+            "reused": self.reused,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> PageResult:
+        """Rebuild a result from a to_json record.
+
+        Raises:
+            KeyError: If a required field is missing.
+        """
+        return cls(
+            md_path=data["md_path"],
+            html_path=Path(data["html_path"]),
+            title=data["title"],
+            content=data["content"],
+            skip_reason=data["skip_reason"],
+            warnings=list(data["warnings"]),
+            html_bytes=data["html_bytes"],
+            reused=data.get("reused", False),
+        )
+
+
+def iter_page_paths(config: Config) -> list[str]:
+    """List distinct page paths across all sections, in nav order.
+
+    A page listed in several sections is processed once and its result is
+    reused for every listing.
+    """
+    return list(
+        dict.fromkeys(
+            md_path for pages in config.sections.values() for md_path in pages
+        )
+    )
+
+
+@dataclass
+class _PageSource:
+    """A page whose HTML has been read, awaiting conversion."""
+
+    md_path: str
+    html_path: Path
+    html: str
+    html_bytes: int
+    digest: bytes
+
+
+# Pooled builds send pages of at most this many HTML bytes to workers in
+# batches of up to _BATCH_PAGES pages or _BATCH_BYTES bytes
+_SMALL_PAGE_BYTES = 16 * 1024
+_BATCH_PAGES = 32
+_BATCH_BYTES = 256 * 1024
+
+# Pooled builds start pages at most this many jobs past the next result due,
+# so results finished out of order wait in a bounded buffer
+_MAX_AHEAD = 1024
+
+# HTML digest plus every conversion setting: pages with equal keys convert
+# to the same outcome
+_MemoKey = tuple[bytes, str | None, str, bool]
+
+
+@dataclass(frozen=True)
+class ConvertRequest:
+    """Everything a worker needs to convert one page (picklable)."""
+
+    md_path: str
+    html: str
+    content_selector: str | None
+    site_name: str
+    extract_title: bool
+    trace: bool = False
+    # Seconds the conversion may take (enforced in worker processes only)
+    timeout: float | None = None
+    # Directory to spill large results to instead of returning them
+    spill_dir: str | None = None
+
+
+@dataclass
+class ConvertOutcome:
+    """Result of converting one page's HTML."""
+
+    html_title: str | None
+    content: str
+    error: str | None = None
+    spans: list[Span] = field(default_factory=list)
+    # Time spent converting, for scheduler reports
+    duration_s: float = 0.0
+    # Set when the page hit a resource limit and must be skipped
+    skip_reason: str | None = None
+    # Set, with content empty, when the content is in a file: a worker's
+    # spill file, or a PageStore's once the parent has stored the outcome
+    spilled: SpillHandle | None = None
+
+    def load_content(self) -> str:
+        """The converted markdown, read back from the spill file if spilled."""
+        if self.spilled is not None:
+            return read_spilled(self.spilled)
+        return self.content
+
+
+def _read_page(
     config: Config,
-    site_dir: Path,
-) -> BuildResult:
-    """Build llms.txt, llms-full.txt, and per-page markdown content.
+    index: SiteIndex,
+    md_path: str,
+    tracer: Tracer | None = None,
+) -> _PageSource | PageResult:
+    """Map md_path to its HTML file and read it, or return a skipped result."""
+    site_dir = index.site_dir
+    try:
+        rel_path = _html_rel_path(md_path, config.use_directory_urls)
+        found = index.is_file(rel_path, "HTML path")
+    except ValueError as exc:
+        return PageResult(md_path, site_dir / md_path, skip_reason=str(exc))
+
+    html_path = site_dir / rel_path
+    if not found:
+        return PageResult(md_path, html_path, skip_reason="HTML file not found")
+
+    try:
+        with maybe_span(tracer, "read", md_path=md_path):
+            raw = html_path.read_bytes()
+            html = _decode_html(raw)
+    except UnicodeDecodeError:
+        return PageResult(
+            md_path, html_path, skip_reason="HTML file has encoding errors"
+        )
+    except OSError as exc:
+        return PageResult(
+            md_path, html_path, skip_reason=f"Failed to read HTML file: {exc}"
+        )
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    return _PageSource(md_path, html_path, html, len(raw), digest)
+
+
+def _convert_request(
+    config: Config,
+    source: _PageSource,
+    trace: bool = False,
+    timeout: float | None = None,
+    spill_dir: str | None = None,
+) -> ConvertRequest:
+    return ConvertRequest(
+        md_path=source.md_path,
+        html=source.html,
+        content_selector=config.content_selector,
+        site_name=config.site_name,
+        # Nav titles win (mkdocs-llmstxt compat); only parse <title> when needed
+        extract_title=config.get_nav_title(source.md_path) is None,
+        trace=trace,
+        timeout=timeout,
+        spill_dir=spill_dir,
+    )
+
+
+class _PageTimeoutError(Exception):
+    """A page's conversion ran past ConvertRequest.timeout."""
+
+
+# Whether this process has run a conversion yet
+_warmed_up = False
+
+
+def _warm_up() -> None:
+    """Run a throwaway conversion so lazy set-up isn't charged to a page.
+
+    The first conversion in a process builds parsers and loads plugins,
+    which can take longer than a tight --page-timeout on its own.
+    """
+    global _warmed_up
+    if not _warmed_up:
+        _warmed_up = True
+        html_to_markdown("<p>Warm up</p>", None)
+
+
+@contextmanager
+def _time_limit(seconds: float | None) -> Generator[None, None, None]:
+    """Raise _PageTimeoutError in the block once seconds have passed.
+
+    Uses SIGALRM, so the limit only applies in the main thread on Unix,
+    which is where worker processes run their tasks. Elsewhere the block
+    runs unlimited and the parent's task timeout is the only guard.
+    """
+    if (
+        seconds is None
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def expire(signum: int, frame: object) -> None:
+        raise _PageTimeoutError
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def convert_html(
+    request: ConvertRequest, tracer: Tracer | None = None
+) -> ConvertOutcome:
+    """Extract the title and markdown content from one page's HTML.
+
+    This is the unit of work run by conversion workers. When request.trace is
+    set and no tracer is given (as in a worker process), spans are collected
+    locally and returned on the outcome for the parent to merge.
 
     Args:
-        config: Resolved configuration.
-        site_dir: Path to built HTML site directory.
+        request: Page HTML and conversion settings.
+        tracer: Tracer to record spans into directly, if running in-process.
 
     Returns:
-        BuildResult with content and per-page markdown data.
+        ConvertOutcome with the HTML title (if requested) and markdown, or
+        with a skip_reason if the page ran out of time or memory.
     """
-    # Build llms.txt (index)
-    llms_lines = [f"# {config.site_name}", ""]
+    start = time.perf_counter()
+    local_tracer = Tracer() if tracer is None and request.trace else None
+    tracer = tracer or local_tracer
+    skip_reason = None
+    if request.timeout is not None:
+        _warm_up()
+    try:
+        with (
+            _time_limit(request.timeout),
+            maybe_span(tracer, "convert_page", md_path=request.md_path),
+        ):
+            html_title = None
+            if request.extract_title:
+                with maybe_span(tracer, "title"):
+                    html_title = extract_title_from_html(
+                        request.html, site_name=request.site_name
+                    )
+            try:
+                content = html_to_markdown(
+                    request.html, request.content_selector, tracer=tracer
+                )
+            except (_PageTimeoutError, MemoryError):
+                raise
+            except Exception as exc:
+                return ConvertOutcome(
+                    html_title,
+                    "",
+                    error=str(exc),
+                    spans=local_tracer.spans if local_tracer else [],
+                    duration_s=time.perf_counter() - start,
+                )
+    except _PageTimeoutError:
+        skip_reason = f"Conversion timed out after {request.timeout:g}s"
+    except MemoryError:
+        skip_reason = "Conversion exceeded the memory limit"
+    if skip_reason is not None:
+        return ConvertOutcome(
+            None,
+            "",
+            spans=local_tracer.spans if local_tracer else [],
+            duration_s=time.perf_counter() - start,
+            skip_reason=skip_reason,
+        )
+    spilled = None
+    if request.spill_dir is not None and len(content) >= SPILL_MIN_BYTES:
+        try:
+            spilled = spill_text(content, request.spill_dir)
+            content = ""
+        except OSError:
+            # Disk full or the like: send the content back the usual way
+            pass
+    return ConvertOutcome(
+        html_title,
+        content,
+        spans=local_tracer.spans if local_tracer else [],
+        duration_s=time.perf_counter() - start,
+        spilled=spilled,
+    )
 
-    if config.site_description:
-        llms_lines.append(f"> {config.site_description}")
-        llms_lines.append("")
 
-    if config.markdown_description:
-        llms_lines.append(config.markdown_description.strip())
-        llms_lines.append("")
+def _convert_alone(pool: WorkerPool, request: ConvertRequest) -> ConvertOutcome:
+    """Convert one page as the only task on the pool.
 
-    # Build llms-full.txt header
-    full_lines = [f"# {config.site_name}", ""]
+    A page that hangs its worker past the task timeout, or kills it, gets
+    a skip_reason and the workers are recycled.
+    """
+    future = pool.submit(convert_batch, [request])
+    try:
+        return future.result(timeout=pool.task_timeout(1))[0]
+    except FutureTimeoutError:
+        reason = f"Conversion timed out after {pool.page_timeout:g}s"
+    except BrokenProcessPool:
+        reason = "Worker process died while converting the page"
+    pool.recycle()
+    return ConvertOutcome(None, "", skip_reason=reason)
+
+
+def convert_batch(requests: list[ConvertRequest]) -> list[ConvertOutcome]:
+    """Convert several pages in one worker task (see convert_html).
+
+    Batching small pages amortizes the per-task cost of sending work to a
+    worker process and back.
+    """
+    return [convert_html(request) for request in requests]
 
-    if config.site_description:
-        full_lines.append(f"> {config.site_description}")
-        full_lines.append("")
 
-    # Process sections - check HTML existence and extract titles first
-    page_outputs: list[PageMarkdown] = []
-    skipped: list[tuple[Path, str]] = []
-    warnings: list[str] = []
+def _html_size(config: Config, index: SiteIndex, md_path: str) -> int:
+    """Size of md_path's HTML file, or 0 if it will be skipped."""
+    try:
+        return index.file_size(_html_rel_path(md_path, config.use_directory_urls))
+    except ValueError:
+        return 0
 
-    for section_name, section_pages in config.sections.items():
-        section_entries: list[str] = []
 
-        for md_path in section_pages:
-            try:
-                html_path = md_path_to_html_path(
-                    site_dir, md_path, config.use_directory_urls
-                )
-            except ValueError as exc:
-                skipped.append((site_dir / md_path, str(exc)))
-                continue
+def _memo_key(source: _PageSource, request: ConvertRequest) -> _MemoKey:
+    return (
+        source.digest,
+        request.content_selector,
+        request.site_name,
+        request.extract_title,
+    )
 
-            if not html_path.exists():
-                skipped.append((html_path, "HTML file not found"))
-                continue
 
-            try:
-                html = html_path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                skipped.append((html_path, "HTML file has encoding errors"))
-                continue
-            except OSError as exc:
-                skipped.append((html_path, f"Failed to read HTML file: {exc}"))
-                continue
-
-            # Prefer nav title (mkdocs-llmstxt compat), fall back to HTML, then filename
-            title = (
-                config.get_nav_title(md_path)
-                or extract_title_from_html(html, site_name=config.site_name)
-                or config.get_filename_title(md_path)
+def _store_outcome(outcome: ConvertOutcome, store: PageStore | None) -> ConvertOutcome:
+    """Move an outcome's markdown into store, or into memory without one.
+
+    Outcomes stay in the conversion memo for the rest of a run, so once
+    stored they hold no more of a page than the store keeps in memory. A
+    page a worker spilled is adopted by the store as it is, unread.
+    """
+    if outcome.spilled is not None and store is not None:
+        return replace(outcome, spilled=store.adopt(outcome.spilled))
+    content = outcome.load_content()
+    stored = store.put(content) if store is not None else content
+    if isinstance(stored, str):
+        return replace(outcome, content=stored, spilled=None)
+    return replace(outcome, content="", spilled=stored)
+
+
+def _store_result(result: PageResult, store: PageStore | None) -> PageResult:
+    """Move a restored result's markdown into store, if there is one."""
+    if store is None or not isinstance(result.content, str):
+        return result
+    return replace(result, content=store.put(result.content))
+
+
+def _finish_page(
+    config: Config,
+    source: _PageSource,
+    outcome: ConvertOutcome,
+    reused: bool = False,
+    store: PageStore | None = None,
+) -> PageResult:
+    if outcome.skip_reason is not None:
+        return PageResult(
+            source.md_path,
+            source.html_path,
+            skip_reason=outcome.skip_reason,
+            html_bytes=source.html_bytes,
+            reused=reused,
+        )
+    # Prefer nav title (mkdocs-llmstxt compat), fall back to HTML, then filename
+    title = (
+        config.get_nav_title(source.md_path)
+        or outcome.html_title
+        or config.get_filename_title(source.md_path)
+    )
+    warnings: list[str] = []
+    if outcome.error is not None:
+        warnings.append(
+            f"Failed to convert HTML from {source.html_path}: {outcome.error}"
+        )
+    # As stored by _store_outcome
+    content = outcome.spilled or outcome.content
+    if not content:
+        warnings.append(
+            f"No markdown content extracted from {source.html_path}; content empty"
+        )
+    if config.max_page_tokens is not None and config.token_budget_action == "truncate":
+        count = get_tokenizer(config.tokenizer)
+        text = load_page_text(content)
+        tokens = count(text)
+        if tokens > config.max_page_tokens:
+            text = truncate_to_tokens(text, config.max_page_tokens, count)
+            content = store.put(text) if store is not None else text
+            warnings.append(
+                f"Truncated {source.md_path} from {tokens:,} tokens to "
+                f"max_page_tokens ({config.max_page_tokens:,})"
             )
+    return PageResult(
+        source.md_path,
+        source.html_path,
+        title=title,
+        content=content,
+        warnings=warnings,
+        html_bytes=source.html_bytes,
+        reused=reused,
+    )
+
+
+def process_page(
+    config: Config,
+    site_dir: Path,
+    md_path: str,
+    tracer: Tracer | None = None,
+    memo: dict[_MemoKey, ConvertOutcome] | None = None,
+    index: SiteIndex | None = None,
+    checkpoint: Checkpoint | None = None,
+    page_store: PageStore | None = None,
+) -> PageResult:
+    """Read, title and convert one page in the current process.
+
+    Args:
+        config: Resolved configuration.
+        site_dir: Path to built HTML site directory.
+        md_path: Relative markdown file path (e.g., "install.md").
+        tracer: Optional tracer receiving page and stage spans.
+        memo: Optional conversion memo shared across calls; a page whose
+            HTML and settings match an earlier page reuses its conversion.
+        index: Optional index of site_dir shared across calls.
+        checkpoint: Optional checkpoint to restore the page from, if its
+            HTML is unchanged, and to journal it to otherwise.
+        page_store: Optional store to put the page's markdown in; memo then
+            keeps the stored form too.
 
-            page_url = md_path_to_page_url(
-                config.site_url,
+    Returns:
+        PageResult describing the converted or skipped page.
+    """
+    with maybe_span(tracer, "page", md_path=md_path):
+        source = _read_page(config, index or SiteIndex(site_dir), md_path, tracer)
+        if isinstance(source, PageResult):
+            return source
+        if checkpoint is not None:
+            restored = checkpoint.restore(md_path, source.digest)
+            if restored is not None:
+                return _store_result(restored, page_store)
+        request = _convert_request(config, source)
+        key = _memo_key(source, request)
+        outcome = memo.get(key) if memo is not None else None
+        reused = outcome is not None
+        if outcome is None:
+            outcome = convert_html(request, tracer=tracer)
+            outcome = _store_outcome(outcome, page_store)
+            if memo is not None:
+                memo[key] = outcome
+        result = _finish_page(config, source, outcome, reused, page_store)
+        if checkpoint is not None:
+            checkpoint.record(source.digest, result)
+        return result
+
+
+def iter_page_results(
+    jobs: Iterable[tuple[Config, Path, str]],
+    pool: WorkerPool | None = None,
+    tracer: Tracer | None = None,
+    checkpoint: Checkpoint | None = None,
+    page_store: PageStore | None = None,
+) -> Iterator[PageResult]:
+    """Process pages, yielding results in the order the jobs were given.
+
+    Without a pool, pages are processed one by one in this process. With a
+    pool, HTML is read ahead on the pool's reader threads and conversion
+    runs on the workers, so disk reads, conversion and the caller's writes
+    overlap, as do jobs from different projects. Among the next 1024 jobs
+    not yet started, pages are scheduled largest first (by HTML file size)
+    to shorten the build, with small pages sent to workers in batches;
+    results are still yielded in job order, so the first results may arrive
+    later than with in-order scheduling. Worker busy time is recorded on the
+    pool (see WorkerPool.efficiency).
+
+    Within a run of jobs for the same config, pages are converted once per
+    distinct HTML content: a page byte-identical to an earlier one (a
+    versioned copy or a redirect stub) reuses its outcome and is marked
+    reused. Each project keeps its own memo, so a batch build yields what
+    separate builds would.
+
+    Each site directory is indexed once (see SiteIndex), so locating pages
+    costs one directory listing per directory rather than several
+    filesystem calls per page.
+
+    With a checkpoint, a page whose HTML is unchanged since it was journaled
+    is restored instead of converted, and every other page read is journaled
+    once finished. Checkpoints are keyed by md_path, so jobs must belong to
+    one project.
+
+    With a page_store, each page's markdown is put in it as soon as the
+    page finishes, before it waits its turn to be yielded, and memos keep
+    the stored form; results carry it as their content (see
+    PageResult.text).
+
+    Args:
+        jobs: (config, site_dir, md_path) for each page to process.
+        pool: Optional worker pool for conversion.
+        tracer: Optional tracer; worker spans are merged into it.
+        checkpoint: Optional checkpoint to restore and journal pages.
+        page_store: Optional store to keep finished pages' markdown in.
+
+    Yields:
+        One PageResult per job, in job order.
+    """
+    indexes: dict[Path, SiteIndex] = {}
+
+    def site_index(site_dir: Path) -> SiteIndex:
+        index = indexes.get(site_dir)
+        if index is None:
+            index = indexes[site_dir] = SiteIndex(site_dir)
+        return index
+
+    memo_config: Config | None = None
+    if pool is None:
+        memo: dict[_MemoKey, ConvertOutcome] = {}
+        for config, site_dir, md_path in jobs:
+            if config is not memo_config:
+                memo, memo_config = {}, config
+            yield process_page(
+                config,
+                site_dir,
                 md_path,
-                config.use_directory_urls,
+                tracer=tracer,
+                memo=memo,
+                index=site_index(site_dir),
+                checkpoint=checkpoint,
+                page_store=page_store,
             )
-            # Escape brackets in title to produce valid markdown links
-            escaped_title = _escape_markdown_link_text(title)
-            section_entries.append(f"- [{escaped_title}]({page_url})")
-
-            # Convert content for llms-full.txt
+        return
+
+    # The pooled build is a pipeline: reader threads fetch HTML ahead of
+    # conversion, workers convert, and this generator hands results on in
+    # job order. Pages are read and converted largest first, so no big page
+    # is left running alone at the end, and small pages travel to workers in
+    # batches. Reads and worker tasks in flight are each bounded by
+    # pool.window, so a slow consumer holds back conversion and a slow
+    # worker holds back reading, and no page starts more than _MAX_AHEAD
+    # jobs past the next result due, so finished pages wait for their turn
+    # in a bounded buffer.
+    workers = pool  # Narrowed to WorkerPool for the closures below
+    jobs = list(jobs)
+    # Memo scope: each run of jobs for one config (see above)
+    runs: list[int] = []
+    for i, (config, _, _) in enumerate(jobs):
+        runs.append(runs[-1] + (config is not jobs[i - 1][0]) if i else 0)
+    sizes = [
+        _html_size(config, site_index(site_dir), md_path)
+        for config, site_dir, md_path in jobs
+    ]
+    # Jobs within reach of the next result due, largest first
+    pending: list[tuple[int, int]] = []
+
+    start = time.perf_counter()
+    busy_s = 0.0
+    reads: deque[tuple[int, Future[_PageSource | PageResult]]] = deque()
+    # Task and position within it of each memo key's conversion, until it
+    # finishes and the stored outcome moves to memo
+    tasks: dict[tuple[int, _MemoKey], tuple[Future[list[ConvertOutcome]], int]] = {}
+    memo: dict[tuple[int, _MemoKey], ConvertOutcome] = {}
+    # Pages of each submitted task not yet finished, and the task's requests
+    # (kept to resubmit them if the workers are recycled)
+    open_tasks: dict[Future[list[ConvertOutcome]], int] = {}
+    task_requests: dict[
+        Future[list[ConvertOutcome]], dict[tuple[int, _MemoKey], ConvertRequest]
+    ] = {}
+    batch: dict[tuple[int, _MemoKey], ConvertRequest] = {}
+    batch_bytes = 0
+    # Pages awaiting conversion, in dispatch order: job index, source, memo
+    # key, and whether the conversion belongs to an earlier identical page
+    converting: deque[tuple[int, _PageSource, tuple[int, _MemoKey], bool]] = deque()
+    done: dict[int, PageResult] = {}
+
+    def submit(requests: dict[tuple[int, _MemoKey], ConvertRequest]) -> None:
+        future: Future[list[ConvertOutcome]]
+        try:
+            future = pool.submit(convert_batch, list(requests.values()))
+        except BrokenProcessPool as exc:
+            # A worker died since the last task; recover() when it's awaited
+            future = Future()
+            future.set_exception(exc)
+        for position, key in enumerate(requests):
+            tasks[key] = (future, position)
+        open_tasks[future] = len(requests)
+        task_requests[future] = requests
+
+    def recover(failed: Future[list[ConvertOutcome]]) -> None:
+        # Recycle the workers after a task hung or a worker died. The failed
+        # task's pages are converted again one at a time, alone on the pool,
+        # to find and skip the page responsible; other unfinished tasks are
+        # submitted again.
+        requests = task_requests.pop(failed)
+        count = open_tasks.pop(failed)
+        unfinished = [
+            future
+            for future in task_requests
+            if not (future.done() and future.exception() is None)
+        ]
+        resubmit = [task_requests.pop(future) for future in unfinished]
+        for future in unfinished:
+            del open_tasks[future]
+        pool.recycle()
+        settled: Future[list[ConvertOutcome]] = Future()
+        settled.set_result([_convert_alone(workers, r) for r in requests.values()])
+        for position, key in enumerate(requests):
+            tasks[key] = (settled, position)
+        open_tasks[settled] = count
+        task_requests[settled] = requests
+        for task in resubmit:
+            submit(task)
+
+    def flush() -> None:
+        nonlocal batch_bytes
+        if batch:
+            submit(batch)
+            batch.clear()
+            batch_bytes = 0
+
+    def dispatch(i: int, source: _PageSource) -> None:
+        nonlocal batch_bytes
+        request = _convert_request(
+            jobs[i][0],
+            source,
+            trace=tracer is not None,
+            timeout=pool.page_timeout,
+            spill_dir=pool.spill_dir,
+        )
+        key = (runs[i], _memo_key(source, request))
+        reused = key in memo or key in tasks or key in batch
+        if not reused and source.html_bytes > _SMALL_PAGE_BYTES:
+            submit({key: request})
+        elif not reused:
+            batch[key] = request
+            batch_bytes += source.html_bytes
+            if len(batch) >= _BATCH_PAGES or batch_bytes >= _BATCH_BYTES:
+                flush()
+        converting.append((i, source, key, reused))
+
+    def complete() -> None:
+        nonlocal busy_s
+        i, source, key, reused = converting[0]
+        outcome = memo.get(key)
+        if outcome is None:
+            if key not in tasks:
+                flush()
+            future, position = tasks[key]
+            # Every older task has finished, so this one is running: past its
+            # page timeouts, its worker is stuck where the alarm can't reach
+            requests = task_requests.get(future)
+            timeout = pool.task_timeout(len(requests)) if requests else None
             try:
-                content = html_to_markdown(html, config.content_selector)
-            except Exception as exc:
-                warning = f"Failed to convert HTML from {html_path}: {exc}"
-                warnings.append(warning)
-                content = ""
-
-            if content:
-                full_lines.append(f"## {title}")
-                full_lines.append("")
-                full_lines.append(content)
-                full_lines.append("")
+                outcome = future.result(timeout=timeout)[position]
+            except (FutureTimeoutError, BrokenProcessPool):
+                recover(future)
+                return
+            del tasks[key]
+            busy_s += outcome.duration_s
+            if tracer is not None:
+                tracer.add(*outcome.spans)
+            open_tasks[future] -= 1
+            if not open_tasks[future]:
+                # The task's outcomes are all stored; let the results go
+                del open_tasks[future]
+                del task_requests[future]
+            outcome = memo[key] = _store_outcome(replace(outcome, spans=[]), page_store)
+        converting.popleft()
+        result = _finish_page(jobs[i][0], source, outcome, reused, page_store)
+        if checkpoint is not None:
+            checkpoint.record(source.digest, result)
+        done[i] = result
+
+    queued = next_out = 0
+    while next_out < len(jobs):
+        while queued < min(len(jobs), next_out + _MAX_AHEAD):
+            heapq.heappush(pending, (-sizes[queued], queued))
+            queued += 1
+        while pending and len(reads) < pool.window:
+            _, i = heapq.heappop(pending)
+            config, site_dir, md_path = jobs[i]
+            read = pool.read(_read_page, config, site_index(site_dir), md_path, tracer)
+            reads.append((i, read))
+        if reads and len(open_tasks) < pool.window:
+            i, read = reads.popleft()
+            source = read.result()
+            if checkpoint is not None and not isinstance(source, PageResult):
+                source = checkpoint.restore(source.md_path, source.digest) or source
+            if isinstance(source, PageResult):
+                done[i] = _store_result(source, page_store)
             else:
-                warning = (
-                    f"No markdown content extracted from {html_path}; content empty"
+                dispatch(i, source)
+        elif converting:
+            complete()
+        if next_out + len(done) == len(jobs):
+            # Record before the last yield: the caller may not resume us
+            pool.record(busy_s, time.perf_counter() - start)
+        while next_out in done:
+            yield done.pop(next_out)
+            next_out += 1
+
+
+def section_full_outputs(config: Config) -> dict[str, str]:
+    """Map each section to the path of its own full-content file.
+
+    Paths are derived from config.full_output, so "llms-full.txt" and a
+    "Getting Started" section give "llms-full-getting-started.txt". Sections
+    whose names have no word characters are numbered, and names that clash
+    get a numeric suffix.
+    """
+    full_output = PurePosixPath(config.full_output)
+    outputs: dict[str, str] = {}
+    used: set[str] = set()
+    for index, section_name in enumerate(config.sections, start=1):
+        name = unicodedata.normalize("NFKC", section_name).lower()
+        slug = re.sub(r"\W+", "-", name).strip("-_") or f"section-{index}"
+        candidate, count = slug, 1
+        while candidate in used:
+            count += 1
+            candidate = f"{slug}-{count}"
+        used.add(candidate)
+        path = full_output.with_name(
+            f"{full_output.stem}-{candidate}{full_output.suffix}"
+        )
+        outputs[section_name] = path.as_posix()
+    return outputs
+
+
+def full_header_lines(config: Config, title: str) -> list[str]:
+    """Header lines of a full-content file (title, then site description)."""
+    lines = [f"# {title}", ""]
+    if config.site_description:
+        lines.append(f"> {config.site_description}")
+        lines.append("")
+    return lines
+
+
+@dataclass(frozen=True)
+class FullBlock:
+    """One listing of a page in llms-full.txt, as full-content outputs write it.
+
+    text is the page's "## Title" heading and content, deduplicated with
+    config.dedup; each output writes it after a blank line.
+    """
+
+    section: str
+    md_path: str
+    title: str
+    text: str
+
+
+class FullTextWriter(ABC):
+    """Base for outputs made of llms-full.txt's blocks (see FullText).
+
+    begin_section() is called when the first converted page of a section is
+    reached, then write() for each of its blocks, in llms-full.txt order.
+    Writers that create files stage them and only put them in place on
+    commit(), which the caller makes once the build has passed its token
+    budgets; close() discards whatever wasn't committed.
+    """
+
+    def begin_section(self, section: str) -> None:  # noqa: B027
+        """Start the blocks of section; nothing to do for most writers."""
+
+    @abstractmethod
+    def write(self, block: FullBlock) -> None:
+        """Add one block."""
+
+    def commit(self) -> None:  # noqa: B027
+        """Put the finished output in place."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release the writer, discarding output that wasn't committed."""
+
+    def __enter__(self) -> FullTextWriter:
+        """Return the writer for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the writer."""
+        self.close()
+
+
+class _CollectedFullText(FullTextWriter):
+    """Collect llms-full.txt, and optionally section files, as text."""
+
+    def __init__(self, config: Config, section_files: bool) -> None:
+        self.config = config
+        self._outputs = section_full_outputs(config) if section_files else {}
+        self._full = ["\n".join(full_header_lines(config, config.site_name))]
+        self._sections: dict[str, list[str]] = {}
+
+    def begin_section(self, section: str) -> None:
+        if section in self._outputs:
+            title = f"{self.config.site_name}: {section}"
+            self._sections[self._outputs[section]] = [
+                "\n".join(full_header_lines(self.config, title))
+            ]
+
+    def write(self, block: FullBlock) -> None:
+        self._full.append(f"\n{block.text}")
+        if block.section in self._outputs:
+            self._sections[self._outputs[block.section]].append(f"\n{block.text}")
+
+    @property
+    def llms_full_txt(self) -> str:
+        return "".join(self._full)
+
+    @property
+    def section_full_txts(self) -> dict[str, str]:
+        return {path: "".join(texts) for path, texts in self._sections.items()}
+
+
+class FullText:
+    """Turn page results into llms-full.txt's blocks as pages finish.
+
+    Results are added in nav order, one per distinct page (see
+    iter_page_paths). Each listing in config.sections becomes a block as
+    soon as the pages listed before it are in, and a page listed in several
+    sections is held until its last listing. Every writer gets the same
+    blocks, so llms-full.txt, section files and parts agree: with
+    config.dedup, blocks repeated across pages are kept once (see
+    BlockDeduplicator), and with max_full_tokens and token_budget_action
+    "truncate", the page that would take llms-full.txt over budget and all
+    later ones are left out.
+
+    Without writers, the blocks are collected in llms_full_txt and
+    section_full_txts; writers instead stream them to their outputs, so no
+    whole full-content file is held in memory.
+
+    Token counts use config.tokenizer. page_tokens holds each page's count,
+    full_tokens that of llms-full.txt, and over_budget the pages over
+    max_page_tokens.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        writers: Sequence[FullTextWriter] | None = None,
+        section_files: bool = False,
+    ) -> None:
+        """Set up the stage for one build.
+
+        Args:
+            config: Resolved configuration.
+            writers: Outputs receiving the blocks, or None to collect them.
+            section_files: Also collect per-section full-content files (see
+                section_full_outputs) in section_full_txts.
+
+        Raises:
+            ValueError: If config.tokenizer is unknown or unavailable.
+        """
+        self.config = config
+        self._collected = (
+            _CollectedFullText(config, section_files) if writers is None else None
+        )
+        self._writers = [self._collected] if self._collected else list(writers or ())
+        self._count = get_tokenizer(config.tokenizer)
+        # Tokens llms-full.txt is cut to, with token_budget_action "truncate"
+        self._full_budget = (
+            config.max_full_tokens if config.token_budget_action == "truncate" else None
+        )
+        self._deduplicator = (
+            BlockDeduplicator(config.dedup_min_chars, config.dedup_similarity)
+            if config.dedup
+            else None
+        )
+        self.page_tokens: dict[str, int] = {}
+        self.full_tokens = self._count(
+            "\n".join(full_header_lines(config, config.site_name))
+        )
+        self.over_budget: list[str] = []
+        # Pages left out of llms-full.txt by the max_full_tokens budget
+        self.omitted = 0
+        # Every listing in llms-full.txt order, and how often each page recurs
+        self._listings = [
+            (section_name, md_path)
+            for section_name, pages in config.sections.items()
+            for md_path in pages
+        ]
+        self._remaining: dict[str, int] = {}
+        for _, md_path in self._listings:
+            self._remaining[md_path] = self._remaining.get(md_path, 0) + 1
+        self._next_listing = 0
+        self._results: dict[str, PageResult] = {}
+        self._section: str | None = None
+
+    @property
+    def llms_full_txt(self) -> str:
+        """llms-full.txt as collected so far, or "" with writers."""
+        return self._collected.llms_full_txt if self._collected else ""
+
+    @property
+    def section_full_txts(self) -> dict[str, str]:
+        """Section files as collected so far, keyed by output path."""
+        return self._collected.section_full_txts if self._collected else {}
+
+    @property
+    def deduplicated_blocks(self) -> int:
+        """Repeated blocks replaced by a reference (config.dedup)."""
+        return self._deduplicator.removed_blocks if self._deduplicator else 0
+
+    @property
+    def deduplicated_chars(self) -> int:
+        """Characters of the blocks replaced by a reference."""
+        return self._deduplicator.removed_chars if self._deduplicator else 0
+
+    def add(self, result: PageResult) -> None:
+        """Write every listing that this page completes.
+
+        Raises:
+            OSError: If a writer can't write its output.
+        """
+        self._results[result.md_path] = result
+        while self._next_listing < len(self._listings):
+            section_name, md_path = self._listings[self._next_listing]
+            listed = self._results.get(md_path)
+            if listed is None:
+                # Later listings wait for this page
+                return
+            self._next_listing += 1
+            self._remaining[md_path] -= 1
+            if not self._remaining[md_path]:
+                del self._results[md_path]
+            if listed.skip_reason is None:
+                self._write(section_name, listed)
+
+    def _write(self, section_name: str, result: PageResult) -> None:
+        config = self.config
+        if section_name != self._section:
+            self._section = section_name
+            for writer in self._writers:
+                writer.begin_section(section_name)
+        if not result.content:
+            return
+        text = content = result.text
+        tokens = self.page_tokens.get(result.md_path)
+        if tokens is None:
+            tokens = self.page_tokens[result.md_path] = self._count(text)
+            if config.max_page_tokens is not None and tokens > config.max_page_tokens:
+                self.over_budget.append(
+                    f"{result.md_path} has {tokens:,} tokens, over "
+                    f"max_page_tokens ({config.max_page_tokens:,})"
                 )
-                warnings.append(warning)
+        if self.omitted:
+            self.omitted += 1
+            return
+        if self._deduplicator is not None:
+            content = self._deduplicator.dedup(result.title, text)
+            if content is not text:
+                tokens = self._count(content)
+        block_tokens = tokens + self._count(f"## {result.title}\n\n\n\n")
+        budget = self._full_budget
+        if budget is not None and self.full_tokens + block_tokens > budget:
+            self.omitted += 1
+            return
+        self.full_tokens += block_tokens
+        block = FullBlock(
+            section_name,
+            result.md_path,
+            result.title,
+            f"## {result.title}\n\n{content}\n",
+        )
+        for writer in self._writers:
+            writer.write(block)
+
+
+def assemble_llms_output(
+    config: Config,
+    results: Mapping[str, PageResult],
+    tracer: Tracer | None = None,
+    section_files: bool = False,
+    full_text: FullText | None = None,
+) -> BuildResult:
+    """Assemble llms.txt and llms-full.txt from per-page results.
+
+    Pages, skips and warnings are emitted in section order, so the output is
+    independent of the order in which pages were processed.
+
+    llms-full.txt and section files come from a FullText stage, which
+    applies deduplication (config.dedup) and the max_full_tokens budget to
+    both. Pages over max_page_tokens, and an llms-full.txt over
+    max_full_tokens, are reported as warnings, or as budget errors with
+    token_budget_action "fail".
+
+    Args:
+        config: Resolved configuration.
+        results: Page results keyed by md_path, covering every page in
+            config.sections.
+        tracer: Optional tracer receiving an "assemble" span.
+        section_files: Also assemble one full-content file per section (see
+            section_full_outputs) and link each from its llms.txt section.
+        full_text: The build's FullText stage, already given every result;
+            by default one is run over results here.
+
+    Returns:
+        BuildResult with content and per-page markdown data.
+
+    Raises:
+        KeyError: If a page in config.sections has no result.
+        OSError: If a page in a PageStore can't be read back.
+        ValueError: If config.tokenizer is unknown or unavailable, or a
+            page in a PageStore is corrupt.
+    """
+    with maybe_span(tracer, "assemble"):
+        if full_text is None:
+            full_text = FullText(config, section_files=section_files)
+            for md_path in iter_page_paths(config):
+                full_text.add(results[md_path])
 
-            page_outputs.append(PageMarkdown(md_path=md_path, content=content))
+        # Build llms.txt (index)
+        llms_lines = [f"# {config.site_name}", ""]
 
-        # Only add section to llms.txt if it has entries
-        if section_entries:
-            llms_lines.append(f"## {section_name}")
+        if config.site_description:
+            llms_lines.append(f"> {config.site_description}")
             llms_lines.append("")
-            llms_lines.extend(section_entries)
+
+        if config.markdown_description:
+            llms_lines.append(config.markdown_description.strip())
             llms_lines.append("")
 
-    llms_txt = "\n".join(llms_lines)
-    llms_full_txt = "\n".join(full_lines)
+        page_outputs: list[PageMarkdown] = []
+        skipped: list[tuple[Path, str]] = []
+        warnings: list[str] = []
+        section_outputs = section_full_outputs(config) if section_files else {}
+
+        for section_name, section_pages in config.sections.items():
+            section_entries: list[str] = []
+
+            for md_path in section_pages:
+                result = results[md_path]
+                if result.skip_reason is not None:
+                    skipped.append((result.html_path, result.skip_reason))
+                    continue
+
+                page_url = md_path_to_page_url(
+                    config.site_url,
+                    md_path,
+                    config.use_directory_urls,
+                )
+                # Escape brackets in title to produce valid markdown links
+                escaped_title = _escape_markdown_link_text(result.title)
+                section_entries.append(f"- [{escaped_title}]({page_url})")
+                warnings.extend(result.warnings)
+
+                page_outputs.append(PageMarkdown(md_path, result.content))
+
+            # Only add section to llms.txt if it has entries
+            if section_entries:
+                llms_lines.append(f"## {section_name}")
+                llms_lines.append("")
+                if section_files:
+                    section_path = section_outputs[section_name]
+                    section_url = (
+                        f"{config.site_url}/{section_path}"
+                        if config.site_url
+                        else section_path
+                    )
+                    escaped_name = _escape_markdown_link_text(section_name)
+                    llms_lines.append(
+                        f"- [{escaped_name} (full content)]({section_url})"
+                    )
+                llms_lines.extend(section_entries)
+                llms_lines.append("")
+
+        llms_txt = "\n".join(llms_lines)
+
+        over_budget = list(full_text.over_budget)
+        if full_text.omitted:
+            warnings.append(
+                f"Truncated {config.full_output} to max_full_tokens "
+                f"({config.max_full_tokens:,}): left out {full_text.omitted} pages"
+            )
+        elif (
+            config.max_full_tokens is not None
+            and full_text.full_tokens > config.max_full_tokens
+        ):
+            over_budget.append(
+                f"{config.full_output} has {full_text.full_tokens:,} tokens, over "
+                f"max_full_tokens ({config.max_full_tokens:,})"
+            )
+        fail = config.token_budget_action == "fail"
+        if not fail:
+            warnings.extend(over_budget)
 
     return BuildResult(
         llms_txt=llms_txt,
-        llms_full_txt=llms_full_txt,
+        llms_full_txt=full_text.llms_full_txt,
         pages=page_outputs,
         skipped=skipped,
         warnings=warnings,
+        html_bytes=sum(result.html_bytes for result in results.values()),
+        reused_pages=sum(result.reused for result in results.values()),
+        section_full_txts=full_text.section_full_txts,
+        page_tokens=full_text.page_tokens,
+        full_tokens=full_text.full_tokens,
+        budget_errors=over_budget if fail else [],
+        deduplicated_blocks=full_text.deduplicated_blocks,
+        deduplicated_chars=full_text.deduplicated_chars,
     )
 
 
+def build_llms_output(
+    config: Config,
+    site_dir: Path,
+    tracer: Tracer | None = None,
+    pool: WorkerPool | None = None,
+    on_page: Callable[[PageResult], None] | None = None,
+    section_files: bool = False,
+    checkpoint: Checkpoint | None = None,
+    page_store: PageStore | None = None,
+    full_writers: Sequence[FullTextWriter] | None = None,
+) -> BuildResult:
+    """Build llms.txt, llms-full.txt, and per-page markdown content.
+
+    Args:
+        config: Resolved configuration.
+        site_dir: Path to built HTML site directory.
+        tracer: Optional tracer receiving per-page and assembly spans.
+        pool: Optional worker pool to convert pages in parallel.
+        on_page: Optional callback receiving each distinct page's result as
+            soon as it finishes, in nav order.
+        section_files: Also assemble per-section full-content files.
+        checkpoint: Optional checkpoint: pages journaled by an interrupted
+            run are restored, and finished pages are journaled.
+        page_store: Optional store to keep each page's markdown in as it
+            finishes; it must stay open while the result's pages are read.
+        full_writers: Outputs receiving llms-full.txt's blocks as pages
+            finish (see FullText). They replace the result's llms_full_txt
+            and section_full_txts, which are then left empty.
+
+    Returns:
+        BuildResult with content and per-page markdown data.
+    """
+    (build,) = iter_build_results(
+        [(config, site_dir)],
+        pool=pool,
+        tracer=tracer,
+        on_page=None if on_page is None else lambda _, result: on_page(result),
+        section_files=section_files,
+        checkpoint=checkpoint,
+        page_store=page_store,
+        full_writers=None if full_writers is None else [full_writers],
+    )
+    return build
+
+
+def iter_build_results(
+    projects: Sequence[tuple[Config, Path]],
+    pool: WorkerPool | None = None,
+    tracer: Tracer | None = None,
+    on_page: Callable[[int, PageResult], None] | None = None,
+    section_files: bool = False,
+    checkpoint: Checkpoint | None = None,
+    page_store: PageStore | None = None,
+    full_writers: Sequence[Sequence[FullTextWriter]] | None = None,
+) -> Iterator[BuildResult]:
+    """Build several projects, scheduling all of their pages on one pool.
+
+    Each project's BuildResult is yielded as soon as its last page finishes,
+    while the pool is already converting pages of the following projects.
+
+    Args:
+        projects: (config, site_dir) for each project, in output order.
+        pool: Optional worker pool shared by all projects.
+        tracer: Optional tracer receiving per-page and assembly spans.
+        on_page: Optional callback receiving (project index, page result) for
+            each distinct page as soon as it finishes, in nav order.
+        section_files: Also assemble per-section full-content files.
+        checkpoint: Optional checkpoint to resume from and journal pages to;
+            only for a single project (see iter_page_results).
+        page_store: Optional store to keep each page's markdown in as it
+            finishes (see iter_page_results), instead of holding every page
+            in memory; it must stay open while the results' pages are read.
+        full_writers: Outputs receiving each project's llms-full.txt
+            blocks as its pages finish (see FullText), by project. They
+            replace the results' llms_full_txt and section_full_txts.
+
+    Yields:
+        One BuildResult per project, in the given order.
+    """
+    page_lists = [iter_page_paths(config) for config, _ in projects]
+    jobs = (
+        (config, site_dir, md_path)
+        for (config, site_dir), md_paths in zip(projects, page_lists, strict=True)
+        for md_path in md_paths
+    )
+    results = iter_page_results(
+        jobs, pool=pool, tracer=tracer, checkpoint=checkpoint, page_store=page_store
+    )
+    for index, ((config, _), md_paths) in enumerate(
+        zip(projects, page_lists, strict=True)
+    ):
+        full_text = FullText(
+            config,
+            full_writers[index] if full_writers is not None else None,
+            section_files=section_files,
+        )
+        page_results: dict[str, PageResult] = {}
+        for md_path in md_paths:
+            result = next(results)
+            if on_page is not None:
+                on_page(index, result)
+            full_text.add(result)
+            page_results[md_path] = result
+        yield assemble_llms_output(
+            config,
+            page_results,
+            tracer=tracer,
+            section_files=section_files,
+            full_text=full_text,
+        )
+
+
 def write_markdown_files(
     pages: list[PageMarkdown],
     output_dir: Path,
     use_directory_urls: bool,
     dry_run: bool = False,
+    tracer: Tracer | None = None,
 ) -> list[Path]:
     """Write per-page markdown files to disk.
 
@@ -317,6 +1553,7 @@ def write_markdown_files(
         output_dir: Path to write output files.
         use_directory_urls: If True, outputs to foo/index.md; if False, outputs to foo.md.
         dry_run: If True, don't write markdown files.
+        tracer: Optional tracer receiving a "write" span per page.
 
     Returns:
         List of output markdown paths (written or would-be).
@@ -328,8 +1565,9 @@ def write_markdown_files(
         )
         if not dry_run:
             try:
-                output_md_path.parent.mkdir(parents=True, exist_ok=True)
-                output_md_path.write_text(page.content, encoding="utf-8")
+                with maybe_span(tracer, "write", md_path=page.md_path):
+                    output_md_path.parent.mkdir(parents=True, exist_ok=True)
+                    output_md_path.write_text(page.text, encoding="utf-8")
             except OSError as exc:
                 raise OSError(f"Failed to write {output_md_path}: {exc}") from exc
         markdown_files.append(output_md_path)
@@ -352,8 +1590,14 @@ def generate_llms_txt(
 
     Returns:
         GenerateResult with content and list of markdown files (written or would-be).
+
+    Raises:
+        ValueError: If a token budget is exceeded with token_budget_action
+            "fail" (nothing is written).
     """
     build = build_llms_output(config=config, site_dir=site_dir)
+    if build.budget_errors:
+        raise ValueError(f"Token budget exceeded: {'; '.join(build.budget_errors)}")
     if output_dir is None:
         output_dir = site_dir
     markdown_files = write_markdown_files(
@@ -0,0 +1,208 @@
+"""OpenMetrics text exposition of build metrics."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from llmstxt_standalone.generate import BuildResult
+from llmstxt_standalone.trace import Span
+
+__all__ = [
+    "STAGE_BUCKETS",
+    "peak_rss_bytes",
+    "render_build_metrics",
+    "skip_reason_label",
+    "write_textfile",
+]
+
+# Histogram bucket upper bounds (seconds) for per-page stage durations
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+# Per-page stages reported as histograms; other spans are build-level
+_PAGE_STAGES = ("read", "title", "parse", "convert", "format", "write")
+
+# Skip reason prefixes mapped to stable label values
+_SKIP_REASONS = (
+    ("HTML file not found", "not_found"),
+    ("HTML file has encoding errors", "encoding_error"),
+    ("Failed to read HTML file", "read_error"),
+    ("Markdown path must", "unsafe_path"),
+    ("HTML path resolves outside", "unsafe_path"),
+    ("Conversion timed out", "timeout"),
+    ("Conversion exceeded the memory limit", "memory_limit"),
+    ("Worker process died", "worker_died"),
+)
+
+
+def skip_reason_label(reason: str) -> str:
+    """Map a BuildResult.skipped reason to a low-cardinality label value."""
+    for prefix, label in _SKIP_REASONS:
+        if reason.startswith(prefix):
+            return label
+    return "other"
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process and its children, in bytes.
+
+    Returns:
+        Peak RSS, or None where the resource module is unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+class _Exposition:
+    """Accumulate metric families with a shared set of labels."""
+
+    def __init__(self, site: str) -> None:
+        self.lines: list[str] = []
+        self.site_label = f'site="{_escape_label(site)}"'
+
+    def family(self, name: str, metric_type: str, help_text: str) -> None:
+        self.lines.append(f"# TYPE {name} {metric_type}")
+        self.lines.append(f"# HELP {name} {help_text}")
+
+    def sample(self, name: str, value: float, **labels: str) -> None:
+        label_parts = [self.site_label]
+        label_parts.extend(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+        self.lines.append(f"{name}{{{','.join(label_parts)}}} {_format_float(value)}")
+
+    def render(self) -> str:
+        return "\n".join([*self.lines, "# EOF", ""])
+
+
+def render_build_metrics(
+    build: BuildResult,
+    *,
+    site_name: str,
+    bytes_out: int,
+    spans: list[Span],
+) -> str:
+    """Render build metrics in OpenMetrics text format.
+
+    Args:
+        build: Result of build_llms_output.
+        site_name: Site name, attached to every sample as the "site" label.
+        bytes_out: Total bytes written (or that would be written) to outputs.
+        spans: Spans recorded by the build's tracer.
+
+    Returns:
+        Exposition text suitable for node_exporter's textfile collector.
+    """
+    out = _Exposition(site_name)
+
+    out.family("llmstxt_pages_converted", "counter", "Pages converted to markdown.")
+    out.sample("llmstxt_pages_converted_total", len(build.pages))
+
+    out.family(
+        "llmstxt_pages_reused",
+        "counter",
+        "Pages whose conversion was shared with an identical page.",
+    )
+    out.sample("llmstxt_pages_reused_total", build.reused_pages)
+
+    out.family("llmstxt_pages_skipped", "counter", "Pages skipped, by reason.")
+    reasons = Counter(skip_reason_label(reason) for _, reason in build.skipped)
+    for label, count in sorted(reasons.items()):
+        out.sample("llmstxt_pages_skipped_total", count, reason=label)
+
+    out.family("llmstxt_warnings", "counter", "Warnings emitted by the build.")
+    out.sample("llmstxt_warnings_total", len(build.warnings))
+
+    out.family("llmstxt_bytes_in", "counter", "HTML bytes read.")
+    out.sample("llmstxt_bytes_in_total", build.html_bytes)
+
+    out.family("llmstxt_bytes_out", "counter", "Output bytes produced.")
+    out.sample("llmstxt_bytes_out_total", bytes_out)
+
+    # Tagged on load_config spans by the CLI (see load_config_cached)
+    config_loads = [span.args for span in spans if span.name == "load_config"]
+    out.family(
+        "llmstxt_config_cache_lookups",
+        "counter",
+        "Config cache lookups, by result.",
+    )
+    for result, arg in (("hit", "config_cache_hits"), ("miss", "config_cache_misses")):
+        out.sample(
+            "llmstxt_config_cache_lookups_total",
+            sum(args.get(arg, 0) for args in config_loads),
+            result=result,
+        )
+
+    durations: defaultdict[str, list[float]] = defaultdict(list)
+    for span in spans:
+        durations[span.name].append(span.duration_s)
+
+    out.family(
+        "llmstxt_stage_duration_seconds",
+        "histogram",
+        "Per-page stage durations.",
+    )
+    for stage in _PAGE_STAGES:
+        values = durations.get(stage, [])
+        for bound in STAGE_BUCKETS:
+            count = sum(1 for v in values if v <= bound)
+            out.sample(
+                "llmstxt_stage_duration_seconds_bucket",
+                count,
+                stage=stage,
+                le=_format_float(bound),
+            )
+        out.sample(
+            "llmstxt_stage_duration_seconds_bucket",
+            len(values),
+            stage=stage,
+            le="+Inf",
+        )
+        out.sample("llmstxt_stage_duration_seconds_count", len(values), stage=stage)
+        out.sample("llmstxt_stage_duration_seconds_sum", sum(values), stage=stage)
+
+    out.family(
+        "llmstxt_phase_duration_seconds",
+        "gauge",
+        "Wall time of build-level phases.",
+    )
+    for name, values in sorted(durations.items()):
+        if name in _PAGE_STAGES or name == "page":
+            continue
+        out.sample("llmstxt_phase_duration_seconds", sum(values), phase=name)
+
+    rss = peak_rss_bytes()
+    if rss is not None:
+        out.family("llmstxt_peak_rss_bytes", "gauge", "Peak resident set size.")
+        out.sample("llmstxt_peak_rss_bytes", rss)
+
+    return out.render()
+
+
+def write_textfile(path: Path, text: str) -> None:
+    """Atomically write a metrics file.
+
+    The textfile collector may read at any time, so write to a sibling
+    temporary file and rename it into place.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -0,0 +1,149 @@
+"""Keep a build's page markdown in memory, or on disk once it grows large."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import weakref
+from dataclasses import replace
+from pathlib import Path
+from typing import IO
+
+from llmstxt_standalone.spill import SpillHandle, read_spilled
+
+__all__ = ["PageStore", "load_page_text", "stored_size"]
+
+
+class PageStore:
+    """Holds the markdown of each page a build keeps for BuildResult.pages.
+
+    Pages are kept in memory until memory_limit bytes (of UTF-8 markdown)
+    are held. Later
+    pages are appended to a temporary file instead and stand for a
+    SpillHandle (file, byte range and digest), so a very large build keeps
+    a few dozen bytes per page rather than its markdown; PageResult.text and
+    PageMarkdown.text read a page back when it is needed. A page a worker
+    already spilled to a file is adopted (see adopt()) rather than read.
+    Handles are valid until the store is closed, which deletes its files.
+    """
+
+    def __init__(
+        self, memory_limit: int | None = None, directory: Path | None = None
+    ) -> None:
+        """Set up an empty store; the file is created on the first spill.
+
+        Args:
+            memory_limit: Bytes of markdown to keep in memory before
+                spilling pages to disk; 0 spills every non-empty page, None
+                none.
+            directory: Where to create the file (default: the system's
+                temporary directory).
+        """
+        self.memory_limit = memory_limit
+        self.directory = directory
+        self.in_memory = 0
+        self.spilled = 0
+        self.adopted = 0
+        self._file: IO[bytes] | None = None
+        self._path = ""
+        # Files to delete on close: the store's own and adopted ones
+        self._paths: list[str] = []
+        # Delete them even if the store is dropped without close()
+        self._cleanup = weakref.finalize(self, _remove, self._paths)
+
+    def put(self, text: str) -> str | SpillHandle:
+        """Store a page's markdown.
+
+        Returns:
+            The text itself while under the memory limit, else a handle to
+            it in the store's file.
+
+        Raises:
+            OSError: If the file can't be created or written.
+        """
+        data = text.encode("utf-8")
+        if self.memory_limit is None or self.in_memory + len(data) <= self.memory_limit:
+            self.in_memory += len(data)
+            return text
+        file = self._file or self._open()
+        offset = file.tell()
+        file.write(data)
+        # Pages may be read back at any time, e.g. by a page writer
+        file.flush()
+        self.spilled += 1
+        return SpillHandle(
+            self._path,
+            offset,
+            len(data),
+            hashlib.blake2b(data, digest_size=16).digest(),
+        )
+
+    def adopt(self, handle: SpillHandle) -> SpillHandle:
+        """Take over a worker's spill file (see spill_text) without reading it.
+
+        The file is moved next to the store's own, so it outlives the pool
+        that wrote it and is read back only when the page is needed.
+
+        Returns:
+            A handle to the same bytes at the file's new path.
+
+        Raises:
+            OSError: If the file can't be moved.
+        """
+        fd, path = tempfile.mkstemp(
+            prefix="llmstxt-page-", suffix=".bin", dir=self.directory
+        )
+        os.close(fd)
+        self._paths.append(path)
+        # A rename, or a copy where the pool's directory is on another device
+        shutil.move(handle.path, path)
+        self.adopted += 1
+        return replace(handle, path=path)
+
+    def _open(self) -> IO[bytes]:
+        fd, self._path = tempfile.mkstemp(
+            prefix="llmstxt-pages-", suffix=".bin", dir=self.directory
+        )
+        self._paths.append(self._path)
+        self._file = os.fdopen(fd, "wb")
+        return self._file
+
+    def close(self) -> None:
+        """Delete the store's files; handles it gave out become unreadable."""
+        if self._file is not None:
+            self._file.close()
+        self._cleanup()
+
+    def __enter__(self) -> PageStore:
+        """Return the store for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the store."""
+        self.close()
+
+
+def load_page_text(stored: str | SpillHandle) -> str:
+    """Markdown of a page stored by PageStore.put.
+
+    Raises:
+        OSError: If the page's file can't be read.
+        ValueError: If the bytes read don't match the handle's digest.
+    """
+    return stored if isinstance(stored, str) else read_spilled(stored)
+
+
+def stored_size(stored: str | SpillHandle) -> int:
+    """UTF-8 size in bytes of a page stored by PageStore.put.
+
+    A spilled page's size was recorded when it was stored, so it isn't read
+    back.
+    """
+    return stored.length if isinstance(stored, SpillHandle) else len(stored.encode())
+
+
+def _remove(paths: list[str]) -> None:
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
@@ -0,0 +1,296 @@
+"""Worker pools for parallel page conversion."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import multiprocessing
+import os
+import shutil
+import signal
+import sys
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, TypeVar
+
+__all__ = [
+    "KILL_GRACE_S",
+    "READ_THREADS",
+    "Executor",
+    "WorkerPool",
+    "free_threaded",
+    "interpreters_supported",
+    "resolve_jobs",
+]
+
+R = TypeVar("R")
+
+# Threads reading input files ahead of conversion. Reads mostly wait on the
+# filesystem, so a few threads hide its latency without competing for CPU.
+READ_THREADS = 4
+
+# Extra time a task gets past its page timeouts before its worker is killed
+KILL_GRACE_S = 5.0
+
+
+def _init_worker(pids: Any, memory_limit: int | None) -> None:
+    """Worker initializer: report the worker's PID and apply memory_limit."""
+    pids.put(os.getpid())
+    if memory_limit is not None:
+        _limit_memory(memory_limit)
+
+
+def _limit_memory(memory_limit: int) -> None:
+    """Worker initializer capping the memory conversions can add.
+
+    The cap is memory_limit bytes above the worker's address space once the
+    conversion stack is loaded, so the interpreter and libraries every
+    worker starts with don't count against it.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+    from llmstxt_standalone.convert import html_to_markdown
+
+    html_to_markdown("<p>Warm up</p>", None)
+    memory_limit += _address_space()
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        memory_limit = min(memory_limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+
+def _address_space() -> int:
+    """This process's virtual memory size in bytes, or 0 where unknown."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class Executor(str, Enum):
+    """What conversion workers run on."""
+
+    auto = "auto"
+    process = "process"
+    thread = "thread"
+    interpreter = "interpreter"
+
+    def resolve(self) -> Executor:
+        """The concrete executor.
+
+        auto picks threads when the GIL is off, else processes; interpreter
+        falls back to processes before Python 3.14.
+        """
+        if self is Executor.auto:
+            return Executor.thread if free_threaded() else Executor.process
+        if self is Executor.interpreter and not interpreters_supported():
+            return Executor.process
+        return self
+
+
+def free_threaded() -> bool:
+    """Whether this interpreter is running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def interpreters_supported() -> bool:
+    """Whether concurrent.futures can run tasks in subinterpreters (3.14+)."""
+    return hasattr(concurrent.futures, "InterpreterPoolExecutor")
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Resolve a --jobs value, where 0 means one worker per CPU."""
+    if jobs < 0:
+        raise ValueError(f"jobs must be >= 0, got {jobs}")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+class WorkerPool:
+    """A pool of conversion workers, plus threads for reading input.
+
+    One pool can be shared by several builds so that workers are started (and
+    their imports paid for) once, and stay busy across project boundaries.
+
+    Workers are processes by default. Thread workers skip process start-up
+    and pickling, but only convert in parallel on a free-threaded
+    interpreter (see free_threaded()). Interpreter workers run each worker
+    thread in its own subinterpreter, so they convert in parallel with the
+    GIL on, without a process per worker. Neither can be killed, so only
+    process workers support resource limits.
+
+    Optional limits guard against pathological input: each worker's address
+    space may grow by at most memory_limit bytes past its size once the
+    conversion stack is loaded (where the resource module is available;
+    without /proc, such as on macOS, the cap is absolute), and callers
+    pass page_timeout on to conversions and use task_timeout() to give up
+    on, and recycle(), a worker that hangs.
+
+    Large results come back through files in spill_dir rather than the
+    result pipe (see llmstxt_standalone.spill); the directory is removed
+    when the pool closes, so results must be loaded before then.
+    """
+
+    def __init__(
+        self,
+        jobs: int,
+        page_timeout: float | None = None,
+        memory_limit: int | None = None,
+        executor: Executor = Executor.process,
+    ) -> None:
+        """Start a pool with the given number of workers.
+
+        Args:
+            jobs: Number of workers.
+            page_timeout: Seconds one page may take to convert, or None.
+            memory_limit: Bytes each worker's address space may grow by
+                while converting, or None.
+            executor: Run workers as processes, threads or subinterpreters
+                (resolved as in Executor.resolve).
+
+        Raises:
+            ValueError: If in-process workers are combined with a resource
+                limit.
+        """
+        self.executor = executor.resolve()
+        if self.executor is not Executor.process and (
+            page_timeout is not None or memory_limit is not None
+        ):
+            raise ValueError(
+                f"{self.executor.value.capitalize()} workers don't support "
+                "page timeouts or limits"
+            )
+        self.jobs = jobs
+        self.page_timeout = page_timeout
+        self.memory_limit = memory_limit
+        # Only results from worker processes travel through a pipe
+        self.spill_dir = (
+            tempfile.mkdtemp(prefix="llmstxt-spill-")
+            if self.executor is Executor.process
+            else None
+        )
+        # Worker processes report their PIDs here, so recycle() can kill them
+        self._pids: Any = None
+        self._executor = self._start()
+        # Started on first use
+        self._readers: ThreadPoolExecutor | None = None
+        # Conversion time reported by tasks, and wall time of the runs using
+        # the pool (see record())
+        self.busy_s = 0.0
+        self.wall_s = 0.0
+
+    def _start(self) -> ProcessPoolExecutor | ThreadPoolExecutor:
+        if self.executor is Executor.thread:
+            return ThreadPoolExecutor(
+                max_workers=self.jobs, thread_name_prefix="llmstxt-convert"
+            )
+        if self.executor is Executor.interpreter:
+            # A ThreadPoolExecutor subclass (Python 3.14+, see resolve());
+            # tasks and results are pickled between interpreters
+            interpreter_pool = concurrent.futures.InterpreterPoolExecutor  # ty: ignore[unresolved-attribute]
+            return interpreter_pool(
+                max_workers=self.jobs, thread_name_prefix="llmstxt-convert"
+            )
+        self._pids = multiprocessing.SimpleQueue()
+        return ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(self._pids, self.memory_limit),
+        )
+
+    @property
+    def window(self) -> int:
+        """Number of tasks to keep in flight so no worker goes idle."""
+        return self.jobs * 4
+
+    def submit(self, fn: Callable[..., R], /, *args: Any) -> Future[R]:
+        """Schedule fn(*args) on a worker."""
+        return self._executor.submit(fn, *args)
+
+    def task_timeout(self, pages: int) -> float | None:
+        """Seconds to wait for a running task of this many pages, or None."""
+        if self.page_timeout is None:
+            return None
+        return pages * self.page_timeout + KILL_GRACE_S
+
+    def recycle(self) -> None:
+        """Kill the worker processes and start fresh ones.
+
+        Tasks that were queued or running fail with BrokenProcessPool and must
+        be submitted again.
+
+        Raises:
+            RuntimeError: If the workers run in this process, where they
+                can't be killed.
+        """
+        if self.executor is not Executor.process:
+            raise RuntimeError(
+                f"{self.executor.value.capitalize()} workers can't be recycled"
+            )
+        executor = self._executor
+        kill_workers = getattr(executor, "kill_workers", None)
+        if kill_workers is not None:
+            kill_workers()
+        else:
+            # Before Python 3.14 there is no public way to stop a running
+            # task: stop handing out tasks, then kill the workers that
+            # reported their PIDs
+            executor.shutdown(wait=False, cancel_futures=True)
+            while not self._pids.empty():
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(
+                        self._pids.get(), getattr(signal, "SIGKILL", signal.SIGTERM)
+                    )
+        executor.shutdown(wait=True, cancel_futures=True)
+        self._pids.close()
+        self._executor = self._start()
+
+    @property
+    def efficiency(self) -> float | None:
+        """Share of worker capacity spent converting, or None before any run.
+
+        1.0 means every worker converted for the whole run; time lost to
+        task overhead, idle workers or a straggler at the end lowers it.
+        """
+        if not self.wall_s:
+            return None
+        return min(1.0, self.busy_s / (self.jobs * self.wall_s))
+
+    def record(self, busy_s: float, wall_s: float) -> None:
+        """Add a run's total task conversion time and its wall time."""
+        self.busy_s += busy_s
+        self.wall_s += wall_s
+
+    def read(self, fn: Callable[..., R], /, *args: Any) -> Future[R]:
+        """Schedule fn(*args) on a reader thread in this process."""
+        if self._readers is None:
+            self._readers = ThreadPoolExecutor(
+                max_workers=READ_THREADS, thread_name_prefix="llmstxt-read"
+            )
+        return self._readers.submit(fn, *args)
+
+    def close(self) -> None:
+        """Shut down the workers and readers, waiting for running tasks."""
+        if self._readers is not None:
+            self._readers.shutdown(wait=True, cancel_futures=True)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._pids is not None:
+            self._pids.close()
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def __enter__(self) -> WorkerPool:
+        """Return the pool for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Shut down the pool."""
+        self.close()
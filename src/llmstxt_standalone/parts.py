@@ -0,0 +1,188 @@
+"""Size-bounded parts of llms-full.txt, written as pages finish."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from llmstxt_standalone.config import Config
+from llmstxt_standalone.fulltext import StagedFile
+from llmstxt_standalone.generate import (
+    FullBlock,
+    FullTextWriter,
+    ensure_safe_md_path,
+    full_header_lines,
+)
+from llmstxt_standalone.tokens import SizeUnit
+
+__all__ = [
+    "MANIFEST_FORMAT",
+    "FullPartsWriter",
+    "part_output",
+    "parts_manifest_output",
+]
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT = 1
+
+
+def part_output(full_output: str, number: int) -> str:
+    """Path of part number (1-based) of full_output, e.g. llms-full-001.txt."""
+    path = PurePosixPath(full_output)
+    return path.with_name(f"{path.stem}-{number:03d}{path.suffix}").as_posix()
+
+
+def parts_manifest_output(full_output: str) -> str:
+    """Path of the parts manifest for full_output, e.g. llms-full-parts.json."""
+    path = PurePosixPath(full_output)
+    return path.with_name(f"{path.stem}-parts.json").as_posix()
+
+
+class FullPartsWriter(FullTextWriter):
+    """Split llms-full.txt content into parts of at most max_size each.
+
+    Blocks are appended to the current part as the build produces them (see
+    FullText), so parts hold exactly what llms-full.txt would, and a new
+    part starts whenever the next block would overflow it. A page is never
+    split, so a page larger than max_size gets a part of its own. Each part
+    starts with the llms-full.txt header.
+
+    Parts are staged next to their final paths (see StagedFile). commit()
+    puts them in place along with a JSON manifest listing every part with
+    the pages it holds and their byte ranges, and removes parts that the
+    previous manifest listed but this split no longer has. A build that
+    stops before commit() leaves the previous parts untouched.
+    """
+
+    noun = "parts"
+
+    def __init__(
+        self,
+        config: Config,
+        out_dir: Path,
+        max_size: int,
+        unit: SizeUnit = SizeUnit.bytes,
+        dry_run: bool = False,
+    ) -> None:
+        """Set up the writer; parts are created as content arrives.
+
+        Args:
+            config: Resolved configuration.
+            out_dir: Output directory; part and manifest paths are derived
+                from config.full_output.
+            max_size: Maximum part size, in unit.
+            unit: Whether max_size counts bytes, characters or tokens (see
+                config.tokenizer).
+            dry_run: If True, count parts without writing anything.
+
+        Raises:
+            ValueError: If config.full_output is not a safe relative path.
+        """
+        ensure_safe_md_path(config.full_output)
+        self.config = config
+        # Reported in progress output
+        self.path = out_dir / parts_manifest_output(config.full_output)
+        self.out_dir = out_dir
+        self.max_size = max_size
+        self.dry_run = dry_run
+        self.count = 0
+        self._measure = unit.measure(config.tokenizer)
+        self._unit = unit
+        self._header = "\n".join(full_header_lines(config, config.site_name))
+        self._parts: list[dict[str, Any]] = []
+        self._files: list[StagedFile] = []
+        self._part_size = 0
+
+    def write(self, block: FullBlock) -> None:
+        """Append a block, starting a new part if it would overflow this one.
+
+        Raises:
+            OSError: If a part can't be written.
+        """
+        text = f"\n{block.text}"
+        size = self._measure(text)
+        if not self._parts or (
+            self._parts[-1]["pages"] and self._part_size + size > self.max_size
+        ):
+            self._start_part()
+        part = self._parts[-1]
+        length = self._files[-1].write(text)
+        part["pages"].append(
+            {
+                "md_path": block.md_path,
+                "title": block.title,
+                "section": block.section,
+                "offset": part["bytes"] + 1,
+                "length": length - 1,
+            }
+        )
+        part["bytes"] += length
+        self._part_size += size
+
+    def _start_part(self) -> None:
+        if self._files:
+            self._files[-1].close()
+        self.count += 1
+        path = part_output(self.config.full_output, self.count)
+        file = StagedFile(self.out_dir / path, self.dry_run)
+        self._files.append(file)
+        self._parts.append(
+            {"path": path, "bytes": file.write(self._header), "pages": []}
+        )
+        self._part_size = self._measure(self._header)
+
+    def manifest(self) -> dict[str, Any]:
+        """Manifest of the parts written so far."""
+        return {
+            "format": MANIFEST_FORMAT,
+            "full_output": self.config.full_output,
+            "max_size": self.max_size,
+            "unit": self._unit.value,
+            "parts": self._parts,
+        }
+
+    def commit(self) -> None:
+        """Put the parts and manifest in place and remove stale parts.
+
+        Raises:
+            OSError: If a part or the manifest can't be put in place.
+        """
+        if self.dry_run:
+            return
+        previous = self._previous_parts()
+        for file in self._files:
+            file.commit()
+        manifest = StagedFile(self.path)
+        try:
+            manifest.write(
+                json.dumps(self.manifest(), ensure_ascii=False, indent=2) + "\n"
+            )
+            manifest.commit()
+        finally:
+            manifest.discard()
+        # Remove parts left over from an earlier, larger split
+        for path in previous - {part["path"] for part in self._parts}:
+            (self.out_dir / path).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Discard parts that weren't committed."""
+        # Last first, so the first part can remove directories it created
+        for file in reversed(self._files):
+            file.discard()
+
+    def _previous_parts(self) -> set[str]:
+        """Part paths listed by the manifest of an earlier build, if any.
+
+        Only paths this writer would itself name a part are trusted, so an
+        edited or foreign manifest can't make it delete other files.
+        """
+        try:
+            manifest = json.loads(self.path.read_text(encoding="utf-8"))
+            listed = {part["path"] for part in manifest["parts"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return set()
+        return listed & {
+            part_output(self.config.full_output, number)
+            for number in range(1, len(listed) + 1)
+        }
@@ -0,0 +1,237 @@
+"""Sharded builds: partial result bundles and merging them."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from llmstxt_standalone.config import Config
+from llmstxt_standalone.generate import (
+    BuildResult,
+    FullText,
+    FullTextWriter,
+    PageMarkdown,
+    PageResult,
+    assemble_llms_output,
+    iter_page_paths,
+    iter_page_results,
+)
+from llmstxt_standalone.parallel import WorkerPool
+from llmstxt_standalone.trace import Tracer
+
+__all__ = [
+    "BUNDLE_FORMAT",
+    "ShardBundle",
+    "build_shard",
+    "bundle_filename",
+    "merge_bundles",
+    "parse_shard",
+    "read_bundle",
+    "shard_page_paths",
+    "write_bundle",
+]
+
+# Bump when the bundle layout changes
+BUNDLE_FORMAT = 1
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse a "K/N" shard spec.
+
+    Args:
+        spec: Shard spec such as "2/4" (1-based shard index K of N shards).
+
+    Returns:
+        Tuple of (shard, num_shards).
+
+    Raises:
+        ValueError: If spec is malformed or K is outside 1..N.
+    """
+    shard_str, sep, total_str = spec.partition("/")
+    try:
+        if not sep:
+            raise ValueError
+        shard, num_shards = int(shard_str), int(total_str)
+    except ValueError:
+        raise ValueError(f"Shard must be K/N (e.g. 1/4), got {spec!r}") from None
+    if num_shards < 1 or not 1 <= shard <= num_shards:
+        raise ValueError(f"Shard K/N needs 1 <= K <= N, got {spec!r}")
+    return shard, num_shards
+
+
+def shard_page_paths(config: Config, shard: int, num_shards: int) -> list[str]:
+    """Select the pages converted by one shard.
+
+    Distinct pages are dealt round-robin in nav order, so the split is
+    deterministic for a given config and shards get similar page counts.
+    """
+    return iter_page_paths(config)[shard - 1 :: num_shards]
+
+
+def bundle_filename(shard: int, num_shards: int) -> str:
+    """Default bundle filename for a shard."""
+    return f"llms-shard-{shard}-of-{num_shards}.json"
+
+
+@dataclass
+class ShardBundle:
+    """Partial build result produced by one shard."""
+
+    config_fingerprint: str
+    shard: int
+    num_shards: int
+    pages: list[PageResult]
+
+    def summary(self) -> BuildResult:
+        """Summarize the shard as a BuildResult without assembled text."""
+        converted = [page for page in self.pages if page.skip_reason is None]
+        return BuildResult(
+            llms_txt="",
+            llms_full_txt="",
+            pages=[PageMarkdown(page.md_path, page.content) for page in converted],
+            skipped=[
+                (page.html_path, page.skip_reason)
+                for page in self.pages
+                if page.skip_reason is not None
+            ],
+            warnings=[warning for page in converted for warning in page.warnings],
+            html_bytes=sum(page.html_bytes for page in self.pages),
+            reused_pages=sum(page.reused for page in self.pages),
+        )
+
+
+def build_shard(
+    config: Config,
+    site_dir: Path,
+    shard: int,
+    num_shards: int,
+    tracer: Tracer | None = None,
+    pool: WorkerPool | None = None,
+) -> ShardBundle:
+    """Convert the pages belonging to one shard.
+
+    Args:
+        config: Resolved configuration.
+        site_dir: Path to built HTML site directory.
+        shard: 1-based shard index.
+        num_shards: Total number of shards.
+        tracer: Optional tracer receiving per-page spans.
+        pool: Optional worker pool to convert pages in parallel.
+
+    Returns:
+        ShardBundle with the results for this shard's pages.
+    """
+    jobs = (
+        (config, site_dir, md_path)
+        for md_path in shard_page_paths(config, shard, num_shards)
+    )
+    pages = list(iter_page_results(jobs, pool=pool, tracer=tracer))
+    return ShardBundle(
+        config_fingerprint=config.fingerprint(),
+        shard=shard,
+        num_shards=num_shards,
+        pages=pages,
+    )
+
+
+def write_bundle(bundle: ShardBundle, path: Path) -> None:
+    """Write a shard bundle as JSON."""
+    data = {
+        "format": BUNDLE_FORMAT,
+        "config_fingerprint": bundle.config_fingerprint,
+        "shard": bundle.shard,
+        "num_shards": bundle.num_shards,
+        "pages": [page.to_json() for page in bundle.pages],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def read_bundle(path: Path) -> ShardBundle:
+    """Read a shard bundle written by write_bundle.
+
+    Raises:
+        ValueError: If the file is not a bundle in the current format.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"unsupported bundle format {data.get('format')!r}")
+        return ShardBundle(
+            config_fingerprint=data["config_fingerprint"],
+            shard=data["shard"],
+            num_shards=data["num_shards"],
+            pages=[PageResult.from_json(page) for page in data["pages"]],
+        )
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid shard bundle {path}: {exc}") from None
+
+
+def merge_bundles(
+    config: Config,
+    bundles: Sequence[ShardBundle],
+    tracer: Tracer | None = None,
+    on_page: Callable[[PageResult], None] | None = None,
+    section_files: bool = False,
+    full_writers: Sequence[FullTextWriter] | None = None,
+) -> BuildResult:
+    """Combine a complete set of shard bundles into the final build result.
+
+    Output is assembled exactly as build_llms_output would for an unsharded
+    build of the same config.
+
+    Args:
+        config: Resolved configuration the shards were built with.
+        bundles: One bundle per shard, in any order.
+        tracer: Optional tracer receiving an "assemble" span.
+        on_page: Optional callback receiving each distinct page's result in
+            nav order, as build_llms_output would.
+        section_files: Also assemble per-section full-content files.
+        full_writers: Outputs receiving llms-full.txt's blocks (see
+            FullText), instead of the result's llms_full_txt and
+            section_full_txts.
+
+    Returns:
+        BuildResult identical to an unsharded build.
+
+    Raises:
+        ValueError: If bundles were built from a different config, or the
+            set of shards is incomplete or inconsistent.
+    """
+    if not bundles:
+        raise ValueError("No shard bundles given")
+    fingerprint = config.fingerprint()
+    num_shards = bundles[0].num_shards
+    for bundle in bundles:
+        if bundle.config_fingerprint != fingerprint:
+            raise ValueError(
+                f"Shard {bundle.shard}/{bundle.num_shards} was built from a "
+                "different config"
+            )
+        if bundle.num_shards != num_shards:
+            raise ValueError("Shard bundles disagree on the number of shards")
+
+    shards = sorted(bundle.shard for bundle in bundles)
+    if shards != list(range(1, num_shards + 1)):
+        raise ValueError(f"Expected shards 1..{num_shards} exactly once, got {shards}")
+
+    results = {page.md_path: page for bundle in bundles for page in bundle.pages}
+    md_paths = iter_page_paths(config)
+    missing = [md_path for md_path in md_paths if md_path not in results]
+    if missing:
+        raise ValueError(f"Shard bundles are missing pages: {', '.join(missing)}")
+    full_text = FullText(config, full_writers, section_files=section_files)
+    for md_path in md_paths:
+        if on_page is not None:
+            on_page(results[md_path])
+        full_text.add(results[md_path])
+
+    return assemble_llms_output(
+        config,
+        results,
+        tracer=tracer,
+        section_files=section_files,
+        full_text=full_text,
+    )
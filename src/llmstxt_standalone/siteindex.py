@@ -0,0 +1,117 @@
+"""In-memory index of a built site's directory tree."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path, PurePath
+from typing import NamedTuple
+
+__all__ = ["SiteIndex"]
+
+
+class _Entry(NamedTuple):
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool
+    # Caches its stat() result, so sizes are fetched at most once
+    dir_entry: os.DirEntry[str]
+
+
+class SiteIndex:
+    """Answer "is this a file inside the site?" from cached directory listings.
+
+    Each directory is listed with os.scandir the first time a lookup passes
+    through it, and its resolved location is derived from its parent's, so
+    only symlinks cost a realpath call, once each. Lookups after that are
+    dictionary hits instead of per-page resolve() and exists() calls, which
+    add up on network and overlay filesystems.
+
+    The index is a snapshot: files created after a directory was listed are
+    not seen. Build one per build.
+    """
+
+    def __init__(self, site_dir: Path) -> None:
+        """Set up an empty index; nothing is read until the first lookup.
+
+        Args:
+            site_dir: Built site directory.
+        """
+        self.site_dir = site_dir
+        self._root = site_dir.resolve(strict=False)
+        # Listings keyed by resolved directory path
+        self._listings: dict[Path, dict[str, _Entry]] = {}
+        # Symlink targets keyed by the link's resolved parent / name
+        self._links: dict[Path, Path] = {}
+
+    def _listing(self, directory: Path) -> dict[str, _Entry]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        listing[entry.name] = _Entry(
+                            entry.is_dir(), entry.is_file(), entry.is_symlink(), entry
+                        )
+            except OSError:
+                # Unreadable directories hold nothing we can convert
+                pass
+            self._listings[directory] = listing
+        return listing
+
+    def _resolve_link(self, path: Path) -> Path:
+        target = self._links.get(path)
+        if target is None:
+            target = self._links[path] = Path(os.path.realpath(path))
+        return target
+
+    def is_file(self, rel_path: PurePath, label: str = "Path") -> bool:
+        """Whether site_dir / rel_path is a file.
+
+        Args:
+            rel_path: Path relative to site_dir, without ".." parts.
+            label: What the path is, for the error message.
+
+        Returns:
+            True if the path exists and is a file (or a symlink to one).
+
+        Raises:
+            ValueError: If the path, or a directory on the way to it,
+                resolves outside site_dir.
+        """
+        return self._file_entry(rel_path, label) is not None
+
+    def file_size(self, rel_path: PurePath) -> int:
+        """Size in bytes of the file at site_dir / rel_path.
+
+        Returns:
+            The size, or 0 if the path is not a file inside site_dir or
+            can't be stat'ed.
+        """
+        try:
+            entry = self._file_entry(rel_path, "Path")
+            return entry.dir_entry.stat().st_size if entry is not None else 0
+        except (OSError, ValueError):
+            return 0
+
+    def _file_entry(self, rel_path: PurePath, label: str) -> _Entry | None:
+        directory = self._root
+        parts = rel_path.parts
+        for depth, name in enumerate(parts, 1):
+            entry = self._listing(directory).get(name)
+            if entry is None:
+                return None
+            resolved = directory / name
+            if entry.is_symlink:
+                resolved = self._resolve_link(resolved)
+                if not resolved.is_relative_to(self._root):
+                    raise ValueError(
+                        f"{label} resolves outside {self._root}: "
+                        f"{self.site_dir / rel_path}"
+                    )
+            if depth == len(parts):
+                return entry if entry.is_file else None
+            if not entry.is_dir:
+                return None
+            directory = resolved
+        return None
@@ -0,0 +1,72 @@
+"""Hand large conversion results from workers to the parent through files.
+
+Returning a page's markdown from a worker process pickles it, pushes it
+through a pipe in chunks and unpickles it again. Above SPILL_MIN_BYTES a
+worker instead writes the UTF-8 text to a spill file of its own, in a
+directory owned by the pool, and returns a small SpillHandle; the parent
+reads the bytes back with one read, or takes the file over as it is (see
+PageStore.adopt).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = ["SPILL_MIN_BYTES", "SpillHandle", "read_spilled", "spill_text"]
+
+# Results smaller than this travel with the task result as usual
+SPILL_MIN_BYTES = 64 * 1024
+
+# Numbers this process's spill files
+_counter = itertools.count()
+
+
+@dataclass(frozen=True)
+class SpillHandle:
+    """Where a worker wrote a result: file, byte range and BLAKE2b digest."""
+
+    path: str
+    offset: int
+    length: int
+    digest: bytes
+
+
+def spill_text(text: str, spill_dir: str) -> SpillHandle:
+    """Write text to a new spill file in spill_dir.
+
+    Files are named after the process's PID and a counter, so workers never
+    contend for a file. Each result gets a file of its own, so the parent
+    can move a result's file rather than copy its bytes.
+    """
+    data = text.encode("utf-8")
+    path = Path(spill_dir) / f"{os.getpid()}-{next(_counter)}.bin"
+    with open(path, "wb") as file:
+        file.write(data)
+    return SpillHandle(
+        str(path),
+        0,
+        len(data),
+        hashlib.blake2b(data, digest_size=16).digest(),
+    )
+
+
+def read_spilled(handle: SpillHandle) -> str:
+    """Read back text written by spill_text.
+
+    Raises:
+        OSError: If the spill file can't be read.
+        ValueError: If the bytes read don't match the handle's digest.
+    """
+    with open(handle.path, "rb") as file:
+        file.seek(handle.offset)
+        data = file.read(handle.length)
+    if hashlib.blake2b(data, digest_size=16).digest() != handle.digest:
+        raise ValueError(
+            f"Spilled result is corrupt: {handle.path} "
+            f"[{handle.offset}:{handle.offset + handle.length}]"
+        )
+    return data.decode("utf-8")
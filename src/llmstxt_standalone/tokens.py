@@ -0,0 +1,123 @@
+"""Token counting: a built-in estimate and optional real tokenizers."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from collections.abc import Callable
+from enum import Enum
+
+__all__ = [
+    "CHARS_PER_TOKEN",
+    "DEFAULT_TOKENIZER",
+    "SizeUnit",
+    "estimate_tokens",
+    "get_tokenizer",
+    "truncate_to_tokens",
+    "utf8_len",
+]
+
+# Tokenizer used unless the config names another
+DEFAULT_TOKENIZER = "estimate"
+
+# Typical ratio for English prose and markdown with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in text.
+
+    Uses a characters-per-token ratio rather than a real tokenizer, so it is
+    fast and dependency-free but only approximate.
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@functools.cache
+def get_tokenizer(name: str = DEFAULT_TOKENIZER) -> Callable[[str], int]:
+    """Look up a token counting function by name.
+
+    Args:
+        name: "estimate" for the built-in estimate_tokens, or
+            "tiktoken:<encoding>" (e.g. "tiktoken:cl100k_base") to count
+            with tiktoken, which must be installed.
+
+    Returns:
+        Function returning the number of tokens in a string.
+
+    Raises:
+        ValueError: If the name is unknown or tiktoken is not installed.
+    """
+    if name == DEFAULT_TOKENIZER:
+        return estimate_tokens
+    kind, _, encoding_name = name.partition(":")
+    if kind != "tiktoken" or not encoding_name:
+        raise ValueError(
+            f"Unknown tokenizer {name!r}: use 'estimate' or 'tiktoken:<encoding>'"
+        )
+    try:
+        tiktoken = importlib.import_module("tiktoken")
+    except ImportError:
+        raise ValueError(
+            f"Tokenizer {name!r} needs tiktoken: "
+            "pip install 'llmstxt-standalone[tiktoken]'"
+        ) from None
+    encoding = tiktoken.get_encoding(encoding_name)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(
+    text: str, max_tokens: int, count: Callable[[str], int] = estimate_tokens
+) -> str:
+    """Cut text to at most max_tokens, preferring to end at a line break.
+
+    Args:
+        text: Text to shorten.
+        max_tokens: Token budget.
+        count: Token counting function (see get_tokenizer).
+
+    Returns:
+        text itself if it fits, else its longest fitting prefix, shortened to
+        the last line break in its second half if there is one.
+    """
+    if count(text) <= max_tokens:
+        return text
+    # Longest prefix within budget; token counts grow with prefix length
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    prefix = text[:low]
+    line_end = prefix.rfind("\n")
+    if line_end >= len(prefix) // 2:
+        prefix = prefix[:line_end]
+    return prefix.rstrip()
+
+
+def utf8_len(text: str) -> int:
+    """Size of text in bytes when encoded as UTF-8."""
+    return len(text.encode("utf-8"))
+
+
+class SizeUnit(str, Enum):
+    """How text sizes are measured."""
+
+    bytes = "bytes"
+    chars = "chars"
+    tokens = "tokens"
+
+    def measure(self, tokenizer: str = DEFAULT_TOKENIZER) -> Callable[[str], int]:
+        """Size function for this unit.
+
+        Args:
+            tokenizer: Tokenizer counting the tokens unit (see get_tokenizer).
+
+        Raises:
+            ValueError: If the tokens unit's tokenizer is unavailable.
+        """
+        if self is SizeUnit.bytes:
+            return utf8_len
+        return len if self is SizeUnit.chars else get_tokenizer(tokenizer)
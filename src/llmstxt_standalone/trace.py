@@ -0,0 +1,149 @@
+"""Span recording in Chrome Trace Event Format."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "maybe_span",
+    "worker_id",
+]
+
+
+def worker_id() -> str:
+    """Identify the current worker as "<process name>:<thread name>"."""
+    process = multiprocessing.current_process().name
+    return f"{process}:{threading.current_thread().name}"
+
+
+@dataclass
+class Span:
+    """A completed span with absolute monotonic timestamps in nanoseconds."""
+
+    name: str
+    start_ns: int
+    end_ns: int
+    pid: int
+    tid: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_s(self) -> float:
+        """Span duration in seconds."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class Tracer:
+    """Collect spans for a build.
+
+    Nested spans inherit the args of their enclosing span on the same thread,
+    so a stage span opened deep inside conversion code is still tagged with
+    the page it belongs to.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty tracer anchored at the current time."""
+        self.spans: list[Span] = []
+        self.origin_ns = time.perf_counter_ns()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list[dict[str, Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Generator[dict[str, Any], None, None]:
+        """Record a span around the wrapped block.
+
+        Args:
+            name: Span name (e.g. "read", "convert").
+            **args: Extra tags; merged over those of the enclosing span.
+
+        Yields:
+            The span's args, for tags only known once the block has run.
+        """
+        stack = self._stack()
+        merged = {**stack[-1], **args} if stack else {"worker": worker_id(), **args}
+        stack.append(merged)
+        start = time.perf_counter_ns()
+        try:
+            yield merged
+        finally:
+            end = time.perf_counter_ns()
+            stack.pop()
+            self.add(
+                Span(
+                    name=name,
+                    start_ns=start,
+                    end_ns=end,
+                    pid=os.getpid(),
+                    tid=threading.get_native_id(),
+                    args=merged,
+                )
+            )
+
+    def add(self, *spans: Span) -> None:
+        """Add already-completed spans (e.g. collected in a worker process)."""
+        with self._lock:
+            self.spans.extend(spans)
+
+    def to_trace_events(self) -> dict[str, Any]:
+        """Render spans as a Trace Event Format document.
+
+        Returns:
+            JSON-serializable mapping loadable by Perfetto and chrome://tracing.
+        """
+        events: list[dict[str, Any]] = []
+        thread_names: dict[tuple[int, int], str] = {}
+        for span in self.spans:
+            thread_names.setdefault((span.pid, span.tid), span.args.get("worker", ""))
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "build",
+                    "ph": "X",
+                    "ts": (span.start_ns - self.origin_ns) / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": span.pid,
+                    "tid": span.tid,
+                    "args": span.args,
+                }
+            )
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for (pid, tid), name in thread_names.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        """Write the trace as JSON to path."""
+        path.write_text(json.dumps(self.to_trace_events()), encoding="utf-8")
+
+
+def maybe_span(
+    tracer: Tracer | None, name: str, **args: Any
+) -> AbstractContextManager[dict[str, Any]]:
+    """Return tracer.span(...), or a no-op context when tracing is disabled."""
+    if tracer is None:
+        return nullcontext({})
+    return tracer.span(name, **args)
@@ -0,0 +1,150 @@
+"""Tests for build checkpoints and resuming."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone import generate
+from llmstxt_standalone.checkpoint import Checkpoint
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import PageResult, build_llms_output
+from llmstxt_standalone.parallel import WorkerPool
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site_edge_cases", site_dir)
+    return site_dir
+
+
+@pytest.fixture
+def config():
+    return load_config(FIXTURES / "mkdocs_edge_cases.yml")
+
+
+@pytest.fixture
+def converted(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """md_paths converted in this process, in order."""
+    convert_html = generate.convert_html
+    paths: list[str] = []
+
+    def counting_convert_html(request, tracer=None):
+        paths.append(request.md_path)
+        return convert_html(request, tracer=tracer)
+
+    monkeypatch.setattr(generate, "convert_html", counting_convert_html)
+    return paths
+
+
+def _interrupted_build(config, site_dir: Path, checkpoint_dir: Path, pages: int):
+    """Run a checkpointed build that dies after the given number of pages."""
+    finished: list[PageResult] = []
+
+    def on_page(result: PageResult) -> None:
+        finished.append(result)
+        if len(finished) == pages:
+            raise KeyboardInterrupt
+
+    with (
+        pytest.raises(KeyboardInterrupt),
+        Checkpoint(checkpoint_dir, config, site_dir) as checkpoint,
+    ):
+        build_llms_output(config, site_dir, on_page=on_page, checkpoint=checkpoint)
+
+
+def test_resume_matches_uninterrupted_build(
+    config, site_dir: Path, tmp_path: Path, converted: list[str]
+):
+    expected = build_llms_output(config, site_dir)
+    _interrupted_build(config, site_dir, tmp_path / "ckpt", pages=2)
+    converted.clear()
+
+    with Checkpoint(tmp_path / "ckpt", config, site_dir, resume=True) as checkpoint:
+        result = build_llms_output(config, site_dir, checkpoint=checkpoint)
+
+    assert result == expected
+    assert checkpoint.restored == 2
+    assert len(converted) == len(expected.pages) - 2
+
+
+def test_pooled_resume_matches_uninterrupted_build(
+    config, site_dir: Path, tmp_path: Path
+):
+    expected = build_llms_output(config, site_dir)
+    _interrupted_build(config, site_dir, tmp_path / "ckpt", pages=1)
+
+    with (
+        WorkerPool(2) as pool,
+        Checkpoint(tmp_path / "ckpt", config, site_dir, resume=True) as checkpoint,
+    ):
+        result = build_llms_output(config, site_dir, pool=pool, checkpoint=checkpoint)
+
+    assert result == expected
+    assert checkpoint.restored == 1
+
+
+def test_resume_reconverts_changed_pages(
+    config, site_dir: Path, tmp_path: Path, converted: list[str]
+):
+    with Checkpoint(tmp_path / "ckpt", config, site_dir) as checkpoint:
+        build_llms_output(config, site_dir, checkpoint=checkpoint)
+    page = site_dir / "faq" / "index.html"
+    page.write_text(
+        page.read_text(encoding="utf-8").replace("</article>", "<p>New</p></article>"),
+        encoding="utf-8",
+    )
+    converted.clear()
+
+    with Checkpoint(tmp_path / "ckpt", config, site_dir, resume=True) as checkpoint:
+        result = build_llms_output(config, site_dir, checkpoint=checkpoint)
+
+    assert converted == ["faq.md"]
+    assert result == build_llms_output(config, site_dir)
+
+
+def test_resume_ignores_checkpoint_of_other_config(
+    config, site_dir: Path, tmp_path: Path, converted: list[str]
+):
+    with Checkpoint(tmp_path / "ckpt", config, site_dir) as checkpoint:
+        build_llms_output(config, site_dir, checkpoint=checkpoint)
+    config.content_selector = "article"
+    converted.clear()
+
+    with Checkpoint(tmp_path / "ckpt", config, site_dir, resume=True) as checkpoint:
+        result = build_llms_output(config, site_dir, checkpoint=checkpoint)
+
+    assert checkpoint.stale
+    assert checkpoint.restored == 0
+    assert len(converted) == len(result.pages)
+
+
+def test_resume_drops_torn_journal_line(config, site_dir: Path, tmp_path: Path):
+    expected = build_llms_output(config, site_dir)
+    with Checkpoint(tmp_path / "ckpt", config, site_dir) as checkpoint:
+        build_llms_output(config, site_dir, checkpoint=checkpoint)
+    journal = tmp_path / "ckpt" / "journal.jsonl"
+    lines = journal.read_bytes().splitlines(keepends=True)
+    journal.write_bytes(b"".join(lines[:-1]) + lines[-1][:20])
+
+    with Checkpoint(tmp_path / "ckpt", config, site_dir, resume=True) as checkpoint:
+        result = build_llms_output(config, site_dir, checkpoint=checkpoint)
+
+    assert result == expected
+    assert checkpoint.restored == len(lines) - 2
+    # The torn line was replaced, so the next resume restores every page
+    with Checkpoint(tmp_path / "ckpt", config, site_dir, resume=True) as checkpoint:
+        build_llms_output(config, site_dir, checkpoint=checkpoint)
+    assert checkpoint.restored == len(lines) - 1
+
+
+def test_remove(config, site_dir: Path, tmp_path: Path):
+    checkpoint = Checkpoint(tmp_path / "ckpt", config, site_dir)
+    build_llms_output(config, site_dir, checkpoint=checkpoint)
+
+    checkpoint.remove()
+
+    assert not (tmp_path / "ckpt").exists()
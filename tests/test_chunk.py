@@ -0,0 +1,177 @@
+"""Tests for heading-aware chunk export."""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from llmstxt_standalone.chunk import (
+    ChunkWriter,
+    chunk_markdown,
+    chunk_page,
+    slugify,
+)
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import PageResult
+from llmstxt_standalone.tokens import SizeUnit, estimate_tokens, get_tokenizer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+PAGE = """\
+# Guide
+
+Intro paragraph.
+
+## Install
+
+Run pip.
+
+### From source
+
+Clone the repo.
+
+## Usage
+
+```python
+## not a heading
+print("hi")
+```
+"""
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_slugify():
+    assert slugify("Getting Started") == "getting-started"
+    assert slugify("The `build` command!") == "the-build-command"
+    assert slugify("[Links](https://example.com) & more") == "links-more"
+    assert slugify("Café") == "cafe"
+
+
+def test_chunk_markdown_splits_at_h2_and_h3():
+    chunks = chunk_markdown(PAGE, max_size=1000)
+
+    assert [(crumbs, anchor) for crumbs, anchor, _ in chunks] == [
+        ([], None),
+        (["Install"], "install"),
+        (["Install", "From source"], "from-source"),
+        (["Usage"], "usage"),
+    ]
+    assert chunks[0][2] == "# Guide\n\nIntro paragraph."
+    # Headings inside code fences don't start a chunk
+    assert "## not a heading" in chunks[3][2]
+
+
+def test_chunk_markdown_skips_heading_only_sections():
+    chunks = chunk_markdown("## Empty\n\n## Full\n\nText.\n", max_size=1000)
+
+    assert [anchor for _, anchor, _ in chunks] == ["full"]
+
+
+def test_chunk_markdown_deduplicates_anchors():
+    markdown = "## Options\n\na\n\n## Options\n\nb\n\n## Options\n\nc\n"
+
+    chunks = chunk_markdown(markdown, max_size=1000)
+
+    assert [anchor for _, anchor, _ in chunks] == ["options", "options_1", "options_2"]
+
+
+def test_chunk_markdown_caps_size_in_chars():
+    paragraphs = [f"Paragraph {i} " + "x" * 40 for i in range(10)]
+    markdown = "## Long\n\n" + "\n\n".join(paragraphs) + "\n\n" + "y" * 250
+
+    chunks = chunk_markdown(markdown, max_size=120)
+
+    assert len(chunks) > 1
+    assert all(len(text) <= 120 for _, _, text in chunks)
+    assert all(anchor == "long" for _, anchor, _ in chunks)
+    # Paragraphs that fit are never cut
+    texts = "\n\n".join(text for _, _, text in chunks)
+    assert all(paragraph in texts for paragraph in paragraphs)
+
+
+def test_chunk_markdown_caps_size_in_tokens():
+    markdown = "## Long\n\n" + "\n\n".join("word " * 20 for _ in range(10))
+
+    chunks = chunk_markdown(markdown, max_size=60, unit=SizeUnit.tokens)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(text) <= 60 for _, _, text in chunks)
+
+
+def test_chunk_page_counts_with_configured_tokenizer(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+):
+    """Test chunk sizes and token counts use config.tokenizer."""
+    # A stand-in tiktoken whose tokens are words
+    encoding = SimpleNamespace(encode=lambda text, disallowed_special: text.split())
+    monkeypatch.setitem(
+        sys.modules, "tiktoken", SimpleNamespace(get_encoding=lambda name: encoding)
+    )
+    request.addfinalizer(get_tokenizer.cache_clear)
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.tokenizer = "tiktoken:words"
+    markdown = "## Long\n\n" + "\n\n".join("word " * 20 for _ in range(10))
+    result = PageResult("long.md", Path("site/long/index.html"), "Long", markdown)
+
+    chunks = chunk_page(config, result, "Docs", max_size=60, unit=SizeUnit.tokens)
+
+    assert len(chunks) == 4
+    assert all(chunk.tokens == len(chunk.text.split()) <= 60 for chunk in chunks)
+    assert chunks[0].to_json()["tokens"] == chunks[0].tokens
+
+
+def test_chunk_markdown_keeps_small_code_fence_whole():
+    fence = "```\n" + "\n\n".join(f"line {i}" for i in range(5)) + "\n```"
+    markdown = "## Code\n\n" + "x" * 80 + "\n\n" + fence
+
+    chunks = chunk_markdown(markdown, max_size=len(fence) + 5)
+
+    assert any(text == fence for _, _, text in chunks)
+
+
+def test_chunk_page_ids_are_stable():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    result = PageResult("guide.md", Path("site/guide/index.html"), "Guide", PAGE)
+
+    chunks = chunk_page(config, result, "Docs", max_size=1000)
+    edited = PAGE.replace("Clone the repo.", "Clone the repository.")
+    edited_chunks = chunk_page(
+        config, PageResult("guide.md", result.html_path, "Guide", edited), "Docs", 1000
+    )
+
+    assert chunks == chunk_page(config, result, "Docs", max_size=1000)
+    assert [a.id == b.id for a, b in zip(chunks, edited_chunks, strict=True)] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert chunks[2].url == f"{config.site_url}/guide/#from-source"
+    assert chunks[0].url == f"{config.site_url}/guide/"
+    assert chunks[2].markdown_url == f"{config.site_url}/guide/index.md"
+    assert chunks[2].headings == ["Guide", "Install", "From source"]
+    assert [chunk.index for chunk in chunks] == [0, 1, 2, 3]
+
+
+def test_chunk_writer(tmp_path: Path):
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    md_path = next(iter(next(iter(config.sections.values()))))
+    path = tmp_path / "chunks.jsonl"
+
+    with ChunkWriter(config, path, max_size=1000) as writer:
+        writer.write(PageResult(md_path, Path("x.html"), "Guide", PAGE))
+        writer.write(PageResult(md_path, Path("x.html"), "", "", skip_reason="gone"))
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert writer.count == len(records) == 4
+    assert records[1]["text"] == "## Install\n\nRun pip."
+    assert records[1]["chars"] == len(records[1]["text"])
+    assert records[1]["tokens"] == estimate_tokens(records[1]["text"])
+    assert records[1]["section"] == next(iter(config.sections))
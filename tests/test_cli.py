@@ -1,8 +1,11 @@
 """Tests for CLI."""
 
+import concurrent.futures
+import json
 import shutil
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from llmstxt_standalone.cli import app
@@ -520,3 +523,755 @@ def test_validate_verbose():
     assert "Config valid" in result.output
     # Verbose should show section names
     assert "Getting Started" in result.output
+
+
+def test_build_trace_writes_trace_events(tmp_path: Path):
+    """Test --trace writes a Trace Event Format file with build spans."""
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    trace_path = tmp_path / "trace.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "--config",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "--site-dir",
+            str(tmp_path / "site"),
+            "--trace",
+            str(trace_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    names = {e["name"] for e in events if e["ph"] == "X"}
+    assert {"load_config", "page", "write", "write_outputs"} <= names
+
+
+def test_build_metrics_file(tmp_path: Path):
+    """Test --metrics-file writes OpenMetrics text."""
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    metrics_path = tmp_path / "llmstxt.prom"
+
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "--config",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "--site-dir",
+            str(tmp_path / "site"),
+            "--metrics-file",
+            str(metrics_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    text = metrics_path.read_text(encoding="utf-8")
+    assert 'llmstxt_pages_converted_total{site="Test Site"} 2.0' in text
+    assert "llmstxt_stage_duration_seconds_bucket" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_build_metrics_count_config_cache_lookups(tmp_path: Path):
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    metrics_path = tmp_path / "llmstxt.prom"
+    args = [
+        "build",
+        "--config",
+        str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+        "--site-dir",
+        str(tmp_path / "site"),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--metrics-file",
+        str(metrics_path),
+    ]
+
+    assert runner.invoke(app, args).exit_code == 0
+    first = metrics_path.read_text(encoding="utf-8")
+    assert runner.invoke(app, args).exit_code == 0
+    second = metrics_path.read_text(encoding="utf-8")
+
+    site = 'site="Test Site"'
+    assert f'llmstxt_config_cache_lookups_total{{{site},result="miss"}} 1.0' in first
+    assert f'llmstxt_config_cache_lookups_total{{{site},result="hit"}} 0.0' in first
+    assert f'llmstxt_config_cache_lookups_total{{{site},result="hit"}} 1.0' in second
+
+
+def test_validate_with_cache_dir(tmp_path: Path):
+    """Test validate --cache-dir populates and then reuses the config cache."""
+    cache_dir = tmp_path / "cache"
+    args = [
+        "validate",
+        "--config",
+        str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+        "--cache-dir",
+        str(cache_dir),
+    ]
+
+    first = runner.invoke(app, args)
+    second = runner.invoke(app, args)
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert first.output == second.output
+    assert len(list(cache_dir.glob("config-*.json"))) == 1
+
+
+def test_build_shards_then_merge_matches_build(tmp_path: Path):
+    """Test build --shard K/N on each shard plus merge reproduces a full build."""
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    site_dir = tmp_path / "site"
+    bundles_dir = tmp_path / "bundles"
+
+    for shard in ("1/2", "2/2"):
+        result = runner.invoke(
+            app,
+            [
+                "build",
+                "--config",
+                config,
+                "--site-dir",
+                str(site_dir),
+                "--output-dir",
+                str(bundles_dir),
+                "--shard",
+                shard,
+            ],
+        )
+        assert result.exit_code == 0
+        assert f"shard {shard}" in result.output
+    # Shard builds only write their bundle
+    assert sorted(p.name for p in bundles_dir.iterdir()) == [
+        "llms-shard-1-of-2.json",
+        "llms-shard-2-of-2.json",
+    ]
+
+    merged_dir = tmp_path / "merged"
+    result = runner.invoke(
+        app,
+        [
+            "merge",
+            "--config",
+            config,
+            "--output-dir",
+            str(merged_dir),
+            *(str(p) for p in sorted(bundles_dir.iterdir())),
+        ],
+    )
+    assert result.exit_code == 0
+
+    full_dir = tmp_path / "full"
+    result = runner.invoke(
+        app,
+        ["build", "--config", config, "--site-dir", str(site_dir), "-o", str(full_dir)],
+    )
+    assert result.exit_code == 0
+    for name in ("llms.txt", "llms-full.txt", "index.md", "install/index.md"):
+        assert (merged_dir / name).read_text(encoding="utf-8") == (
+            full_dir / name
+        ).read_text(encoding="utf-8")
+
+
+def test_build_invalid_shard():
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "--config",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "--shard",
+            "3/2",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "K/N" in result.output
+
+
+def test_merge_incomplete_shards(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    runner.invoke(
+        app,
+        ["build", "-c", config, "-s", str(tmp_path / "site"), "--shard", "1/2"],
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "merge",
+            "-c",
+            config,
+            "-o",
+            str(tmp_path / "out"),
+            str(tmp_path / "site" / "llms-shard-1-of-2.json"),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "exactly once" in result.output
+    assert not (tmp_path / "out").exists()
+
+
+def test_build_jobs_matches_sequential(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    for out, extra in (("seq", []), ("par", ["--jobs", "2"])):
+        result = runner.invoke(
+            app,
+            ["build", "-c", config, "-s", site_dir, "-o", str(tmp_path / out), *extra],
+        )
+        assert result.exit_code == 0
+
+    for name in ("llms.txt", "llms-full.txt", "index.md"):
+        assert (tmp_path / "par" / name).read_bytes() == (
+            tmp_path / "seq" / name
+        ).read_bytes()
+
+
+def test_build_jobs_verbose_reports_workers(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    result = runner.invoke(
+        app,
+        ["build", "-c", config, "-s", site_dir, "-o", str(tmp_path), "-j", "2", "-v"],
+    )
+
+    assert result.exit_code == 0
+    assert "Workers: 2 converting" in result.output
+
+
+def test_build_checkpoint_resume(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    checkpoint = tmp_path / "ckpt"
+    result = runner.invoke(
+        app,
+        [
+            *("build", "-c", config, "-s", site_dir, "-o", str(tmp_path / "out")),
+            *("--checkpoint", str(checkpoint), "--resume", "-v"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Resumed 0 pages" in result.output
+    assert (tmp_path / "out" / "llms-full.txt").exists()
+    # Removed once every output is written
+    assert not checkpoint.exists()
+
+
+def test_build_resume_needs_checkpoint(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "-c",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "-s",
+            str(FIXTURES / "site"),
+            "-o",
+            str(tmp_path),
+            "--resume",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "--resume needs --checkpoint" in result.output
+
+
+def test_build_thread_executor(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    args = ["build", "-c", config, "-s", site_dir, "-j", "2"]
+    result = runner.invoke(
+        app, [*args, "-o", str(tmp_path / "thread"), "--executor", "thread"]
+    )
+    expected = runner.invoke(
+        app, [*args, "-o", str(tmp_path / "process"), "--executor", "process"]
+    )
+
+    assert result.exit_code == 0
+    assert expected.exit_code == 0
+    for name in ("llms.txt", "llms-full.txt", "install/index.md"):
+        assert (tmp_path / "thread" / name).read_text() == (
+            tmp_path / "process" / name
+        ).read_text()
+
+
+def test_build_interpreter_executor_falls_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delattr(concurrent.futures, "InterpreterPoolExecutor", raising=False)
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    result = runner.invoke(
+        app,
+        [
+            *("build", "-c", config, "-s", site_dir, "-o", str(tmp_path)),
+            *("-j", "2", "--executor", "interpreter", "-v"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Subinterpreters need Python 3.14+" in result.output
+    assert (tmp_path / "llms-full.txt").exists()
+
+
+def test_build_thread_executor_rejects_page_limits(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "-c",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "-s",
+            str(FIXTURES / "site"),
+            "-o",
+            str(tmp_path),
+            "--executor",
+            "thread",
+            "--page-timeout",
+            "5",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "need worker processes" in result.output
+
+
+def test_build_page_timeout_skips_slow_page(tmp_path: Path):
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site", site_dir)
+    (site_dir / "install" / "index.html").write_text(
+        "<html><body><p>" + "<b>x</b> <i>y</i> " * 1000 + "</p></body></html>",
+        encoding="utf-8",
+    )
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "-c",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "-s",
+            str(site_dir),
+            "--page-timeout",
+            "0.05",
+            "-v",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Conversion timed out after 0.05s" in result.output
+    assert (site_dir / "index.md").exists()
+    assert not (site_dir / "install" / "index.md").exists()
+
+
+def test_build_repeated_config_site_dir_pairs(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", config, "-s", site_dir, "-o", str(tmp_path / "a")),
+            *("-c", config, "-s", site_dir, "-o", str(tmp_path / "b")),
+            "--jobs",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Built 2 of 2 projects" in result.output
+    assert (tmp_path / "a" / "llms.txt").read_bytes() == (
+        tmp_path / "b" / "llms.txt"
+    ).read_bytes()
+
+
+def test_build_repeated_config_needs_matching_site_dirs():
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    result = runner.invoke(app, ["build", "-c", config, "-c", config, "-s", "site"])
+
+    assert result.exit_code == 1
+    assert "per --config" in result.output
+
+
+def test_build_batch_file_continues_past_bad_project(tmp_path: Path):
+    """Test a batch reports a broken project but still builds the others."""
+    shutil.copy(FIXTURES / "mkdocs_with_llmstxt.yml", tmp_path / "mkdocs.yml")
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    batch = tmp_path / "batch.yml"
+    batch.write_text(
+        "projects:\n"
+        "  - mkdocs.yml\n"
+        "  - missing/mkdocs.yml\n"
+        "  - config: mkdocs.yml\n"
+        "    output_dir: out\n"
+    )
+
+    result = runner.invoke(app, ["build", "--batch", str(batch)])
+
+    assert result.exit_code == 1
+    assert "Skipped project" in result.output
+    assert "Built 2 of 3 projects" in result.output
+    assert (tmp_path / "site" / "llms.txt").exists()
+    assert (tmp_path / "out" / "llms.txt").exists()
+
+
+def test_build_batch_rejects_shard(tmp_path: Path):
+    batch = tmp_path / "batch.yml"
+    batch.write_text("- mkdocs.yml\n")
+
+    result = runner.invoke(app, ["build", "--batch", str(batch), "--shard", "1/2"])
+
+    assert result.exit_code == 1
+    assert "single project" in result.output
+
+
+def test_convert_ndjson_to_stdout():
+    paths = sorted((FIXTURES / "site").rglob("*.html"))
+    result = runner.invoke(app, ["convert", *map(str, paths)])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["path"] for r in records] == [str(p) for p in paths]
+    assert all(r["markdown"] and r["title"] for r in records)
+
+
+def test_convert_mirror_tree_from_stdin(tmp_path: Path):
+    """Test paths read from stdin are written to a mirrored .md tree."""
+    site_dir = FIXTURES / "site"
+    paths = "\n".join(str(p) for p in sorted(site_dir.rglob("*.html")))
+    out = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        ["convert", "-", "-o", str(out), "--base-dir", str(site_dir), "-j", "2"],
+        input=paths + "\n",
+    )
+
+    assert result.exit_code == 0
+    assert "Converted 2 of 2 files" in result.output
+    assert (out / "index.md").exists()
+    assert (out / "install" / "index.md").exists()
+
+
+def test_convert_reports_failures(tmp_path: Path):
+    bad = tmp_path / "bad.html"
+    bad.write_bytes(b"\xff\xfe")
+    good = FIXTURES / "site" / "index.html"
+
+    result = runner.invoke(app, ["convert", str(good), str(bad)])
+
+    assert result.exit_code == 1
+    assert "encoding errors" in result.output
+
+
+def test_convert_no_matching_inputs(tmp_path: Path):
+    result = runner.invoke(app, ["convert", str(tmp_path / "*.html")])
+
+    assert result.exit_code == 1
+    assert "No files match" in result.output
+
+
+def test_build_emit_jsonl_instead_of_full(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            "-c",
+            str(FIXTURES / "mkdocs_with_llmstxt.yml"),
+            "-s",
+            str(FIXTURES / "site"),
+            "-o",
+            str(tmp_path),
+            "--emit",
+            "jsonl",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "llms-pages.jsonl (2 pages)" in result.output
+    assert not (tmp_path / "llms-full.txt").exists()
+    lines = (tmp_path / "llms-pages.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["md_path"] for line in lines] == ["index.md", "install.md"]
+
+
+def test_merge_emit_jsonl_matches_build(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    for shard in ("1/2", "2/2"):
+        runner.invoke(
+            app,
+            [
+                "build",
+                "-c",
+                config,
+                "-s",
+                site_dir,
+                "-o",
+                str(tmp_path),
+                "--shard",
+                shard,
+            ],
+        )
+    runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", config, "-s", site_dir, "-o", str(tmp_path / "full")),
+            *("--emit", "full", "--emit", "jsonl"),
+        ],
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "merge",
+            *("-c", config, "-o", str(tmp_path / "merged"), "--emit", "jsonl"),
+            *(str(p) for p in sorted(tmp_path.glob("llms-shard-*.json"))),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert (tmp_path / "merged" / "llms-pages.jsonl").read_bytes() == (
+        tmp_path / "full" / "llms-pages.jsonl"
+    ).read_bytes()
+    assert (tmp_path / "full" / "llms-full.txt").exists()
+
+
+def test_build_shard_rejects_emit():
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", str(FIXTURES / "mkdocs_with_llmstxt.yml"), "-s", "site"),
+            *("--shard", "1/2", "--emit", "jsonl"),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "merge" in result.output
+
+
+def test_build_batch_emit_jsonl(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", config, "-s", site_dir, "-o", str(tmp_path / "a")),
+            *("-c", config, "-s", site_dir, "-o", str(tmp_path / "b")),
+            *("--emit", "jsonl", "-j", "2"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    a, b = (tmp_path / name / "llms-pages.jsonl" for name in ("a", "b"))
+    assert a.read_bytes() == b.read_bytes()
+    assert len(a.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_build_emit_chunks(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", str(FIXTURES / "mkdocs_with_llmstxt.yml")),
+            *("-s", str(FIXTURES / "site"), "-o", str(tmp_path)),
+            *("--emit", "chunks", "--chunk-size", "50", "--chunk-unit", "tokens"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    path = tmp_path / "llms-chunks.jsonl"
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert f"llms-chunks.jsonl ({len(records)} chunks)" in result.output
+    assert {r["md_path"] for r in records} == {"index.md", "install.md"}
+    assert all(r["tokens"] <= 50 for r in records)
+    assert not (tmp_path / "llms-full.txt").exists()
+
+
+def test_build_dry_run_counts_chunks(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", str(FIXTURES / "mkdocs_with_llmstxt.yml")),
+            *("-s", str(FIXTURES / "site"), "-o", str(tmp_path)),
+            *("--emit", "chunks", "--dry-run"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "chunks)" in result.output
+    assert not (tmp_path / "llms-chunks.jsonl").exists()
+
+
+def test_merge_emit_sections(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", config, "-s", str(FIXTURES / "site"), "-o", str(tmp_path)),
+            *("--shard", "1/1"),
+        ],
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "merge",
+            *("-c", config, "-o", str(tmp_path / "out"), "--emit", "sections"),
+            str(tmp_path / "llms-shard-1-of-1.json"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "1 section files" in result.output
+    section_file = tmp_path / "out" / "llms-full-getting-started.txt"
+    assert "# Installation" in section_file.read_text(encoding="utf-8")
+    assert "llms-full-getting-started.txt" in (tmp_path / "out" / "llms.txt").read_text(
+        encoding="utf-8"
+    )
+    assert not (tmp_path / "out" / "llms-full.txt").exists()
+
+
+def test_build_emit_parts(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", str(FIXTURES / "mkdocs_with_llmstxt.yml")),
+            *("-s", str(FIXTURES / "site"), "-o", str(tmp_path)),
+            *("--emit", "full", "--emit", "parts", "--part-size", "80"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "llms-full-parts.json (2 parts)" in result.output
+    manifest = json.loads((tmp_path / "llms-full-parts.json").read_text())
+    assert [part["path"] for part in manifest["parts"]] == [
+        "llms-full-001.txt",
+        "llms-full-002.txt",
+    ]
+    assert (tmp_path / "llms-full.txt").exists()
+
+
+def _budget_config(tmp_path: Path, budget: str) -> Path:
+    config = tmp_path / "mkdocs.yml"
+    config.write_text(
+        (FIXTURES / "mkdocs_with_llmstxt.yml")
+        .read_text(encoding="utf-8")
+        .replace("      sections:", f"{budget}\n      sections:"),
+        encoding="utf-8",
+    )
+    return config
+
+
+def test_build_token_budget_fail(tmp_path: Path):
+    config = _budget_config(
+        tmp_path, "      max_page_tokens: 10\n      token_budget_action: fail"
+    )
+
+    result = runner.invoke(
+        app,
+        ["build", "-c", str(config), "-s", str(FIXTURES / "site"), "-o", str(tmp_path)],
+    )
+
+    assert result.exit_code == 1
+    assert "install.md has 17 tokens, over max_page_tokens (10)" in result.output
+    assert not (tmp_path / "llms.txt").exists()
+    # Page files are held back rather than streamed when a budget can fail
+    assert not (tmp_path / "index.md").exists()
+
+
+def test_build_token_budget_fail_writes_no_exports(tmp_path: Path):
+    config = _budget_config(
+        tmp_path, "      max_page_tokens: 10\n      token_budget_action: fail"
+    )
+    out_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        [
+            *("build", "-c", str(config), "-s", str(FIXTURES / "site")),
+            *("-o", str(out_dir), "--emit", "jsonl", "--emit", "chunks"),
+            *("--emit", "parts", "--emit", "sections"),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert not out_dir.exists()
+
+
+def test_build_token_budget_fail_writes_exports_within_budget(tmp_path: Path):
+    config = _budget_config(
+        tmp_path, "      max_page_tokens: 1000\n      token_budget_action: fail"
+    )
+    out_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        [
+            *("build", "-c", str(config), "-s", str(FIXTURES / "site")),
+            *("-o", str(out_dir), "--emit", "jsonl", "--emit", "parts"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert (out_dir / "index.md").exists()
+    assert len((out_dir / "llms-pages.jsonl").read_text().splitlines()) == 2
+    assert (out_dir / "llms-full-001.txt").exists()
+    assert (out_dir / "llms-full-parts.json").exists()
+
+
+def test_build_verbose_token_report(tmp_path: Path):
+    result = runner.invoke(
+        app,
+        [
+            "build",
+            *("-c", str(FIXTURES / "mkdocs_with_llmstxt.yml")),
+            *("-s", str(FIXTURES / "site"), "-o", str(tmp_path), "--verbose"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Tokens (estimate): llms-full.txt" in result.output
+    report = result.output[result.output.index("Tokens (estimate)") :]
+    assert report.index("install.md") < report.index("index.md")
+
+
+def test_build_unavailable_tokenizer(tmp_path: Path):
+    config = _budget_config(tmp_path, "      tokenizer: words")
+
+    result = runner.invoke(
+        app, ["build", "-c", str(config), "-s", str(FIXTURES / "site")]
+    )
+
+    assert result.exit_code == 1
+    assert "Unknown tokenizer" in result.output
+
+
+def test_build_page_store_limit_spills_pages(tmp_path: Path):
+    config = str(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = str(FIXTURES / "site")
+    runner.invoke(app, ["build", "-c", config, "-s", site_dir, "-o", str(tmp_path)])
+    expected = (tmp_path / "llms-full.txt").read_text()
+    out_dir = tmp_path / "spilled"
+
+    result = runner.invoke(
+        app,
+        [
+            *("build", "-c", config, "-s", site_dir, "-o", str(out_dir)),
+            *("--page-store-limit", "0", "-v"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "pages on disk past --page-store-limit" in result.output
+    assert (out_dir / "llms-full.txt").read_text() == expected
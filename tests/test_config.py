@@ -1,10 +1,17 @@
 """Tests for configuration loading."""
 
+import shutil
 from pathlib import Path
 
 import pytest
+import yaml
 
-from llmstxt_standalone.config import load_config
+from llmstxt_standalone.config import cache as config_cache
+from llmstxt_standalone.config import load as config_load
+from llmstxt_standalone.config import load_config, load_config_cached
+from llmstxt_standalone.config.load import _PurePermissiveLoader
+
+_CPermissiveLoader = getattr(config_load, "_CPermissiveLoader", None)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -228,6 +235,44 @@ def test_load_config_null_fields_use_defaults(tmp_path: Path):
     assert cfg.sections == {}  # empty nav -> no sections
 
 
+def test_load_config_budget_and_dedup_options(tmp_path: Path):
+    config_path = tmp_path / "mkdocs.yml"
+    config_path.write_text(
+        "site_name: Test\n"
+        "plugins:\n"
+        "  - llmstxt:\n"
+        "      max_full_tokens: 100000\n"
+        "      max_page_tokens: 5000\n"
+        "      token_budget_action: truncate\n"
+        "      tokenizer: tiktoken:cl100k_base\n"
+        "      dedup: true\n"
+        "      dedup_min_chars: 120\n",
+        encoding="utf-8",
+    )
+
+    cfg = load_config(config_path)
+
+    assert cfg.max_full_tokens == 100000
+    assert cfg.max_page_tokens == 5000
+    assert cfg.token_budget_action == "truncate"
+    assert cfg.tokenizer == "tiktoken:cl100k_base"
+    assert cfg.dedup is True
+    assert cfg.dedup_min_chars == 120
+    assert cfg.dedup_similarity == 0.8
+    assert load_config(FIXTURES / "mkdocs_with_llmstxt.yml").max_full_tokens is None
+
+
+def test_load_config_invalid_token_budget_action(tmp_path: Path):
+    config_path = tmp_path / "mkdocs.yml"
+    config_path.write_text(
+        "plugins:\n  - llmstxt:\n      token_budget_action: ignore\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="'warn', 'fail' or 'truncate'"):
+        load_config(config_path)
+
+
 def test_load_config_deeply_nested_nav_raises_error(tmp_path: Path):
     """Test that excessively deep nav nesting raises ValueError, not RecursionError."""
     # Build a deeply nested nav structure as a string (500 levels - exceeds recursion limit)
@@ -244,3 +289,164 @@ def test_load_config_deeply_nested_nav_raises_error(tmp_path: Path):
 
     with pytest.raises(ValueError, match="nav structure too deeply nested"):
         load_config(config_path)
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available")
+@pytest.mark.parametrize(
+    "fixture", sorted(p.name for p in FIXTURES.glob("mkdocs_*.yml"))
+)
+def test_libyaml_loader_matches_pure_python(fixture: str):
+    """The libyaml loader parses every fixture exactly like the pure one."""
+    text = (FIXTURES / fixture).read_text(encoding="utf-8")
+
+    fast = yaml.load(text, Loader=_CPermissiveLoader)
+    pure = yaml.load(text, Loader=_PurePermissiveLoader)
+
+    assert fast == pure
+
+
+def test_load_config_falls_back_to_pure_python_loader(monkeypatch):
+    """Without libyaml, load_config resolves the same Config."""
+    expected = load_config(FIXTURES / "mkdocs_with_python_tags.yml")
+
+    monkeypatch.setattr(config_load, "_PermissiveLoader", _PurePermissiveLoader)
+    actual = load_config(FIXTURES / "mkdocs_with_python_tags.yml")
+
+    assert actual == expected
+
+
+def test_load_config_rejects_excessive_nesting(tmp_path: Path):
+    """Nesting past the limit is rejected regardless of the YAML backend."""
+    config_path = tmp_path / "mkdocs.yml"
+    config_path.write_text(
+        "site_name: Deep\nextra: " + "[" * 300 + "]" * 300 + "\n", encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="too deeply nested"):
+        load_config(config_path)
+
+
+def test_load_config_handles_self_referencing_anchor(tmp_path: Path):
+    """A recursive anchor is reported as too deeply nested, not a hang."""
+    config_path = tmp_path / "mkdocs.yml"
+    config_path.write_text("site_name: Loop\nextra: &a [*a]\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="too deeply nested"):
+        load_config(config_path)
+
+
+def test_load_config_cached_reuses_resolved_config(tmp_path: Path, monkeypatch):
+    """A second load of an unchanged file skips parsing and validation."""
+    config_path = tmp_path / "mkdocs.yml"
+    shutil.copy(FIXTURES / "mkdocs_nav_only.yml", config_path)
+    cache_dir = tmp_path / "cache"
+
+    first = load_config_cached(config_path, cache_dir)
+    assert len(list(cache_dir.glob("config-*.json"))) == 1
+
+    def fail(path: Path) -> None:
+        raise AssertionError("config was re-parsed")
+
+    monkeypatch.setattr(config_cache, "load_config", fail)
+    second = load_config_cached(config_path, cache_dir)
+
+    assert second == first
+    assert second.sections == first.sections
+
+
+def test_load_config_cached_invalidates_on_change(tmp_path: Path):
+    config_path = tmp_path / "mkdocs.yml"
+    config_path.write_text("site_name: Before\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    assert load_config_cached(config_path, cache_dir).site_name == "Before"
+    config_path.write_text("site_name: After!\n", encoding="utf-8")
+
+    assert load_config_cached(config_path, cache_dir).site_name == "After!"
+    # The entry for the old state was replaced
+    assert len(list(cache_dir.glob("config-*.json"))) == 1
+
+
+def test_load_config_cached_misses_after_upgrade(tmp_path: Path, monkeypatch):
+    """Configs resolved by another release of the package are not reused."""
+    config_path = tmp_path / "mkdocs.yml"
+    shutil.copy(FIXTURES / "mkdocs_nav_only.yml", config_path)
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(config_cache, "_package_version", lambda: "1.0.0")
+    load_config_cached(config_path, cache_dir)
+    parsed: list[Path] = []
+
+    def load(path: Path):
+        parsed.append(path)
+        return load_config(path)
+
+    monkeypatch.setattr(config_cache, "load_config", load)
+    monkeypatch.setattr(config_cache, "_package_version", lambda: "1.1.0")
+    load_config_cached(config_path, cache_dir)
+
+    assert parsed == [config_path]
+    assert len(list(cache_dir.glob("config-*.json"))) == 1
+
+
+def test_load_config_cached_counts_hits_and_misses(tmp_path: Path):
+    config_path = tmp_path / "mkdocs.yml"
+    shutil.copy(FIXTURES / "mkdocs_with_llmstxt.yml", config_path)
+    stats = config_cache.ConfigCacheStats()
+
+    load_config_cached(config_path, tmp_path / "cache", stats)
+    load_config_cached(config_path, tmp_path / "cache", stats)
+    load_config_cached(config_path, None, stats)
+
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_load_config_cached_keeps_entries_of_other_configs(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    for name in ("a", "b"):
+        config_path = tmp_path / name / "mkdocs.yml"
+        config_path.parent.mkdir()
+        config_path.write_text(f"site_name: {name}\n", encoding="utf-8")
+        load_config_cached(config_path, cache_dir)
+    config_path.write_text("site_name: b2\n", encoding="utf-8")
+
+    assert load_config_cached(config_path, cache_dir).site_name == "b2"
+    assert len(list(cache_dir.glob("config-*.json"))) == 2
+
+
+def test_load_config_cached_ignores_corrupt_entry(tmp_path: Path):
+    config_path = tmp_path / "mkdocs.yml"
+    shutil.copy(FIXTURES / "mkdocs_with_llmstxt.yml", config_path)
+    cache_dir = tmp_path / "cache"
+    load_config_cached(config_path, cache_dir)
+    (entry,) = cache_dir.glob("config-*.json")
+    entry.write_text("{not json", encoding="utf-8")
+
+    config = load_config_cached(config_path, cache_dir)
+
+    assert config.site_name == "Test Site"
+
+
+def test_load_config_cached_without_cache_dir():
+    config = load_config_cached(FIXTURES / "mkdocs_with_llmstxt.yml", None)
+    assert config.site_name == "Test Site"
+
+
+def test_memory_cache_returns_independent_copies(tmp_path: Path, monkeypatch):
+    """The in-memory layer skips parsing but never shares a mutable Config."""
+    monkeypatch.setattr(config_cache, "_memory_cache", None)
+    config_path = tmp_path / "mkdocs.yml"
+    shutil.copy(FIXTURES / "mkdocs_nav_only.yml", config_path)
+    config_cache.enable_memory_cache()
+
+    first = load_config_cached(config_path, None)
+    monkeypatch.setattr(config_cache, "load_config", None)
+    first.sections.clear()
+    second = load_config_cached(config_path, None)
+
+    assert second.sections
+    assert second is not load_config_cached(config_path, None)
+
+
+def test_load_config_cached_missing_file(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        load_config_cached(tmp_path / "missing.yml", tmp_path / "cache")
@@ -1,8 +1,14 @@
 """Tests for HTML to Markdown conversion."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from llmstxt_standalone.convert import extract_title_from_html, html_to_markdown
+from llmstxt_standalone.convert import (
+    _converter,
+    extract_title_from_html,
+    html_to_markdown,
+)
 
 
 def test_html_to_markdown_basic():
@@ -190,3 +196,12 @@ def test_html_to_markdown_code_with_pre_closing_tag():
     result = html_to_markdown(html)
     assert "</pre>" in result
     assert "breaks things" in result
+
+
+def test_converter_is_per_thread():
+    """Test each thread converts with its own MarkdownConverter."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(_converter).result()
+
+    assert _converter() is _converter()
+    assert other is not _converter()
@@ -0,0 +1,177 @@
+"""Tests for the daemon and its thin client."""
+
+import io
+import json
+import os
+import shutil
+import stat
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone import daemon
+from llmstxt_standalone.client import (
+    PROTOCOL_VERSION,
+    forward,
+    package_version,
+    send_request,
+)
+from llmstxt_standalone.config import cache as config_cache
+from llmstxt_standalone.daemon import daemon_is_running, serve, stop_daemon
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    shutil.copy(FIXTURES / "mkdocs_with_llmstxt.yml", tmp_path / "mkdocs.yml")
+    shutil.copytree(FIXTURES / "site", tmp_path / "site")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LLMSTXT_NO_DAEMON", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Run a daemon in a background thread for the duration of a test."""
+    monkeypatch.setattr(config_cache, "_memory_cache", None)
+    socket_path = tmp_path / "d.sock"
+    thread = threading.Thread(target=serve, args=(socket_path,), daemon=True)
+    thread.start()
+    for _ in range(500):
+        if daemon_is_running(socket_path):
+            break
+        thread.join(0.01)
+    yield socket_path
+    if daemon_is_running(socket_path):
+        stop_daemon(socket_path)
+    thread.join(5)
+
+
+def test_forward_build_matches_local_build(project: Path, socket_path: Path, capsys):
+    from llmstxt_standalone.cli import app
+
+    exit_code = forward(["build", "-o", "remote"], socket_path)
+    out = capsys.readouterr().out
+    with pytest.raises(SystemExit) as local:
+        app(["build", "-o", "local"])
+
+    assert exit_code == local.value.code == 0
+    assert "Generated remote/llms.txt" in out
+    for name in ("llms.txt", "llms-full.txt", "index.md"):
+        assert (project / "remote" / name).read_bytes() == (
+            project / "local" / name
+        ).read_bytes()
+
+
+def test_forward_reports_exit_code_and_stderr(project: Path, socket_path: Path, capsys):
+    exit_code = forward(["validate", "-c", "missing.yml"], socket_path)
+
+    assert exit_code == 1
+    assert "File not found" in capsys.readouterr().err
+
+
+def test_daemon_picks_up_config_changes(project: Path, socket_path: Path, capsys):
+    """Test the warm config cache never serves a stale config."""
+    assert forward(["validate"], socket_path) == 0
+    assert "Site: Test Site" in capsys.readouterr().out
+
+    config = project / "mkdocs.yml"
+    config.write_text(config.read_text().replace("Test Site", "Renamed"))
+    assert forward(["validate"], socket_path) == 0
+    assert "Site: Renamed" in capsys.readouterr().out
+
+
+def test_forward_runs_locally_without_daemon(project: Path):
+    assert forward(["build"], project / "absent.sock") is None
+
+
+def test_forward_ignores_non_socket(project: Path):
+    fake = project / "fake.sock"
+    fake.write_text("")
+    assert forward(["build"], fake) is None
+
+
+def test_forward_ignores_socket_of_other_user(project: Path, socket_path: Path):
+    try:
+        os.chown(socket_path, os.getuid() + 1, -1, follow_symlinks=False)
+    except PermissionError:
+        pytest.skip("Cannot change socket owner")
+    assert forward(["validate"], socket_path) is None
+
+
+def test_forward_ignores_symlinked_socket(project: Path, socket_path: Path):
+    link = project / "link.sock"
+    link.symlink_to(socket_path)
+    assert forward(["validate"], link) is None
+
+
+def test_forward_skips_commands_not_served(project: Path, socket_path: Path):
+    assert forward(["init"], socket_path) is None
+    assert forward(["--version"], socket_path) is None
+
+
+def test_forward_respects_no_daemon(
+    project: Path, socket_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("LLMSTXT_NO_DAEMON", "1")
+    assert forward(["validate"], socket_path) is None
+
+
+def test_daemon_rejects_bad_requests(socket_path: Path):
+    assert "error" in send_request(socket_path, {"version": 0, "argv": ["build"]})
+    assert "error" in send_request(
+        socket_path,
+        {
+            "version": PROTOCOL_VERSION,
+            "package_version": package_version(),
+            "argv": ["init"],
+            "cwd": "/",
+        },
+    )
+
+
+def test_forward_runs_locally_on_daemon_of_other_version(
+    project: Path, socket_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(daemon, "package_version", lambda: "0.0.1")
+    assert forward(["validate"], socket_path) is None
+    assert "error" in send_request(
+        socket_path,
+        {
+            "version": PROTOCOL_VERSION,
+            "package_version": package_version(),
+            "argv": ["validate"],
+            "cwd": str(project),
+        },
+    )
+
+
+def test_daemon_socket_is_private_and_removed(socket_path: Path):
+    assert stat.S_IMODE(socket_path.stat().st_mode) & 0o077 == 0
+
+    stop_daemon(socket_path)
+
+    for _ in range(500):
+        if not socket_path.exists():
+            break
+        threading.Event().wait(0.01)
+    assert not socket_path.exists()
+
+
+def test_second_daemon_refuses_same_socket(socket_path: Path):
+    with pytest.raises(RuntimeError, match="already listening"):
+        serve(socket_path)
+
+
+def test_forward_convert_reads_stdin(
+    project: Path, socket_path: Path, capsys, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("sys.stdin", io.StringIO("site/index.html\n"))
+
+    assert forward(["convert", "-"], socket_path) == 0
+
+    (line,) = capsys.readouterr().out.splitlines()
+    assert json.loads(line)["path"] == "site/index.html"
@@ -0,0 +1,59 @@
+"""Tests for near-duplicate block elimination."""
+
+from llmstxt_standalone.dedup import BlockDeduplicator
+
+FOOTER = (
+    "See also: the configuration reference describes every option accepted by "
+    "the plugin, including the selectors used for content extraction and the "
+    "output filenames, together with examples for common documentation themes."
+)
+INSTALL = """```bash
+pip install example
+example --init --with-defaults --config mkdocs.yml --output-dir site/llms
+example build --strict --jobs 4 --cache-dir .cache/example
+```"""
+
+
+def test_exact_copies_become_references():
+    dedup = BlockDeduplicator(min_chars=100)
+
+    first = dedup.dedup("Home", f"# Home\n\nWelcome.\n\n{FOOTER}\n")
+    second = dedup.dedup("Guide", f"# Guide\n\n{INSTALL}\n\n{FOOTER.upper()}\n")
+
+    assert first == f"# Home\n\nWelcome.\n\n{FOOTER}\n"
+    assert second == (
+        f'# Guide\n\n{INSTALL}\n\n*(Repeated content omitted, see "Home" above.)*\n'
+    )
+    assert dedup.removed_blocks == 1
+    assert dedup.removed_chars == len(FOOTER)
+
+
+def test_near_copies_become_references():
+    dedup = BlockDeduplicator(min_chars=100)
+    dedup.dedup("Home", FOOTER)
+    near = FOOTER.replace("common documentation themes", "popular themes")
+
+    assert dedup.dedup("Guide", near) == (
+        '*(Repeated content omitted, see "Home" above.)*'
+    )
+
+
+def test_distinct_and_short_blocks_are_kept():
+    dedup = BlockDeduplicator(min_chars=100)
+    dedup.dedup("Home", f"Short.\n\n{FOOTER}")
+    other = FOOTER.replace("configuration reference", "tutorial").replace(
+        "every option accepted by the plugin", "how to publish the generated files"
+    )
+    content = f"Short.\n\n{other}\n\n{INSTALL}"
+
+    assert dedup.dedup("Guide", content) is content
+    assert dedup.removed_blocks == 0
+
+
+def test_similarity_threshold():
+    strict = BlockDeduplicator(min_chars=100, similarity=1.0)
+    strict.dedup("Home", FOOTER)
+    near = FOOTER.replace("common documentation themes", "popular themes")
+
+    assert strict.dedup("Guide", near) == near
+    assert strict.dedup("Guide", FOOTER) != FOOTER
@@ -0,0 +1,121 @@
+"""Tests for the structured page export."""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.export import (
+    JsonlPageWriter,
+    MarkdownPageWriter,
+    PageWriter,
+    page_record,
+)
+from llmstxt_standalone.generate import PageResult, build_llms_output
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site_edge_cases", site_dir)
+    return site_dir
+
+
+@pytest.fixture
+def config():
+    config = load_config(FIXTURES / "mkdocs_edge_cases.yml")
+    # A missing page and a page listed in two sections
+    config.sections["深层文档"].extend(["missing.md", "index.md"])
+    return config
+
+
+def test_page_record(config):
+    result = PageResult("faq.md", Path("site/faq/index.html"), "FAQ", "# Q\n\né\n")
+
+    record = page_record(config, result, "Help")
+
+    assert record == {
+        "md_path": "faq.md",
+        "url": f"{config.site_url}/faq/",
+        "markdown_url": f"{config.site_url}/faq/index.md",
+        "title": "FAQ",
+        "section": "Help",
+        "markdown": "# Q\n\né\n",
+        "bytes": 8,
+        "chars": 7,
+        "sha256": hashlib.sha256("# Q\n\né\n".encode()).hexdigest(),
+    }
+
+
+def test_jsonl_writer_streams_pages_in_nav_order(config, site_dir: Path, tmp_path):
+    """Test records are flushed as each page finishes, once per distinct page."""
+    path = tmp_path / "out" / "pages.jsonl"
+    seen: list[int] = []
+
+    with JsonlPageWriter(config, path) as writer:
+
+        def on_page(result: PageResult) -> None:
+            writer.write(result)
+            seen.append(len(path.read_text(encoding="utf-8").splitlines()))
+
+        build = build_llms_output(config, site_dir, on_page=on_page)
+
+    records = [
+        json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+    md_paths = list(dict.fromkeys(page.md_path for page in build.pages))
+    assert [r["md_path"] for r in records] == md_paths
+    assert writer.count == len(records)
+    # Records hit the file while the build was still running
+    assert seen[0] >= 1
+    first_section = next(iter(config.sections))
+    assert records[0]["section"] == first_section
+    contents = {page.md_path: page.content for page in build.pages}
+    assert all(r["markdown"] == contents[r["md_path"]] for r in records)
+
+
+def test_markdown_writer_writes_pages_as_they_finish(config, site_dir: Path, tmp_path):
+    """Test page files match write_markdown_files, written during the build."""
+    out_dir = tmp_path / "out"
+    written: list[bool] = []
+
+    writer = MarkdownPageWriter(config, out_dir)
+    with writer:
+
+        def on_page(result: PageResult) -> None:
+            writer.write(result)
+            written.append(bool(writer.paths) and writer.paths[-1].exists())
+
+        build = build_llms_output(config, site_dir, on_page=on_page)
+
+    contents = {page.md_path: page.content for page in build.pages}
+    assert writer.count == len(writer.paths) == len(contents)
+    assert written[0]
+    assert (out_dir / "index.md").read_text(encoding="utf-8") == contents["index.md"]
+    assert (out_dir / "faq" / "index.md").exists()
+
+
+def test_markdown_writer_dry_run(config, tmp_path: Path):
+    writer = MarkdownPageWriter(config, tmp_path / "out", dry_run=True)
+
+    writer.write(PageResult("faq.md", Path("x.html"), "FAQ", "# Q\n"))
+    writer.write(
+        PageResult("gone.md", Path("y.html"), skip_reason="HTML file not found")
+    )
+
+    assert writer.count == 1
+    assert writer.paths == [tmp_path / "out" / "faq" / "index.md"]
+    assert not (tmp_path / "out").exists()
+
+
+def test_page_writer_needs_write(config, tmp_path: Path):
+    class NoWrite(PageWriter):
+        pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        NoWrite(config, tmp_path)  # ty: ignore[call-non-callable]
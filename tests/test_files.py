@@ -0,0 +1,86 @@
+"""Tests for converting standalone HTML files."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.convert import html_to_markdown
+from llmstxt_standalone.files import (
+    common_base_dir,
+    expand_inputs,
+    iter_file_results,
+    mirror_path,
+)
+from llmstxt_standalone.parallel import WorkerPool
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site_edge_cases", site_dir)
+    return site_dir
+
+
+def test_expand_inputs_files_dirs_and_globs(site_dir: Path):
+    index = site_dir / "index.html"
+    paths = expand_inputs([str(index), str(site_dir), str(site_dir / "**/*.html")])
+
+    # Directory contents are sorted, and each file is listed once
+    assert paths[0] == index
+    assert len(paths) == len(set(paths)) == 4
+    assert set(paths) == set(site_dir.rglob("*.html"))
+
+
+def test_expand_inputs_no_match(tmp_path: Path):
+    with pytest.raises(ValueError, match="No files match"):
+        expand_inputs([str(tmp_path / "*.html")])
+
+
+def test_mirror_path(site_dir: Path, tmp_path: Path):
+    out = tmp_path / "out"
+    page = site_dir / "deep" / "index.html"
+
+    assert common_base_dir([site_dir / "index.html", page]) == site_dir
+    assert mirror_path(page, site_dir, out) == out / "deep" / "index.md"
+    with pytest.raises(ValueError, match="outside base directory"):
+        mirror_path(page, site_dir / "install", out)
+
+
+def test_iter_file_results_matches_html_to_markdown(site_dir: Path):
+    paths = sorted(site_dir.rglob("*.html"))
+
+    results = list(iter_file_results(paths, titles=True))
+
+    assert [r.path for r in results] == paths
+    for result in results:
+        html = result.path.read_text(encoding="utf-8")
+        assert result.content == html_to_markdown(html)
+        assert result.title
+        assert result.error is None
+
+
+def test_iter_file_results_pool_matches_sequential(site_dir: Path):
+    bad = site_dir / "bad.html"
+    bad.write_bytes(b"\xff\xfe<p>not utf-8</p>")
+    paths = [*sorted(site_dir.rglob("*.html")), site_dir / "gone.html"]
+
+    with WorkerPool(2) as pool:
+        pooled = list(iter_file_results(paths, pool=pool))
+
+    assert pooled == list(iter_file_results(paths))
+    errors = {r.path.name: r.error for r in pooled if r.error}
+    assert errors["bad.html"] == "HTML file has encoding errors"
+    assert errors["gone.html"].startswith("Failed to read HTML file")
+
+
+def test_file_result_json_record(site_dir: Path):
+    (result,) = iter_file_results([site_dir / "index.html"], titles=True)
+
+    assert result.to_json() == {
+        "path": str(site_dir / "index.html"),
+        "title": result.title,
+        "markdown": result.content,
+    }
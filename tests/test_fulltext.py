@@ -0,0 +1,76 @@
+"""Tests for llms-full.txt and section files written as pages finish."""
+
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.fulltext import FullFileWriter, SectionFilesWriter, StagedFile
+from llmstxt_standalone.generate import build_llms_output
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def config():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections = {"Start": ["index.md"], "Guide": ["install.md"]}
+    return config
+
+
+def test_writers_match_collected_text(config, tmp_path: Path):
+    """Test streamed files hold exactly what a collecting build assembles."""
+    plain = build_llms_output(config, FIXTURES / "site", section_files=True)
+
+    full = FullFileWriter(config, tmp_path)
+    sections = SectionFilesWriter(config, tmp_path)
+    with full, sections:
+        build = build_llms_output(
+            config, FIXTURES / "site", section_files=True, full_writers=[full, sections]
+        )
+        full.commit()
+        sections.commit()
+
+    assert build.llms_full_txt == ""
+    assert build.section_full_txts == {}
+    assert build.llms_txt == plain.llms_txt
+    assert (tmp_path / "llms-full.txt").read_bytes() == plain.llms_full_txt.encode()
+    assert full.bytes == len(plain.llms_full_txt.encode())
+    assert sections.paths == [tmp_path / path for path in plain.section_full_txts]
+    for path, text in plain.section_full_txts.items():
+        assert (tmp_path / path).read_text(encoding="utf-8") == text
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "llms-full-guide.txt",
+        "llms-full-start.txt",
+        "llms-full.txt",
+    ]
+
+
+def test_uncommitted_writer_keeps_previous_file(config, tmp_path: Path):
+    (tmp_path / "llms-full.txt").write_text("previous")
+
+    with FullFileWriter(config, tmp_path) as full:
+        build_llms_output(config, FIXTURES / "site", full_writers=[full])
+
+    assert (tmp_path / "llms-full.txt").read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["llms-full.txt"]
+
+
+def test_dry_run_counts_without_writing(config, tmp_path: Path):
+    sections = SectionFilesWriter(config, tmp_path / "out", dry_run=True)
+    with sections:
+        build_llms_output(config, FIXTURES / "site", full_writers=[sections])
+        sections.commit()
+
+    assert len(sections.paths) == 2
+    assert sections.bytes > 0
+    assert not (tmp_path / "out").exists()
+
+
+def test_discarded_file_removes_directories_it_created(tmp_path: Path):
+    staged = StagedFile(tmp_path / "a" / "b" / "llms-full.txt")
+    staged.write("text")
+
+    staged.discard()
+
+    assert list(tmp_path.iterdir()) == []
@@ -3,13 +3,23 @@
 import shutil
 from pathlib import Path
 
+import pytest
+
+from llmstxt_standalone import generate
 from llmstxt_standalone.config import load_config
 from llmstxt_standalone.generate import (
+    ConvertRequest,
+    PageResult,
+    assemble_llms_output,
+    build_llms_output,
+    convert_html,
     generate_llms_txt,
     md_path_to_html_path,
     md_path_to_output_md_path,
     md_path_to_page_url,
+    section_full_outputs,
 )
+from llmstxt_standalone.tokens import estimate_tokens, get_tokenizer, truncate_to_tokens
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -504,3 +514,239 @@ def test_generate_llms_txt_respects_output_dir(tmp_path: Path):
             html_equivalent = site_equivalent.with_suffix(".html")
             # HTML should exist, but markdown should not
             assert not site_equivalent.exists() or site_equivalent == html_equivalent
+
+
+def test_section_full_outputs():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.full_output = "llms/full.txt"
+    config.sections = {
+        "Getting Started": [],
+        "深层 文档": [],
+        "???": [],
+        "getting started": [],
+    }
+
+    assert section_full_outputs(config) == {
+        "Getting Started": "llms/full-getting-started.txt",
+        "深层 文档": "llms/full-深层-文档.txt",
+        "???": "llms/full-section-3.txt",
+        "getting started": "llms/full-getting-started-2.txt",
+    }
+
+
+def test_build_llms_output_section_files():
+    """Test section files match their slice of llms-full.txt and are linked."""
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections = {"Start": ["index.md"], "Guide": ["install.md"]}
+
+    build = build_llms_output(config, FIXTURES / "site", section_files=True)
+    plain = build_llms_output(config, FIXTURES / "site")
+
+    assert plain.section_full_txts == {}
+    assert list(build.section_full_txts) == [
+        "llms-full-start.txt",
+        "llms-full-guide.txt",
+    ]
+    assert build.llms_full_txt == plain.llms_full_txt
+    guide = build.section_full_txts["llms-full-guide.txt"]
+    assert guide.startswith("# Test Site: Guide\n\n> A test site\n")
+    assert guide.split("\n", 4)[4] in build.llms_full_txt
+    assert "index.md" not in guide
+    assert (
+        "## Guide\n\n- [Guide (full content)](https://test.com/llms-full-guide.txt)\n"
+        in build.llms_txt
+    )
+
+
+def test_assemble_section_files_skip_empty_sections():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections = {"Start": ["index.md"], "Gone": ["missing.md"]}
+    results = {
+        "index.md": PageResult("index.md", Path("index.html"), "Home", "Hi"),
+        "missing.md": PageResult("missing.md", Path("x.html"), skip_reason="gone"),
+    }
+
+    build = assemble_llms_output(config, results, section_files=True)
+
+    assert list(build.section_full_txts) == ["llms-full-start.txt"]
+    assert "Gone" not in build.llms_txt
+
+
+def test_build_llms_output_counts_tokens():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+
+    build = build_llms_output(config, FIXTURES / "site")
+
+    assert set(build.page_tokens) == {"index.md", "install.md"}
+    contents = {page.md_path: page.text for page in build.pages}
+    assert build.page_tokens["index.md"] == estimate_tokens(contents["index.md"])
+    assert abs(build.full_tokens - estimate_tokens(build.llms_full_txt)) <= 5
+    assert build.budget_errors == []
+
+
+def test_token_budget_warn_and_fail():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.max_page_tokens = 10
+    config.max_full_tokens = 20
+
+    warned = build_llms_output(config, FIXTURES / "site")
+    config.token_budget_action = "fail"
+    failed = build_llms_output(config, FIXTURES / "site")
+
+    assert any("install.md has" in w for w in warned.warnings)
+    assert any("over max_full_tokens (20)" in w for w in warned.warnings)
+    assert warned.budget_errors == []
+    assert len(failed.budget_errors) == 2
+    assert not any("max_page_tokens" in w for w in failed.warnings)
+    with pytest.raises(ValueError, match="Token budget exceeded"):
+        generate_llms_txt(config, FIXTURES / "site", dry_run=True)
+
+
+def test_token_budget_truncate():
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    plain = build_llms_output(config, FIXTURES / "site")
+    config.token_budget_action = "truncate"
+    config.max_page_tokens = 10
+    config.max_full_tokens = plain.page_tokens["index.md"] + 15
+
+    build = build_llms_output(config, FIXTURES / "site")
+
+    assert all(tokens <= 10 for tokens in build.page_tokens.values())
+    assert any(w.startswith("Truncated install.md") for w in build.warnings)
+    assert build.full_tokens <= config.max_full_tokens
+    assert "## Home" in build.llms_full_txt
+    assert "## Install" not in build.llms_full_txt
+    assert any("left out 1 pages" in w for w in build.warnings)
+
+
+def test_token_budget_truncate_applies_to_section_files():
+    """Test pages left out of llms-full.txt are left out of section files too."""
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections = {"Start": ["index.md"], "Guide": ["install.md"]}
+    plain = build_llms_output(config, FIXTURES / "site")
+    config.token_budget_action = "truncate"
+    config.max_full_tokens = plain.page_tokens["index.md"] + 15
+
+    build = build_llms_output(config, FIXTURES / "site", section_files=True)
+
+    start = build.section_full_txts["llms-full-start.txt"]
+    guide = build.section_full_txts["llms-full-guide.txt"]
+    assert "## Home" in start
+    assert "## Install" not in guide
+    assert guide == "# Test Site: Guide\n\n> A test site\n"
+
+
+def test_truncate_to_tokens():
+    text = "first line\nsecond line\nthird line"
+
+    assert truncate_to_tokens(text, 100) == text
+    assert truncate_to_tokens(text, 6) == "first line\nsecond line"
+    assert truncate_to_tokens("x" * 40, 3) == "x" * 12
+    assert truncate_to_tokens(text, 5, count=len) == "first"
+
+
+def test_get_tokenizer():
+    assert get_tokenizer("estimate") is estimate_tokens
+    with pytest.raises(ValueError, match="Unknown tokenizer"):
+        get_tokenizer("words")
+
+
+def test_assemble_dedup_repeated_blocks():
+    """Test repeated blocks appear once in llms-full.txt but stay in pages."""
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.dedup = True
+    config.dedup_min_chars = 40
+    footer = "Need help? Ask on the forum or open an issue on the tracker."
+    results = {
+        "index.md": PageResult("index.md", Path("i.html"), "Home", f"Hi\n\n{footer}\n"),
+        "install.md": PageResult(
+            "install.md", Path("j.html"), "Install", f"Run pip.\n\n{footer}\n"
+        ),
+    }
+
+    build = assemble_llms_output(config, results)
+
+    assert build.llms_full_txt.count(footer) == 1
+    assert '*(Repeated content omitted, see "Home" above.)*' in build.llms_full_txt
+    assert build.pages[1].content == f"Run pip.\n\n{footer}\n"
+    assert build.deduplicated_blocks == 1
+    assert build.deduplicated_chars == len(footer)
+
+
+def test_assemble_dedup_applies_to_section_files():
+    """Test section files hold the same deduplicated blocks as llms-full.txt."""
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections = {"Start": ["index.md"], "Guide": ["install.md"]}
+    config.dedup = True
+    config.dedup_min_chars = 40
+    footer = "Need help? Ask on the forum or open an issue on the tracker."
+    results = {
+        "index.md": PageResult("index.md", Path("i.html"), "Home", f"Hi\n\n{footer}\n"),
+        "install.md": PageResult(
+            "install.md", Path("j.html"), "Install", f"Run pip.\n\n{footer}\n"
+        ),
+    }
+
+    build = assemble_llms_output(config, results, section_files=True)
+
+    guide = build.section_full_txts["llms-full-guide.txt"]
+    assert footer not in guide
+    assert '*(Repeated content omitted, see "Home" above.)*' in guide
+    assert guide.split("\n", 4)[4] in build.llms_full_txt
+
+
+def test_build_llms_output_converts_identical_pages_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test byte-identical HTML at two paths is converted only once."""
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site", site_dir)
+    shutil.copytree(site_dir / "install", site_dir / "copy")
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections["Getting Started"].append("copy.md")
+    config.nav.append({"Copy": "copy.md"})
+    convert_html = generate.convert_html
+    converted: list[str] = []
+
+    def counting_convert_html(request, tracer=None):
+        converted.append(request.md_path)
+        return convert_html(request, tracer=tracer)
+
+    monkeypatch.setattr(generate, "convert_html", counting_convert_html)
+    pages: list[PageResult] = []
+    build = build_llms_output(config, site_dir, on_page=pages.append)
+
+    assert converted == ["index.md", "install.md"]
+    assert [page.reused for page in pages] == [False, False, True]
+    assert pages[2].content == pages[1].content
+    assert build.reused_pages == 1
+    assert "[Copy](https://test.com/copy/" in build.llms_txt
+
+
+# Inline-heavy HTML that takes html-to-markdown over a second to convert
+HEAVY_HTML = "<p>" + "<b>x</b> <i>y</i> " * 1000 + "</p>"
+
+
+def test_convert_html_times_out():
+    """Test a conversion running past its timeout is skipped, not raised."""
+    request = ConvertRequest("a.md", HEAVY_HTML, None, "Site", False, timeout=0.05)
+
+    outcome = convert_html(request)
+
+    assert outcome.skip_reason == "Conversion timed out after 0.05s"
+    assert outcome.content == ""
+    assert outcome.duration_s < 1
+
+
+def test_convert_html_out_of_memory(monkeypatch: pytest.MonkeyPatch):
+    """Test a conversion exhausting memory is skipped, not raised."""
+
+    def exhausted(*args, **kwargs):
+        raise MemoryError
+
+    monkeypatch.setattr(generate, "html_to_markdown", exhausted)
+    request = ConvertRequest("a.md", "<p>Hi</p>", None, "Site", False)
+
+    outcome = convert_html(request)
+
+    assert outcome.skip_reason == "Conversion exceeded the memory limit"
@@ -0,0 +1,89 @@
+"""Tests for OpenMetrics build metrics."""
+
+import shutil
+from pathlib import Path
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import build_llms_output
+from llmstxt_standalone.metrics import (
+    render_build_metrics,
+    skip_reason_label,
+    write_textfile,
+)
+from llmstxt_standalone.trace import Tracer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _samples(text: str) -> dict[str, float]:
+    samples: dict[str, float] = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_skip_reason_label():
+    assert skip_reason_label("HTML file not found") == "not_found"
+    assert skip_reason_label("HTML file has encoding errors") == "encoding_error"
+    assert skip_reason_label("Failed to read HTML file: boom") == "read_error"
+    assert skip_reason_label("Markdown path must not contain '..': x") == "unsafe_path"
+    assert skip_reason_label("Conversion timed out after 5s") == "timeout"
+    assert skip_reason_label("Conversion exceeded the memory limit") == "memory_limit"
+    assert (
+        skip_reason_label("Worker process died while converting the page")
+        == "worker_died"
+    )
+    assert skip_reason_label("something new") == "other"
+
+
+def test_render_build_metrics(tmp_path: Path):
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site", site_dir)
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    config.sections["Getting Started"].append("missing.md")
+    tracer = Tracer()
+
+    build = build_llms_output(config, site_dir, tracer=tracer)
+    text = render_build_metrics(
+        build, site_name=config.site_name, bytes_out=123, spans=tracer.spans
+    )
+    samples = _samples(text)
+
+    site = 'site="Test Site"'
+    assert text.endswith("# EOF\n")
+    assert samples[f"llmstxt_pages_converted_total{{{site}}}"] == 2
+    assert samples[f'llmstxt_pages_skipped_total{{{site},reason="not_found"}}'] == 1
+    assert samples[f"llmstxt_pages_reused_total{{{site}}}"] == 0
+    assert samples[f"llmstxt_bytes_in_total{{{site}}}"] == build.html_bytes > 0
+    assert samples[f"llmstxt_bytes_out_total{{{site}}}"] == 123
+    assert (
+        samples[
+            f'llmstxt_stage_duration_seconds_bucket{{{site},stage="convert",le="+Inf"}}'
+        ]
+        == 2
+    )
+    assert samples[f'llmstxt_stage_duration_seconds_count{{{site},stage="read"}}'] == 2
+
+
+def test_render_build_metrics_escapes_site_label(tmp_path: Path):
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site", site_dir)
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+
+    build = build_llms_output(config, site_dir)
+    text = render_build_metrics(build, site_name='My "Docs"', bytes_out=0, spans=[])
+
+    assert 'site="My \\"Docs\\""' in text
+
+
+def test_write_textfile_replaces_atomically(tmp_path: Path):
+    path = tmp_path / "llmstxt.prom"
+    path.write_text("old", encoding="utf-8")
+
+    write_textfile(path, "new\n")
+
+    assert path.read_text(encoding="utf-8") == "new\n"
+    assert list(tmp_path.iterdir()) == [path]
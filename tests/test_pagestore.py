@@ -0,0 +1,167 @@
+"""Tests for the page store."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import (
+    PageMarkdown,
+    build_llms_output,
+    iter_page_results,
+)
+from llmstxt_standalone.pagestore import PageStore, load_page_text
+from llmstxt_standalone.parallel import WorkerPool
+from llmstxt_standalone.spill import SpillHandle, spill_text
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_keeps_pages_in_memory_under_limit(tmp_path: Path):
+    with PageStore(memory_limit=10, directory=tmp_path) as store:
+        assert store.put("short") == "short"
+        assert store.put("tiny") == "tiny"
+        spilled = store.put("over the limit")
+
+        assert isinstance(spilled, SpillHandle)
+        assert load_page_text(spilled) == "over the limit"
+        assert (store.in_memory, store.spilled) == (9, 1)
+
+
+def test_memory_limit_counts_bytes(tmp_path: Path):
+    with PageStore(memory_limit=4, directory=tmp_path) as store:
+        # Two characters, four bytes of UTF-8
+        assert store.put("éé") == "éé"
+        assert isinstance(store.put("é"), SpillHandle)
+        assert store.in_memory == 4
+
+
+def test_spills_every_page_at_zero_limit(tmp_path: Path):
+    with PageStore(memory_limit=0, directory=tmp_path) as store:
+        handles = [store.put(text) for text in ("première page", "third")]
+
+        assert all(isinstance(handle, SpillHandle) for handle in handles)
+        assert [load_page_text(handle) for handle in handles] == [
+            "première page",
+            "third",
+        ]
+        # Empty pages cost nothing to keep
+        assert store.put("") == ""
+
+
+def test_file_created_on_first_spill_and_removed_on_close(tmp_path: Path):
+    store = PageStore(memory_limit=None, directory=tmp_path)
+    store.put("x" * 100_000)
+    assert list(tmp_path.iterdir()) == []
+
+    store.memory_limit = 0
+    handle = store.put("page")
+    assert isinstance(handle, SpillHandle)
+    assert Path(handle.path).parent == tmp_path
+
+    store.close()
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(OSError):
+        load_page_text(handle)
+
+
+def test_adopts_spill_files_without_reading(tmp_path: Path):
+    pool_dir = tmp_path / "pool"
+    pool_dir.mkdir()
+    spilled = spill_text("Première page", str(pool_dir))
+
+    with PageStore(memory_limit=None, directory=tmp_path) as store:
+        adopted = store.adopt(spilled)
+
+        assert list(pool_dir.iterdir()) == []
+        assert Path(adopted.path).parent == tmp_path
+        assert load_page_text(adopted) == "Première page"
+        assert (store.adopted, store.spilled, store.in_memory) == (1, 0, 0)
+
+    assert list(tmp_path.iterdir()) == [pool_dir]
+
+
+def test_page_markdown_reads_spilled_text(tmp_path: Path):
+    with PageStore(memory_limit=0, directory=tmp_path) as store:
+        stored = PageMarkdown(md_path="index.md", content=store.put("# Home"))
+
+        assert isinstance(stored.content, SpillHandle)
+        assert stored.text == "# Home"
+        assert stored.size == 6
+        assert PageMarkdown("index.md", "é").size == 2
+        assert PageMarkdown("index.md", "# Home").text == "# Home"
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_build_with_spilled_pages_matches(tmp_path: Path, jobs: int | None):
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = FIXTURES / "site"
+    expected = build_llms_output(config, site_dir)
+
+    with PageStore(memory_limit=0, directory=tmp_path) as store:
+        if jobs is None:
+            build = build_llms_output(config, site_dir, page_store=store)
+        else:
+            with WorkerPool(jobs) as pool:
+                build = build_llms_output(config, site_dir, pool=pool, page_store=store)
+
+        assert store.spilled > 0
+        assert all(
+            isinstance(page.content, SpillHandle) or not page.content
+            for page in build.pages
+        )
+        assert [(page.md_path, page.text) for page in build.pages] == [
+            (page.md_path, page.content) for page in expected.pages
+        ]
+        build.pages = expected.pages
+        assert build == expected
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_page_results_are_stored_as_they_finish(tmp_path: Path, jobs: int | None):
+    """Test results come out stored, and reused pages share the stored copy."""
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    site_dir = FIXTURES / "site"
+    pages = [(config, site_dir, md_path) for md_path in ("index.md", "install.md")]
+
+    with PageStore(memory_limit=0, directory=tmp_path) as store:
+        if jobs is None:
+            results = list(iter_page_results(pages * 2, page_store=store))
+        else:
+            with WorkerPool(jobs) as pool:
+                results = list(
+                    iter_page_results(pages * 2, pool=pool, page_store=store)
+                )
+
+        assert all(isinstance(result.content, SpillHandle) for result in results)
+        assert [result.reused for result in results] == [False, False, True, True]
+        assert results[2].content == results[0].content
+        assert store.spilled == 2
+
+
+def test_pooled_build_adopts_large_pages(tmp_path: Path):
+    """Test pages workers spilled are moved into the store, not read back."""
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site", site_dir)
+    big = site_dir / "install" / "index.html"
+    big.write_text(
+        big.read_text(encoding="utf-8").replace(
+            "</article>", "<p>" + "Long text. " * 8000 + "</p></article>"
+        ),
+        encoding="utf-8",
+    )
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    expected = build_llms_output(config, site_dir)
+
+    with PageStore(directory=tmp_path) as store, WorkerPool(2) as pool:
+        build = build_llms_output(config, site_dir, pool=pool, page_store=store)
+
+        assert pool.spill_dir is not None
+        assert list(Path(pool.spill_dir).iterdir()) == []
+        assert store.adopted == 1
+        page = next(page for page in build.pages if page.md_path == "install.md")
+        assert isinstance(page.content, SpillHandle)
+        assert page.text == next(
+            p.content for p in expected.pages if p.md_path == "install.md"
+        )
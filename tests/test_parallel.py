@@ -0,0 +1,368 @@
+"""Tests for parallel and batch builds."""
+
+import concurrent.futures
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone import generate, parallel
+from llmstxt_standalone.batch import Project, load_projects
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import (
+    ConvertRequest,
+    build_llms_output,
+    iter_build_results,
+)
+from llmstxt_standalone.parallel import Executor, WorkerPool, resolve_jobs
+from llmstxt_standalone.trace import Tracer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Inline-heavy HTML that takes html-to-markdown over a second to convert
+HEAVY_HTML = "<p>" + "<b>x</b> <i>y</i> " * 1000 + "</p>"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site_edge_cases", site_dir)
+    return site_dir
+
+
+@pytest.fixture
+def config():
+    config = load_config(FIXTURES / "mkdocs_edge_cases.yml")
+    # A missing page and a page listed in two sections
+    config.sections["深层文档"].extend(["missing.md", "index.md"])
+    return config
+
+
+def test_resolve_jobs(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 6)
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) == 6
+    with pytest.raises(ValueError):
+        resolve_jobs(-1)
+
+
+def test_resolve_executor(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    assert Executor.auto.resolve() is Executor.thread
+    assert Executor.process.resolve() is Executor.process
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    assert Executor.auto.resolve() is Executor.process
+    assert Executor.thread.resolve() is Executor.thread
+
+
+@pytest.mark.parametrize("executor", [Executor.process, Executor.thread])
+def test_pooled_build_matches_sequential(config, site_dir: Path, executor: Executor):
+    """Test a pooled build produces byte-identical output, skips and warnings."""
+    expected = build_llms_output(config, site_dir)
+    with WorkerPool(2, executor=executor) as pool:
+        result = build_llms_output(config, site_dir, pool=pool)
+
+    assert result == expected
+    assert result.skipped
+
+
+def test_thread_pool_converts_on_threads(config, site_dir: Path):
+    """Test thread workers convert in this process, without spill files."""
+    tracer = Tracer()
+    with WorkerPool(2, executor=Executor.thread) as pool:
+        build_llms_output(config, site_dir, pool=pool, tracer=tracer)
+
+    assert pool.spill_dir is None
+    workers = {
+        span.args["worker"] for span in tracer.spans if span.name == "convert_page"
+    }
+    assert workers
+    assert all("llmstxt-convert" in worker for worker in workers)
+
+
+def test_interpreter_executor_falls_back_to_processes(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delattr(concurrent.futures, "InterpreterPoolExecutor", raising=False)
+    assert Executor.interpreter.resolve() is Executor.process
+
+    with WorkerPool(1, executor=Executor.interpreter) as pool:
+        assert pool.executor is Executor.process
+
+
+def test_interpreter_pool_matches_sequential(
+    config, site_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test the interpreter executor's wiring, with threads standing in."""
+    if not parallel.interpreters_supported():
+        monkeypatch.setattr(
+            concurrent.futures,
+            "InterpreterPoolExecutor",
+            ThreadPoolExecutor,
+            raising=False,
+        )
+    expected = build_llms_output(config, site_dir)
+    with WorkerPool(2, executor=Executor.interpreter) as pool:
+        result = build_llms_output(config, site_dir, pool=pool)
+
+    assert pool.executor is Executor.interpreter
+    assert pool.spill_dir is None
+    assert result == expected
+    with pytest.raises(RuntimeError, match="Interpreter workers"):
+        pool.recycle()
+    with pytest.raises(ValueError, match="Interpreter workers"):
+        WorkerPool(2, memory_limit=2**30, executor=Executor.interpreter)
+
+
+@pytest.mark.skipif(
+    not parallel.interpreters_supported(), reason="Subinterpreters need Python 3.14+"
+)
+def test_interpreter_pool_converts_in_subinterpreters(config, site_dir: Path):
+    """Test a build on real subinterpreters, without threads standing in."""
+    interpreters = pytest.importorskip("concurrent.interpreters")
+    expected = build_llms_output(config, site_dir)
+
+    with WorkerPool(2, executor=Executor.interpreter) as pool:
+        result = build_llms_output(config, site_dir, pool=pool)
+        # The workers' interpreters live as long as the pool
+        assert len(interpreters.list_all()) > 1
+
+    assert result == expected
+
+
+def test_thread_pool_rejects_limits():
+    with pytest.raises(ValueError, match="Thread workers"):
+        WorkerPool(2, page_timeout=1, executor=Executor.thread)
+
+
+def test_pooled_build_converts_identical_pages_once(config, site_dir: Path):
+    """Test a page byte-identical to another shares its conversion."""
+    shutil.copytree(site_dir / "faq", site_dir / "faq-copy")
+    config.sections["深层文档"].append("faq-copy.md")
+    config.nav.append({"FAQ copy": "faq-copy.md"})
+    expected = build_llms_output(config, site_dir)
+    with WorkerPool(2) as pool:
+        result = build_llms_output(config, site_dir, pool=pool)
+
+    assert result == expected
+    assert result.reused_pages == 1
+
+
+def test_pooled_build_collects_worker_spans(config, site_dir: Path):
+    tracer = Tracer()
+    with WorkerPool(2) as pool:
+        build_llms_output(config, site_dir, tracer=tracer, pool=pool)
+
+    names = {span.name for span in tracer.spans}
+    assert {"read", "convert_page", "parse", "assemble"} <= names
+
+
+def test_pooled_build_reads_on_reader_threads(config, site_dir: Path):
+    """Test HTML is read ahead on the pool's reader threads."""
+    tracer = Tracer()
+    with WorkerPool(2) as pool:
+        build_llms_output(config, site_dir, tracer=tracer, pool=pool)
+
+    readers = {span.args["worker"] for span in tracer.spans if span.name == "read"}
+    assert readers
+    assert all("llmstxt-read" in worker for worker in readers)
+
+
+def test_pooled_build_schedules_largest_first(
+    config, site_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test big pages are submitted first, alone, and small pages batched."""
+    big = site_dir / "faq" / "index.html"
+    big.write_text(
+        big.read_text(encoding="utf-8").replace(
+            "</article>", "<p>" + "Long text. " * 3000 + "</p></article>"
+        ),
+        encoding="utf-8",
+    )
+    expected = build_llms_output(config, site_dir)
+    submitted: list[list[str]] = []
+    with WorkerPool(2) as pool:
+        submit = pool.submit
+
+        def recording_submit(fn, requests):
+            submitted.append([request.md_path for request in requests])
+            return submit(fn, requests)
+
+        monkeypatch.setattr(pool, "submit", recording_submit)
+        result = build_llms_output(config, site_dir, pool=pool)
+
+    assert result == expected
+    assert submitted[0] == ["faq.md"]
+    assert len(submitted) == 2
+    assert pool.busy_s > 0
+    assert pool.efficiency is not None
+    assert 0 < pool.efficiency <= 1
+
+
+def test_pooled_build_spills_large_results(config, site_dir: Path):
+    """Test large pages come back through spill files, unchanged."""
+    big = site_dir / "faq" / "index.html"
+    big.write_text(
+        big.read_text(encoding="utf-8").replace(
+            "</article>", "<p>" + "Long text. " * 8000 + "</p></article>"
+        ),
+        encoding="utf-8",
+    )
+    expected = build_llms_output(config, site_dir)
+
+    with WorkerPool(2) as pool:
+        assert pool.spill_dir is not None
+        spill_dir = Path(pool.spill_dir)
+        result = build_llms_output(config, site_dir, pool=pool)
+        spilled = [path.stat().st_size for path in spill_dir.iterdir()]
+
+    assert result == expected
+    assert len(spilled) == 1
+    assert spilled[0] > 80000
+    assert not spill_dir.exists()
+
+
+def test_pooled_build_skips_pages_over_timeout(config, site_dir: Path):
+    """Test a page over --page-timeout is skipped and the rest still convert."""
+    slow = site_dir / "faq" / "index.html"
+    slow.write_text(
+        slow.read_text(encoding="utf-8").replace(
+            "</article>", HEAVY_HTML + "</article>"
+        ),
+        encoding="utf-8",
+    )
+    expected = build_llms_output(config, site_dir)
+
+    with WorkerPool(1, page_timeout=0.05) as pool:
+        result = build_llms_output(config, site_dir, pool=pool)
+
+    assert (slow, "Conversion timed out after 0.05s") in result.skipped
+    assert [skip for skip in result.skipped if skip[0] != slow] == expected.skipped
+    assert "## FAQ" in expected.llms_full_txt
+    assert "## FAQ" not in result.llms_full_txt
+    assert result.llms_full_txt.count("\n## ") == expected.llms_full_txt.count(
+        "\n## "
+    ) - expected.llms_full_txt.count("## FAQ")
+
+
+def test_memory_limit_leaves_room_for_worker_footprint():
+    """Test a small page converts under a limit below the worker's footprint."""
+    pytest.importorskip("resource")
+    code = (
+        "from llmstxt_standalone.parallel import _limit_memory\n"
+        "_limit_memory(8 * 1024 * 1024)\n"
+        "from llmstxt_standalone.convert import html_to_markdown\n"
+        "print(html_to_markdown('<h1>Home</h1><p>Small page</p>', None))\n"
+    )
+
+    # A fresh interpreter, as forked workers share the parent's loaded stack
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Small page" in result.stdout
+
+
+def test_recycle_kills_running_tasks():
+    """Test recycling fails the tasks in flight and leaves a working pool."""
+    with WorkerPool(1) as pool:
+        future = pool.submit(time.sleep, 30)
+        time.sleep(0.2)
+        pool.recycle()
+
+        with pytest.raises(BrokenProcessPool):
+            future.result(timeout=10)
+        assert pool.submit(abs, -1).result(timeout=10) == 1
+
+
+def test_recycle_kills_workers_without_kill_workers(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test recycling before Python 3.14, which lacks kill_workers()."""
+    monkeypatch.delattr(
+        concurrent.futures.ProcessPoolExecutor, "kill_workers", raising=False
+    )
+    with WorkerPool(2) as pool:
+        futures = [pool.submit(time.sleep, 30) for _ in range(3)]
+        time.sleep(0.5)
+        start = time.perf_counter()
+        pool.recycle()
+
+        for future in futures:
+            with pytest.raises((BrokenProcessPool, concurrent.futures.CancelledError)):
+                future.result(timeout=10)
+        assert time.perf_counter() - start < 10
+        assert pool.submit(abs, -1).result(timeout=10) == 1
+
+
+def test_hung_worker_is_killed(monkeypatch: pytest.MonkeyPatch):
+    """Test a page its worker can't interrupt is cut off by the parent."""
+    monkeypatch.setattr(parallel, "KILL_GRACE_S", 0)
+    # No in-worker timeout, standing in for a hang in native code
+    request = ConvertRequest("slow.md", HEAVY_HTML, None, "Site", False)
+
+    with WorkerPool(1, page_timeout=0.05) as pool:
+        start = time.perf_counter()
+        outcome = generate._convert_alone(pool, request)
+        elapsed = time.perf_counter() - start
+        retry = generate._convert_alone(
+            pool, ConvertRequest("ok.md", "<p>Hi</p>", None, "Site", False)
+        )
+
+    assert outcome.skip_reason == "Conversion timed out after 0.05s"
+    assert elapsed < 1
+    assert retry.content.strip() == "Hi"
+
+
+def test_batch_shares_pool_across_projects(config, site_dir: Path):
+    """Test several projects on one pool each match their own build."""
+    other = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    other_site = FIXTURES / "site"
+    projects = [(config, site_dir), (other, other_site), (config, site_dir)]
+
+    with WorkerPool(2) as pool:
+        results = list(iter_build_results(projects, pool=pool))
+
+    assert results == [build_llms_output(cfg, site) for cfg, site in projects]
+
+
+def test_load_projects(tmp_path: Path):
+    batch = tmp_path / "batch.yml"
+    batch.write_text(
+        "projects:\n"
+        "  - api/mkdocs.yml\n"
+        "  - config: guide/mkdocs.yml\n"
+        "    site_dir: build/guide\n"
+        "    output_dir: dist/guide\n"
+    )
+
+    assert load_projects(batch) == [
+        Project(
+            config=tmp_path / "api/mkdocs.yml",
+            site_dir=tmp_path / "api/site",
+            output_dir=tmp_path / "api/site",
+        ),
+        Project(
+            config=tmp_path / "guide/mkdocs.yml",
+            site_dir=tmp_path / "build/guide",
+            output_dir=tmp_path / "dist/guide",
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["projects: []\n", "projects:\n  - site_dir: x\n", "- config: [a]\n", "a: [\n"],
+)
+def test_load_projects_invalid(tmp_path: Path, content: str):
+    batch = tmp_path / "batch.yml"
+    batch.write_text(content)
+
+    with pytest.raises(ValueError):
+        load_projects(batch)
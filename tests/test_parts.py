@@ -0,0 +1,196 @@
+"""Tests for size-bounded llms-full parts."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import (
+    FullText,
+    PageResult,
+    assemble_llms_output,
+    build_llms_output,
+)
+from llmstxt_standalone.parts import (
+    FullPartsWriter,
+    part_output,
+    parts_manifest_output,
+)
+from llmstxt_standalone.tokens import SizeUnit, estimate_tokens
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site_edge_cases", site_dir)
+    return site_dir
+
+
+@pytest.fixture
+def config():
+    config = load_config(FIXTURES / "mkdocs_edge_cases.yml")
+    # A missing page and a page listed in two sections
+    config.sections["深层文档"].extend(["missing.md", "index.md"])
+    return config
+
+
+def _split(config, site_dir: Path, out_dir: Path, max_size: int, **kwargs):
+    """Split the site into parts; also return the build the parts split."""
+    with FullPartsWriter(config, out_dir, max_size, **kwargs) as writer:
+        build_llms_output(config, site_dir, full_writers=[writer])
+        writer.commit()
+    return build_llms_output(config, site_dir), writer
+
+
+def test_part_paths():
+    assert part_output("llms-full.txt", 2) == "llms-full-002.txt"
+    assert part_output("llms/full.md", 12) == "llms/full-012.md"
+    assert parts_manifest_output("llms/full.md") == "llms/full-parts.json"
+
+
+def test_parts_reassemble_llms_full(config, site_dir: Path, tmp_path: Path):
+    """Test parts hold llms-full.txt's pages, in order, within the size limit."""
+    out_dir = tmp_path / "out"
+
+    build, writer = _split(config, site_dir, out_dir, max_size=300)
+
+    manifest = json.loads((out_dir / "llms-full-parts.json").read_text())
+    parts = manifest["parts"]
+    assert writer.count == len(parts) > 1
+    header = build.llms_full_txt.split("\n## ", 1)[0]
+    body = ""
+    for part in parts:
+        data = (out_dir / part["path"]).read_bytes()
+        assert len(data) == part["bytes"]
+        assert data.decode().startswith(header)
+        if len(part["pages"]) > 1:
+            assert len(data) <= 300
+        for page in part["pages"]:
+            block = data[page["offset"] : page["offset"] + page["length"]].decode()
+            assert block.startswith(f"## {page['title']}\n\n")
+            body += "\n" + block
+    assert header + body == build.llms_full_txt
+    # The page listed twice appears twice, under each section
+    index_sections = [
+        page["section"]
+        for part in parts
+        for page in part["pages"]
+        if page["md_path"] == "index.md"
+    ]
+    assert index_sections == [next(iter(config.sections)), "深层文档"]
+
+
+def test_parts_keep_oversized_page_whole(config, site_dir: Path, tmp_path: Path):
+    build, writer = _split(config, site_dir, tmp_path, max_size=1)
+
+    manifest = json.loads((tmp_path / "llms-full-parts.json").read_text())
+    assert all(len(part["pages"]) == 1 for part in manifest["parts"])
+    assert writer.count == build.llms_full_txt.count("\n## ")
+
+
+def test_parts_truncated_with_llms_full(config, site_dir: Path, tmp_path: Path):
+    """Test pages over max_full_tokens are left out of the parts as well."""
+    full, _ = _split(config, site_dir, tmp_path / "full", max_size=300)
+    config.token_budget_action = "truncate"
+    config.max_full_tokens = full.full_tokens // 2
+
+    build, _ = _split(config, site_dir, tmp_path, max_size=300)
+
+    manifest = json.loads((tmp_path / "llms-full-parts.json").read_text())
+    pages = [page for part in manifest["parts"] for page in part["pages"]]
+    assert 0 < len(pages) == build.llms_full_txt.count("\n## ")
+    assert len(pages) < full.llms_full_txt.count("\n## ")
+    assert any("Truncated llms-full.txt" in w for w in build.warnings)
+
+
+def test_parts_in_tokens(config, site_dir: Path, tmp_path: Path):
+    _split(config, site_dir, tmp_path, max_size=100, unit=SizeUnit.tokens)
+
+    manifest = json.loads((tmp_path / "llms-full-parts.json").read_text())
+    assert manifest["unit"] == "tokens"
+    for part in manifest["parts"]:
+        if len(part["pages"]) > 1:
+            text = (tmp_path / part["path"]).read_text(encoding="utf-8")
+            assert estimate_tokens(text) <= 100 + len(part["pages"])
+
+
+def test_parts_remove_stale_parts(config, site_dir: Path, tmp_path: Path):
+    _split(config, site_dir, tmp_path, max_size=1)
+    _, writer = _split(config, site_dir, tmp_path, max_size=10_000_000)
+
+    assert writer.count == 1
+    assert sorted(p.name for p in tmp_path.glob("llms-full-*.txt")) == [
+        "llms-full-001.txt"
+    ]
+
+
+def test_parts_keep_files_not_listed_as_parts(config, site_dir: Path, tmp_path: Path):
+    """Test a numbered file no manifest lists, e.g. a section file, is kept."""
+    section_file = tmp_path / "llms-full-2024.txt"
+    section_file.write_text("# Section 2024")
+    _split(config, site_dir, tmp_path, max_size=1)
+    _split(config, site_dir, tmp_path, max_size=10_000_000)
+
+    assert section_file.read_text() == "# Section 2024"
+
+
+def test_parts_dry_run(config, site_dir: Path, tmp_path: Path):
+    _, writer = _split(config, site_dir, tmp_path, max_size=300, dry_run=True)
+
+    assert writer.count > 1
+    assert list(tmp_path.glob("llms-full-*")) == []
+
+
+def test_parts_incomplete_build_has_no_manifest(config, tmp_path: Path):
+    with FullPartsWriter(config, tmp_path, 300):
+        pass
+
+    assert not (tmp_path / "llms-full-parts.json").exists()
+
+
+def test_parts_uncommitted_build_keeps_previous_parts(
+    config, site_dir: Path, tmp_path: Path
+):
+    """Test parts of a build that isn't committed never replace earlier ones."""
+    out_dir = tmp_path / "out"
+    _split(config, site_dir, out_dir, max_size=300)
+    before = {path.name: path.read_bytes() for path in out_dir.iterdir()}
+
+    with FullPartsWriter(config, out_dir, 1) as writer:
+        build_llms_output(config, site_dir, full_writers=[writer])
+
+    assert {path.name: path.read_bytes() for path in out_dir.iterdir()} == before
+
+
+def test_parts_hold_deduplicated_blocks(config, tmp_path: Path):
+    """Test parts get llms-full.txt's deduplicated text, not the raw pages."""
+    config.dedup = True
+    config.dedup_min_chars = 40
+    config.sections = {"Start": ["a.md"], "Guide": ["b.md"]}
+    footer = "Need help? Ask on the forum or open an issue on the tracker."
+
+    results = {
+        "a.md": PageResult("a.md", Path("a.html"), "A", f"Hi\n\n{footer}\n"),
+        "b.md": PageResult("b.md", Path("b.html"), "B", f"Run\n\n{footer}\n"),
+    }
+
+    with FullPartsWriter(config, tmp_path, 10_000) as writer:
+        full_text = FullText(config, [writer])
+        for result in results.values():
+            full_text.add(result)
+        writer.commit()
+
+    text = (tmp_path / "llms-full-001.txt").read_text(encoding="utf-8")
+    assert text == assemble_llms_output(config, results).llms_full_txt
+    assert text.count(footer) == 1
+
+
+def test_parts_reject_unsafe_full_output(config, tmp_path: Path):
+    config.full_output = "../llms-full.txt"
+
+    with pytest.raises(ValueError):
+        FullPartsWriter(config, tmp_path, 300)
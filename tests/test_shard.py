@@ -0,0 +1,99 @@
+"""Tests for sharded builds and merging."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import build_llms_output
+from llmstxt_standalone.shard import (
+    build_shard,
+    merge_bundles,
+    parse_shard,
+    read_bundle,
+    shard_page_paths,
+    write_bundle,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site_edge_cases", site_dir)
+    return site_dir
+
+
+@pytest.fixture
+def config():
+    config = load_config(FIXTURES / "mkdocs_edge_cases.yml")
+    # A missing page and a page listed in two sections
+    config.sections["深层文档"].extend(["missing.md", "index.md", "deep.md"])
+    return config
+
+
+def test_parse_shard():
+    assert parse_shard("1/1") == (1, 1)
+    assert parse_shard("3/4") == (3, 4)
+    for spec in ("0/4", "5/4", "1/0", "1", "a/b", "1/2/3"):
+        with pytest.raises(ValueError, match="K/N"):
+            parse_shard(spec)
+
+
+def test_shards_partition_pages(config):
+    shards = [shard_page_paths(config, k, 3) for k in (1, 2, 3)]
+    combined = [md_path for shard in shards for md_path in shard]
+
+    assert sorted(combined) == sorted(set(combined))
+    assert set(combined) == {p for pages in config.sections.values() for p in pages}
+
+
+@pytest.mark.parametrize("num_shards", [1, 2, 3, 7])
+def test_merge_matches_unsharded_build(config, site_dir: Path, num_shards: int):
+    expected = build_llms_output(config, site_dir)
+
+    bundles = [
+        build_shard(config, site_dir, k, num_shards) for k in range(num_shards, 0, -1)
+    ]
+    merged = merge_bundles(config, bundles)
+
+    assert merged == expected
+
+
+def test_bundle_roundtrip(config, site_dir: Path, tmp_path: Path):
+    bundle = build_shard(config, site_dir, 1, 2)
+    path = tmp_path / "bundle.json"
+
+    write_bundle(bundle, path)
+
+    assert read_bundle(path) == bundle
+
+
+def test_read_bundle_rejects_other_files(tmp_path: Path):
+    path = tmp_path / "bundle.json"
+    path.write_text('{"format": 99}', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid shard bundle"):
+        read_bundle(path)
+
+
+def test_merge_requires_every_shard(config, site_dir: Path):
+    bundles = [build_shard(config, site_dir, 1, 3), build_shard(config, site_dir, 3, 3)]
+
+    with pytest.raises(ValueError, match="exactly once"):
+        merge_bundles(config, bundles)
+
+
+def test_merge_rejects_different_config(config, site_dir: Path):
+    bundle = build_shard(config, site_dir, 1, 1)
+    config.site_name = "Changed"
+
+    with pytest.raises(ValueError, match="different config"):
+        merge_bundles(config, [bundle])
+
+
+def test_merge_rejects_no_bundles(config):
+    with pytest.raises(ValueError, match="No shard bundles"):
+        merge_bundles(config, [])
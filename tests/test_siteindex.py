@@ -0,0 +1,100 @@
+"""Tests for the site directory index."""
+
+import os
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import build_llms_output
+from llmstxt_standalone.siteindex import SiteIndex
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site"
+    (site_dir / "guide" / "install").mkdir(parents=True)
+    (site_dir / "index.html").write_text("<h1>Home</h1>")
+    (site_dir / "guide" / "install" / "index.html").write_text("<h1>Install</h1>")
+    return site_dir
+
+
+def _symlink(link: Path, target: Path) -> None:
+    try:
+        link.symlink_to(target, target_is_directory=target.is_dir())
+    except OSError:
+        pytest.skip("Cannot create symlink")
+
+
+def test_is_file(site_dir: Path):
+    index = SiteIndex(site_dir)
+
+    assert index.is_file(PurePosixPath("index.html"))
+    assert index.is_file(PurePosixPath("guide/install/index.html"))
+    assert not index.is_file(PurePosixPath("guide/install"))
+    assert not index.is_file(PurePosixPath("guide/missing/index.html"))
+    assert not index.is_file(PurePosixPath("index.html/index.html"))
+
+
+def test_file_size(site_dir: Path):
+    index = SiteIndex(site_dir)
+
+    assert index.file_size(PurePosixPath("index.html")) == len("<h1>Home</h1>")
+    assert index.file_size(PurePosixPath("guide/missing/index.html")) == 0
+    assert index.file_size(PurePosixPath("guide")) == 0
+
+
+def test_lists_each_directory_once(site_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    scanned: list[str] = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(str(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    index = SiteIndex(site_dir)
+    for _ in range(3):
+        index.is_file(PurePosixPath("guide/install/index.html"))
+        index.is_file(PurePosixPath("guide/other/index.html"))
+
+    assert len(scanned) == 3
+
+
+def test_symlink_inside_site_is_followed(site_dir: Path):
+    _symlink(site_dir / "latest", site_dir / "guide")
+
+    assert SiteIndex(site_dir).is_file(PurePosixPath("latest/install/index.html"))
+
+
+def test_symlink_outside_site_is_rejected(site_dir: Path, tmp_path: Path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "index.html").write_text("secret")
+    _symlink(site_dir / "escape", outside)
+    _symlink(site_dir / "leak.html", outside / "index.html")
+    index = SiteIndex(site_dir)
+
+    with pytest.raises(ValueError, match="HTML path resolves outside"):
+        index.is_file(PurePosixPath("escape/index.html"), "HTML path")
+    with pytest.raises(ValueError, match="resolves outside"):
+        index.is_file(PurePosixPath("leak.html"))
+
+
+def test_build_skips_page_behind_escaping_symlink(site_dir: Path, tmp_path: Path):
+    outside = tmp_path / "outside"
+    (outside / "install").mkdir(parents=True)
+    (outside / "install" / "index.html").write_text("<h1>Secret</h1>")
+    (site_dir / "index.html").unlink()
+    _symlink(site_dir / "install", outside / "install")
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+
+    build = build_llms_output(config, site_dir)
+
+    assert [reason for _, reason in build.skipped] == [
+        "HTML file not found",
+        f"HTML path resolves outside {site_dir.resolve()}: "
+        f"{site_dir / 'install' / 'index.html'}",
+    ]
@@ -0,0 +1,31 @@
+"""Tests for spilling worker results to files."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from llmstxt_standalone.spill import read_spilled, spill_text
+
+
+def test_spill_round_trip(tmp_path: Path):
+    first = spill_text("Première page\n", str(tmp_path))
+    second = spill_text("Second page\n", str(tmp_path))
+
+    # One file per result, so the page store can move it (see adopt)
+    assert first.path != second.path
+    assert Path(first.path).parent == tmp_path
+    assert Path(first.path).name.startswith(f"{os.getpid()}-")
+    assert first.offset == second.offset == 0
+    assert read_spilled(first) == "Première page\n"
+    assert read_spilled(second) == "Second page\n"
+
+
+def test_read_spilled_detects_corruption(tmp_path: Path):
+    handle = spill_text("Original\n", str(tmp_path))
+    with open(handle.path, "r+b") as file:
+        file.seek(handle.offset)
+        file.write(b"Tampered")
+
+    with pytest.raises(ValueError, match="Spilled result is corrupt"):
+        read_spilled(handle)
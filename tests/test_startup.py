@@ -0,0 +1,67 @@
+"""Import budget tests for CLI startup.
+
+Each command runs under ``python -X importtime`` and the imported modules are
+checked against a per-command budget of heavy dependencies it must not load.
+Module sets are used rather than wall-clock thresholds so the budget is stable
+across machines.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+CONVERSION_STACK = {"bs4", "markdownify", "mdformat", "soupsieve"}
+CONFIG_STACK = {"pydantic", "yaml"}
+INIT_STACK = {"ruamel"}
+
+
+def _imported_modules(args: list[str], cwd: Path) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "llmstxt_standalone", *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        # Run in-process even if a daemon is listening on this machine
+        env={**os.environ, "LLMSTXT_NO_DAEMON": "1"},
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        modules.add(name.split(".")[0])
+    assert modules, "no -X importtime output captured"
+    return modules
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    shutil.copy(FIXTURES / "mkdocs_nav_only.yml", tmp_path / "mkdocs.yml")
+    return tmp_path
+
+
+def test_version_imports_nothing_heavy(project: Path):
+    modules = _imported_modules(["--version"], project)
+    assert not modules & (CONVERSION_STACK | CONFIG_STACK | INIT_STACK)
+
+
+def test_validate_skips_conversion_stack(project: Path):
+    modules = _imported_modules(["validate", "--quiet"], project)
+    assert not modules & (CONVERSION_STACK | INIT_STACK)
+    assert modules >= CONFIG_STACK
+
+
+def test_init_skips_config_and_conversion_stack(project: Path):
+    modules = _imported_modules(["init", "--quiet"], project)
+    assert not modules & (CONVERSION_STACK | CONFIG_STACK)
+    assert modules >= INIT_STACK
@@ -0,0 +1,79 @@
+"""Tests for build tracing."""
+
+import json
+import shutil
+from pathlib import Path
+
+from llmstxt_standalone.config import load_config
+from llmstxt_standalone.generate import build_llms_output, write_markdown_files
+from llmstxt_standalone.trace import Tracer, maybe_span
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_nested_spans_inherit_args():
+    tracer = Tracer()
+    with tracer.span("page", md_path="index.md"), tracer.span("convert"):
+        pass
+
+    inner, outer = tracer.spans
+    assert (inner.name, outer.name) == ("convert", "page")
+    assert inner.args["md_path"] == "index.md"
+    assert inner.args["worker"] == outer.args["worker"]
+    assert outer.start_ns <= inner.start_ns <= inner.end_ns <= outer.end_ns
+
+
+def test_maybe_span_without_tracer_is_noop():
+    with maybe_span(None, "read", md_path="index.md"):
+        pass
+
+
+def test_span_args_can_be_added_by_the_block():
+    tracer = Tracer()
+    with tracer.span("load_config") as args:
+        args["config_cache_hits"] = 1
+
+    assert tracer.spans[0].args["config_cache_hits"] == 1
+
+
+def test_trace_events_format(tmp_path: Path):
+    tracer = Tracer()
+    with tracer.span("load_config"):
+        pass
+    trace_path = tmp_path / "trace.json"
+    tracer.write(trace_path)
+
+    data = json.loads(trace_path.read_text(encoding="utf-8"))
+    events = data["traceEvents"]
+    complete = [e for e in events if e["ph"] == "X"]
+    metadata = [e for e in events if e["ph"] == "M"]
+    assert [e["name"] for e in complete] == ["load_config"]
+    assert complete[0]["ts"] >= 0
+    assert complete[0]["dur"] >= 0
+    assert metadata[0]["name"] == "thread_name"
+
+
+def test_build_records_page_stage_spans(tmp_path: Path):
+    site_dir = tmp_path / "site"
+    shutil.copytree(FIXTURES / "site", site_dir)
+    config = load_config(FIXTURES / "mkdocs_with_llmstxt.yml")
+    tracer = Tracer()
+
+    build = build_llms_output(config, site_dir, tracer=tracer)
+    write_markdown_files(
+        build.pages, site_dir, config.use_directory_urls, tracer=tracer
+    )
+
+    stages = {(s.name, s.args.get("md_path")) for s in tracer.spans}
+    for md_path in ("index.md", "install.md"):
+        for stage in (
+            "page",
+            "read",
+            "convert_page",
+            "parse",
+            "convert",
+            "format",
+            "write",
+        ):
+            assert (stage, md_path) in stages
+    assert ("assemble", None) in stages